@@ -0,0 +1,12 @@
+"""
+Benchmarks do DeadCodeDetector - Corpus sintético, medições e comparação com a linha de base
+
+Uso:
+    python -m benchmarks run [--sizes 1000 10000] [--save-baseline]
+    python -m benchmarks compare [--threshold 0.25]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
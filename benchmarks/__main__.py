@@ -0,0 +1,9 @@
+"""
+Entry point para ``python -m benchmarks``
+"""
+
+import sys
+
+from .runner import main
+
+sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+Benchmark de memória dos registros de problemas: dataclass comum, com slots e IssueBatch
+
+Uso: python benchmarks/bench_records.py [problemas]
+"""
+
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadcode_detector.analyzer import DeadCodeIssue, IssueBatch
+
+
+@dataclass
+class PlainIssue:
+    """Leiaute anterior de DeadCodeIssue, com ``__dict__`` por instância"""
+    type: str
+    line: int
+    description: str
+    severity: str = "warning"
+    code: str = ""
+    end_line: int = 0
+
+
+TYPES = ('unused_variable', 'unused_function', 'code_after_return', 'unreachable_code')
+PATHS = [f"pacote/modulo_{n}.py" for n in range(1000)]
+
+
+def descriptions(count: int):
+    return [f"Variável 'nome_{n}' declarada mas nunca utilizada" for n in range(count)]
+
+
+def build_objects(cls, texts):
+    return [(PATHS[n % len(PATHS)], cls(type=TYPES[n % 4], line=n % 5000 + 1, description=text))
+            for n, text in enumerate(texts)]
+
+
+def build_batch(texts):
+    batch = IssueBatch()
+    for n, text in enumerate(texts):
+        batch.append(PATHS[n % len(PATHS)],
+                     DeadCodeIssue(type=TYPES[n % 4], line=n % 5000 + 1, description=text))
+    return batch
+
+
+def retained(build, texts) -> int:
+    """Memória retida pela estrutura, sem contar descrições e caminhos, comuns às três"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build(texts)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    texts = descriptions(count)
+
+    rows = [
+        ("dataclass comum", retained(lambda t: build_objects(PlainIssue, t), texts)),
+        ("dataclass com slots", retained(lambda t: build_objects(DeadCodeIssue, t), texts)),
+        ("IssueBatch", retained(build_batch, texts)),
+    ]
+
+    print(f"problemas: {count}")
+    for name, size in rows:
+        print(f"{name:<20} {size / 1024 / 1024:8.2f} MiB  {size / count:6.1f} bytes/problema")
+
+
+if __name__ == '__main__':
+    main()
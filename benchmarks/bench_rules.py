@@ -0,0 +1,43 @@
+"""
+Benchmark do custo de cada regra: tempo da análise conforme as regras habilitadas
+
+Uso: python benchmarks/bench_rules.py [linhas]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.corpus import generate
+from benchmarks.runner import best_of, spec_for
+from deadcode_detector.analyzer import DeadCodeAnalyzer
+from deadcode_detector.rules import REGISTRY
+
+
+def measure(source: str, rules) -> float:
+    return best_of(lambda: DeadCodeAnalyzer(rules=rules).analyze(source), 3)
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    source = generate(spec_for(size))
+    names = list(REGISTRY)
+
+    # Sem regras resta só a construção da AST, o piso de qualquer seleção
+    floor = measure(source, ())
+    print(f"linhas: {size}")
+    print(f"{'nenhuma regra (só a AST)':<44} {floor * 1000:9.1f} ms")
+
+    print("\numa regra por vez:")
+    for name in names:
+        print(f"  {name:<42} {measure(source, [name]) * 1000:9.1f} ms")
+
+    print("\nregras acumuladas:")
+    for count in range(1, len(names) + 1):
+        label = f"{count} regra(s), até {names[count - 1]}"
+        print(f"  {label:<42} {measure(source, names[:count]) * 1000:9.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark de memória das tabelas de símbolos em um arquivo de 100 mil linhas
+
+Uso: python benchmarks/bench_symbols.py [linhas]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadcode_detector.parser import Parser
+
+
+FUNCTION_TEMPLATE = '''
+def funcao_{n}(valor_{n}, limite):
+    total = 0
+    parcial_{n} = [item * 2 for item in range(limite)]
+    for indice in range(valor_{n}):
+        total += indice
+    nao_usada_{n} = total
+    return total + len(parcial_{n})
+'''
+
+
+def generate_source(lines: int) -> str:
+    chunks = []
+    produced = 0
+    n = 0
+    while produced < lines:
+        chunk = FUNCTION_TEMPLATE.format(n=n)
+        chunks.append(chunk)
+        produced += chunk.count('\n')
+        n += 1
+    chunks.append("\nresultado = funcao_0(1, 2)\n")
+    return ''.join(chunks)
+
+
+def measure(source: str):
+    """Mede tempo (sem tracemalloc) e memória da construção das tabelas de símbolos"""
+    parser = Parser()
+    parser.build_tree(source)
+    start = time.perf_counter()
+    parser._analyze_structure()
+    parser.resolve_usage()
+    elapsed = time.perf_counter() - start
+
+    parser = Parser()
+    parser.build_tree(source)
+    tracemalloc.start()
+    parser._analyze_structure()
+    parser.resolve_usage()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    unused = len(parser.get_unused_variables())
+    return elapsed, current, peak, unused
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    source = generate_source(lines)
+    elapsed, current, peak, unused = measure(source)
+
+    print(f"linhas:              {source.count(chr(10))}")
+    print(f"tempo:               {elapsed * 1000:.1f} ms")
+    print(f"memória retida:      {current / 1024 / 1024:.2f} MiB")
+    print(f"pico de memória:     {peak / 1024 / 1024:.2f} MiB")
+    print(f"variáveis não usadas: {unused}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Gerador de Corpus - Código Python sintético e determinístico para benchmarks
+"""
+
+import random
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class CorpusSpec:
+    """
+    Forma do código gerado
+
+    ``lines`` é o tamanho aproximado do arquivo; as ``functions`` funções
+    dividem esse total entre si. Cada função tem blocos aninhados até
+    ``depth`` níveis, ``returns`` pontos de retorno (o último seguido de
+    código morto) e cadeias ``if/elif`` com ``ladder`` ramos. A mesma
+    especificação com a mesma ``seed`` gera sempre o mesmo texto.
+    """
+    lines: int = 1000
+    functions: int = 20
+    depth: int = 3
+    returns: int = 2
+    ladder: int = 4
+    seed: int = 0
+
+
+def generate(spec: CorpusSpec) -> str:
+    """Gera o código de um módulo que segue ``spec``"""
+    rng = random.Random(spec.seed)
+    functions = max(1, spec.functions)
+    overhead = 6 + functions + (functions + 1) // 2
+    budget = max(8, (spec.lines - overhead) // functions)
+    out: List[str] = ["import os", "import sys", "from collections import OrderedDict", ""]
+
+    for n in range(functions):
+        out.extend(_function(rng, n, budget, spec))
+        out.append("")
+
+    called = range(0, functions, 2)
+    out.extend(f"resultado_{n} = funcao_{n}(1, 2)" for n in called)
+    out.append("")
+    return "\n".join(out)
+
+
+def _function(rng: random.Random, n: int, budget: int, spec: CorpusSpec) -> List[str]:
+    lines = [f"def funcao_{n}(valor, limite):",
+             "    total = 0",
+             f"    nao_usada_{n} = valor * 2"]
+    returns = max(1, spec.returns)
+    chunk = max(2, (budget - len(lines)) // returns - 2)
+
+    for r in range(returns):
+        target = len(lines) + chunk
+        while len(lines) < target:
+            block = _block(rng, 1, spec, len(lines))
+            if len(lines) + len(block) > target + 1:
+                block = _block_simple(1, len(lines))
+            lines.extend(block)
+        if r < returns - 1:
+            lines.append(f"    if valor == {r}:")
+            lines.append(f"        return total + {r}")
+        else:
+            lines.append("    return total")
+            lines.append("    print('depois do return')")
+    return lines
+
+
+def _block(rng: random.Random, level: int, spec: CorpusSpec, position: int) -> List[str]:
+    indent = "    " * level
+    kind = rng.randrange(5)
+
+    if kind == 0 and spec.ladder > 0:
+        lines = [f"{indent}if valor < {position}:"]
+        lines.append(f"{indent}    total += {position}")
+        for step in range(1, spec.ladder):
+            lines.append(f"{indent}elif valor == {position + step}:")
+            lines.append(f"{indent}    total -= {step}")
+        lines.append(f"{indent}else:")
+        lines.append(f"{indent}    total += 1")
+        return lines
+
+    if kind == 1 and level < spec.depth:
+        lines = [f"{indent}for indice_{level} in range(limite):"]
+        lines.extend(_block(rng, level + 1, spec, position + 1))
+        return lines
+
+    if kind == 2 and level < spec.depth:
+        lines = [f"{indent}while total < limite:"]
+        lines.extend(_block(rng, level + 1, spec, position + 1))
+        lines.append(f"{indent}    break")
+        return lines
+
+    if kind == 3:
+        return [f"{indent}if False:",
+                f"{indent}    total = -1"]
+
+    return _block_simple(level, position)
+
+
+def _block_simple(level: int, position: int) -> List[str]:
+    indent = "    " * level
+    return [f"{indent}parcial = [item * {position} for item in range(limite) if item % 3]",
+            f"{indent}total += len(parcial)"]
@@ -0,0 +1,185 @@
+"""
+Executor de Benchmarks - Mede o analisador por etapa e compara com a linha de base
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import time
+from contextlib import redirect_stdout
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from deadcode_detector.analyzer import DeadCodeAnalyzer
+from deadcode_detector.lexer import Lexer
+from deadcode_detector.parser import Parser
+from deadcode_detector.reporter import Reporter
+
+from .corpus import CorpusSpec, generate
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+RESULTS_FORMAT = 1
+DEFAULT_SIZES = (1000, 10000, 50000)
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.25
+LINES_PER_FUNCTION = 50
+MIN_SAMPLE_TIME = 0.05
+
+
+def spec_for(size: int) -> CorpusSpec:
+    return CorpusSpec(lines=size, functions=max(1, size // LINES_PER_FUNCTION))
+
+
+def targets(source: str) -> Dict[str, Callable[[], object]]:
+    """Etapas medidas; cada uma usa instâncias novas para não aproveitar estado"""
+    issues = DeadCodeAnalyzer().analyze(source)
+
+    def render():
+        with redirect_stdout(io.StringIO()):
+            Reporter(use_colors=False).print_report(issues, "corpus.py")
+
+    return {
+        'lexer': lambda: Lexer().tokenize(source),
+        'parser': lambda: Parser().parse(source),
+        'analyzer': lambda: DeadCodeAnalyzer().analyze(source),
+        'reporter': render,
+    }
+
+
+def best_of(function: Callable[[], object], repeat: int) -> float:
+    """
+    Menor tempo por chamada entre ``repeat`` amostras, o menos afetado por ruído
+
+    Como no ``timeit``, cada amostra repete a chamada até durar ao menos
+    ``MIN_SAMPLE_TIME``, para que etapas muito rápidas não fiquem abaixo da
+    resolução do relógio.
+    """
+    loops = 1
+    while True:
+        elapsed = _sample(function, loops)
+        if elapsed >= MIN_SAMPLE_TIME:
+            break
+        loops *= 10 if elapsed < MIN_SAMPLE_TIME / 10 else 2
+
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        best = min(best, _sample(function, loops) / loops)
+    return best
+
+
+def _sample(function: Callable[[], object], loops: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loops):
+        function()
+    return time.perf_counter() - start
+
+
+def run(sizes: Iterable[int] = DEFAULT_SIZES, repeat: int = DEFAULT_REPEAT,
+        only: Optional[List[str]] = None) -> Dict:
+    """Mede cada etapa em cada tamanho; as chaves são ``etapa/linhas``"""
+    results = {}
+    for size in sizes:
+        source = generate(spec_for(size))
+        for name, function in targets(source).items():
+            if only and name not in only:
+                continue
+            results[f"{name}/{size}"] = best_of(function, repeat)
+    return {
+        'format': RESULTS_FORMAT,
+        'python': platform.python_version(),
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def compare(baseline: Dict, current: Dict,
+            threshold: float = DEFAULT_THRESHOLD) -> List[Tuple[str, float, float, bool]]:
+    """
+    Compara as medições comuns aos dois resultados
+
+    Devolve (nome, base, atual, regressão) para cada medição presente em
+    ambos; é regressão quando o tempo atual passa da base por mais que
+    ``threshold`` (0.25 = 25% mais lento).
+    """
+    rows = []
+    for name, base in baseline['results'].items():
+        value = current['results'].get(name)
+        if value is None:
+            continue
+        rows.append((name, base, value, value > base * (1 + threshold)))
+    return rows
+
+
+def load(path: str) -> Dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get('format') != RESULTS_FORMAT:
+        raise ValueError(f"formato de resultados não suportado em {path}")
+    return data
+
+
+def save(data: Dict, path: str):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def print_results(data: Dict):
+    for name, seconds in data['results'].items():
+        print(f"{name:<20} {seconds * 1000:10.2f} ms")
+
+
+def print_comparison(rows: List[Tuple[str, float, float, bool]]):
+    for name, base, value, regressed in rows:
+        change = (value / base - 1) * 100 if base else 0.0
+        marker = "REGRESSÃO" if regressed else ""
+        print(f"{name:<20} {base * 1000:10.2f} ms {value * 1000:10.2f} ms {change:+7.1f}%  {marker}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmarks do DeadCodeDetector em um corpus sintético",
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Mede as etapas e mostra os tempos')
+    compare_parser = commands.add_parser('compare', help='Compara com a linha de base')
+    for sub in (run_parser, compare_parser):
+        sub.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                         help='Tamanhos do corpus, em linhas')
+        sub.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                         help='Execuções por medição (vale a menor)')
+        sub.add_argument('--only', nargs='+', help='Etapas a medir (lexer, parser, analyzer, reporter)')
+        sub.add_argument('--baseline', default=BASELINE_PATH, help='Arquivo JSON da linha de base')
+
+    run_parser.add_argument('--output', '-o', help='Salva os resultados em JSON')
+    run_parser.add_argument('--save-baseline', action='store_true',
+                            help='Grava os resultados como nova linha de base')
+    compare_parser.add_argument('--results', help='Resultados já medidos (JSON) em vez de medir agora')
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                                help=f'Aumento relativo tolerado (padrão: {DEFAULT_THRESHOLD})')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        data = run(args.sizes, args.repeat, args.only)
+        print_results(data)
+        if args.output:
+            save(data, args.output)
+        if args.save_baseline:
+            save(data, args.baseline)
+            print(f"Linha de base gravada em {args.baseline}")
+        return 0
+
+    baseline = load(args.baseline)
+    current = load(args.results) if args.results else run(args.sizes, args.repeat, args.only)
+    rows = compare(baseline, current, args.threshold)
+    print_comparison(rows)
+    regressions = [row for row in rows if row[3]]
+    if regressions:
+        print(f"{len(regressions)} regressão(ões) acima de {args.threshold:.0%}")
+        return 1
+    return 0
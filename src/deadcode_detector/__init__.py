@@ -5,7 +5,27 @@ DeadCodeDetector - Um analisador de código morto para Python
 __version__ = "1.0.0"
 __author__ = "Seu Nome"
 
-from .analyzer import DeadCodeAnalyzer
-from .reporter import Reporter
+# Aqui, e não em cache.py, para que a CLI monte a ajuda sem importar o cache
+DEFAULT_CACHE_DIR = ".deadcode_cache"
 
-__all__ = ["DeadCodeAnalyzer", "Reporter"] 
\ No newline at end of file
+__all__ = ["DeadCodeAnalyzer", "Reporter"]
+
+_LAZY = {
+    "DeadCodeAnalyzer": ".analyzer",
+    "Reporter": ".reporter",
+}
+
+
+def __getattr__(name):
+    """Importa os nomes públicos no primeiro acesso (PEP 562)"""
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY)) 
\ No newline at end of file
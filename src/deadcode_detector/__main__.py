@@ -2,7 +2,7 @@
 Entry point para execução do módulo deadcode_detector
 """
 
-from .main import main
+from .cli import main
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
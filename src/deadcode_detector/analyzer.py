@@ -3,11 +3,44 @@ Analisador Semântico - Detecção de código morto
 """
 
 import ast
-from typing import List, Dict, Any, Set
-from dataclasses import dataclass
+from array import array
+from collections import Counter
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple
+from dataclasses import dataclass, replace
 from .parser import Parser, FunctionInfo, VariableInfo
+from .scopes import CLASS, CLOSED, MODULE, OPEN_ENCLOSING_CLASS, OPEN_MODULE
+from .engine import TraversalEngine
+from .profiling import NULL_PROFILER
+from .records import slotted
+from .source import LineIndex, Text
+from .rules import REGISTRY, required_rules, select_rules
+from .cfg import CFGBuilder, ControlFlowGraph
+from .incremental import (
+    AnalysisState, UnitState, detach_units, split_units, unit_digest,
+)
 
 
+RULES = tuple(REGISTRY)
+
+# Problemas da própria análise, que não são regras de código morto
+DIAGNOSTICS = ('parse_error', 'memory_limit')
+
+# Pico de memória medido com tracemalloc ficou entre 75 e 150 bytes por
+# caractere do fonte (AST, tabelas de símbolos e grafos); a estimativa usa
+# uma margem acima disso
+MEMORY_PER_SOURCE_CHAR = 160
+
+TERMINATORS = {
+    ast.Return: 'return',
+    ast.Raise: 'raise',
+    ast.Break: 'break',
+    ast.Continue: 'continue',
+}
+
+BLOCK_FIELDS = ('body', 'orelse', 'finalbody')
+
+
+@slotted
 @dataclass
 class DeadCodeIssue:
     type: str
@@ -15,6 +48,102 @@ class DeadCodeIssue:
     description: str
     severity: str = "warning"
     code: str = ""
+    end_line: int = 0
+    column: int = 0  # em bytes UTF-8, como o col_offset do ast
+
+
+class IssueBatch:
+    """
+    Problemas de vários arquivos em colunas paralelas
+    
+    Guarda arquivo, linha, linha final, coluna, tipo e severidade de cada problema
+    em ``array`` de inteiros; tipos e severidades viram códigos pequenos
+    (índices em ``type_names``/``severity_names``). Só a descrição continua
+    como string, e o campo ``code``, quase sempre vazio, fica em um
+    dicionário esparso. Os ``DeadCodeIssue`` são recriados sob demanda.
+    """
+    
+    __slots__ = ('files', 'file_index', 'lines', 'end_lines', 'columns', 'types', 'severities',
+                 'descriptions', 'codes', 'type_names', 'severity_names',
+                 '_file_ids', '_type_ids', '_severity_ids')
+    
+    def __init__(self):
+        self.files: List[str] = []
+        self.file_index = array('I')
+        self.lines = array('i')
+        self.end_lines = array('i')
+        self.columns = array('i')
+        self.types = array('B')
+        self.severities = array('B')
+        self.descriptions: List[str] = []
+        self.codes: Dict[int, str] = {}
+        self.type_names: List[str] = list(RULES) + list(DIAGNOSTICS)
+        self.severity_names: List[str] = ['warning', 'error']
+        self._file_ids: Dict[str, int] = {}
+        self._type_ids = {name: code for code, name in enumerate(self.type_names)}
+        self._severity_ids = {name: code for code, name in enumerate(self.severity_names)}
+    
+    def add_file(self, file_path: str) -> int:
+        """Registra um arquivo, mesmo sem problemas, e devolve seu índice"""
+        index = self._file_ids.get(file_path)
+        if index is None:
+            index = self._file_ids[file_path] = len(self.files)
+            self.files.append(file_path)
+        return index
+    
+    def append(self, file_path: str, issue: DeadCodeIssue):
+        self.file_index.append(self.add_file(file_path))
+        self.lines.append(issue.line)
+        self.end_lines.append(issue.end_line)
+        self.columns.append(issue.column)
+        self.types.append(_code(issue.type, self.type_names, self._type_ids))
+        self.severities.append(_code(issue.severity, self.severity_names, self._severity_ids))
+        if issue.code:
+            self.codes[len(self.descriptions)] = issue.code
+        self.descriptions.append(issue.description)
+    
+    def extend(self, file_path: str, issues: List[DeadCodeIssue]):
+        self.add_file(file_path)
+        for issue in issues:
+            self.append(file_path, issue)
+    
+    def __len__(self) -> int:
+        return len(self.descriptions)
+    
+    def issue(self, position: int) -> DeadCodeIssue:
+        return DeadCodeIssue(
+            type=self.type_names[self.types[position]],
+            line=self.lines[position],
+            description=self.descriptions[position],
+            severity=self.severity_names[self.severities[position]],
+            code=self.codes.get(position, ""),
+            end_line=self.end_lines[position],
+            column=self.columns[position],
+        )
+    
+    def __iter__(self) -> Iterator[Tuple[str, DeadCodeIssue]]:
+        files = self.files
+        for position, index in enumerate(self.file_index):
+            yield files[index], self.issue(position)
+    
+    def count_by_type(self) -> Dict[str, int]:
+        counts = Counter(self.types)
+        return {self.type_names[code]: count for code, count in sorted(counts.items())}
+    
+    def to_results(self) -> Dict[str, List[DeadCodeIssue]]:
+        """Converte para o formato de ``analyze_files``: arquivo -> lista de problemas"""
+        results: Dict[str, List[DeadCodeIssue]] = {file_path: [] for file_path in self.files}
+        for file_path, issue in self:
+            results[file_path].append(issue)
+        return results
+
+
+def _code(name: str, names: List[str], ids: Dict[str, int]) -> int:
+    code = ids.get(name)
+    if code is None:
+        code = ids[name] = len(names)
+        names.append(name)
+    return code
 
 
 class DeadCodeAnalyzer:
@@ -29,181 +158,478 @@ class DeadCodeAnalyzer:
     - Imports não utilizados
     """
     
-    def __init__(self):
+    def __init__(self, profiler=None, max_memory: Optional[int] = None,
+                 rules: Optional[Iterable[str]] = None):
         self.parser = Parser()
+        self.profiler = profiler or NULL_PROFILER
+        self.max_memory = max_memory
+        self.rules = select_rules(rules)
         self.issues: List[DeadCodeIssue] = []
         self.reachable_lines: Set[int] = set()
         self.unreachable_lines: Set[int] = set()
+        self._pending_false_conditions: List[DeadCodeIssue] = []
+        self._pending_after_return: List[DeadCodeIssue] = []
+        self._regions: List[Tuple[int, int]] = []
+        self.graphs: List[ControlFlowGraph] = []
+        self.state: Optional[AnalysisState] = None
         
-    def analyze(self, source_code: str) -> List[DeadCodeIssue]:
+        self._engine = TraversalEngine(self.profiler)
+        self._handlers = self._register_handlers(self._engine)
+    
+    def register_collector(self, collector):
+        """Inclui um coletor extra (com ``register_handlers``) na travessia única"""
+        collector.register_handlers(self._engine)
+        
+    def analyze(self, source_code: Text) -> List[DeadCodeIssue]:
         """
         Analisa o código fonte em busca de código morto
         
         Args:
-            source_code: Código Python como string
+            source_code: Código Python como string ou bytes (veja ``source.load_source``)
             
         Returns:
             Lista de problemas encontrados
         """
-        self.issues = []
-        self.reachable_lines.clear()
-        self.unreachable_lines.clear()
+        self._reset()
+        if self._over_budget(source_code):
+            self.issues.append(self._memory_limit(source_code))
+            return self.issues
         
         try:
-            tree = self.parser.parse(source_code)
+            self._prepare(source_code)
+            self._collect_issues()
             
-            self._analyze_control_flow(tree, source_code)
+        except Exception as e:
+            self._report_parse_error(e)
+        
+        return self.issues
+    
+    def analyze_iter(self, source_code: Text) -> Iterator[DeadCodeIssue]:
+        """
+        Analisa o código fonte devolvendo os problemas à medida que surgem
+        
+        Produz os mesmos problemas, na mesma ordem, que ``analyze``, mas
+        sem acumulá-los em ``self.issues``: cada detector entrega seus
+        resultados assim que a travessia termina.
+        
+        Args:
+            source_code: Código Python como string ou bytes (veja ``source.load_source``)
             
-            self._detect_unused_functions()
-            self._detect_unused_variables()
-            self._detect_unused_imports()
-            self._detect_always_false_conditions(tree)
-            self._detect_code_after_return(tree, source_code)
+        Yields:
+            Problemas encontrados
+        """
+        self._reset()
+        if self._over_budget(source_code):
+            yield self._memory_limit(source_code)
+            return
+        
+        try:
+            self._prepare(source_code)
+        except Exception as e:
+            yield self._parse_error(e)
+            return
+        
+        yield from self._iter_issues()
+    
+    def _prepare(self, source_code: Text):
+        """Constrói a AST, faz a travessia única e resolve usos e grafos"""
+        profiler = self.profiler
+        with profiler.phase('parse'):
+            tree = self.parser.build_tree(source_code)
+        with profiler.phase('traversal'):
+            self._engine.run(tree)
+        with profiler.phase('resolve_usage'):
+            self.parser.resolve_usage()
+        with profiler.phase('control_flow'):
+            self._collect_graph_results(self.graphs)
+    
+    def analyze_incremental(self, source_code: Text,
+                            state: Optional[AnalysisState] = None) -> List[DeadCodeIssue]:
+        """
+        Reanalisa o código reaproveitando o estado de uma análise anterior
+        
+        Funções de nível de módulo e métodos de classes cujo trecho de código
+        não mudou (comparado por hash) não são percorridos de novo; apenas as
+        unidades novas ou alteradas e o restante do módulo, se mudou, são
+        reanalisados. As contagens de uso de nomes são atualizadas pela
+        diferença entre unidades removidas e adicionadas. O novo estado fica
+        em ``self.state``. O resultado é o mesmo de ``analyze``.
+        
+        Args:
+            source_code: Nova versão do código Python
+            state: Estado devolvido por uma chamada anterior (ou None)
             
+        Returns:
+            Lista de problemas encontrados
+        """
+        self._reset()
+        if self._over_budget(source_code):
+            self.issues.append(self._memory_limit(source_code))
+            return self.issues
+        
+        try:
+            with self.profiler.phase('parse'):
+                tree = self.parser.build_tree(source_code)
         except Exception as e:
-            self.issues.append(DeadCodeIssue(
-                type="parse_error",
-                line=0,
-                description=f"Erro ao analisar código: {str(e)}",
-                severity="error"
-            ))
+            self._report_parse_error(e)
+            return self.issues
+        
+        constants = self.parser.evaluator.constants
+        if state is not None and state.constants != constants:
+            # Unidades inalteradas podem depender das constantes do módulo
+            state = None
+        lines = LineIndex(source_code)
+        available = {digest: list(units) for digest, units in state.units.items()} if state else {}
+        loads = Counter(state.loads) if state else Counter()
+        reanalyzed = 0
+        placed: List[Tuple[int, UnitState, int]] = []
+        classes = {id(statement.body): statement.lineno for statement in tree.body
+                   if isinstance(statement, ast.ClassDef)}
         
+        units = split_units(tree)
+        for node, body, _ in units:
+            digest = unit_digest(lines, node)
+            class_line = classes.get(id(body), OPEN_MODULE)
+            candidates = available.get(digest)
+            if candidates:
+                unit = candidates.pop()
+            else:
+                unit = self._analyze_unit(node, node.lineno, digest, in_class=body is not tree.body)
+                loads.update(unit.loads)
+                reanalyzed += 1
+            placed.append((node.lineno, unit, class_line))
+        
+        for stale_units in available.values():
+            for unit in stale_units:
+                loads.subtract(unit.loads)
+        
+        remainder_digest = detach_units(lines, units)
+        if state is not None and state.remainder.digest == remainder_digest:
+            remainder = state.remainder
+        else:
+            if state is not None:
+                loads.subtract(state.remainder.loads)
+            remainder = self._analyze_unit(tree, 0, remainder_digest)
+            loads.update(remainder.loads)
+            reanalyzed += 1
+        placed.append((0, remainder, OPEN_MODULE))
+        loads = +loads
+        
+        new_units: Dict[str, List[UnitState]] = {}
+        for _, unit, _ in placed[:-1]:
+            new_units.setdefault(unit.digest, []).append(unit)
+        self.state = AnalysisState(new_units, remainder, loads, reanalyzed, constants)
+        
+        with self.profiler.phase('merge_units'):
+            self._merge_units(placed, loads)
+        self._collect_issues()
         return self.issues
     
-    def _analyze_control_flow(self, tree: ast.AST, source_code: str):
-        """Analisa o fluxo de controle do código"""
-        lines = source_code.split('\n')
-        
-        for node in ast.walk(tree):
-            if hasattr(node, 'lineno'):
-                line_num = node.lineno
-                
-                if isinstance(node, (ast.Module, ast.FunctionDef, ast.ClassDef)):
-                    self.reachable_lines.add(line_num)
-                
-                if isinstance(node, ast.If):
-                    self._analyze_if_flow(node, lines)
-                elif isinstance(node, ast.Return):
-                    self._analyze_return_flow(node, lines)
-    
-    def _analyze_if_flow(self, node: ast.If, lines: List[str]):
-        """Analisa fluxo de controle em declarações if"""
-        if_line = node.lineno
-        
-        if self._is_always_false(node.test):
-            for child in ast.walk(node):
-                if hasattr(child, 'lineno') and child.lineno > if_line:
-                    self.unreachable_lines.add(child.lineno)
-        else:
-            for child in ast.walk(node):
-                if hasattr(child, 'lineno'):
-                    self.reachable_lines.add(child.lineno)
+    def _reset(self):
+        self.issues = []
+        self.reachable_lines.clear()
+        self.unreachable_lines.clear()
+        self._pending_false_conditions = []
+        self._pending_after_return = []
+        self._regions = []
+        self.graphs = []
+    
+    def _report_parse_error(self, error: Exception):
+        self.issues.append(self._parse_error(error))
+    
+    def _parse_error(self, error: Exception) -> DeadCodeIssue:
+        # SyntaxError (ou o ValueError do parser que o encadeia) traz a
+        # posição, com offset em caracteres a partir de 1; MemoryError e afins não
+        cause = error if isinstance(error, SyntaxError) else error.__cause__
+        line = getattr(cause, 'lineno', None) or 0
+        offset = getattr(cause, 'offset', None) or 0
+        text = getattr(cause, 'text', None) or ''
+        return DeadCodeIssue(
+            type="parse_error",
+            line=line,
+            description=f"Erro ao analisar código: {str(error)}",
+            severity="error",
+            column=_utf8_length(text[:max(offset - 1, 0)]) if line else 0,
+        )
+    
+    def _over_budget(self, source_code: Text) -> bool:
+        return self.max_memory is not None and estimate_memory(source_code) > self.max_memory
+    
+    def _memory_limit(self, source_code: Text) -> DeadCodeIssue:
+        estimate = estimate_memory(source_code) / (1024 * 1024)
+        budget = self.max_memory / (1024 * 1024)
+        return DeadCodeIssue(
+            type="memory_limit",
+            line=0,
+            description=(f"Arquivo não analisado: a análise usaria cerca de {estimate:.1f} MiB, "
+                         f"acima do limite de {budget:.1f} MiB"),
+        )
+    
+    def _analyze_unit(self, node: ast.AST, base: int, digest: str,
+                      in_class: bool = False) -> UnitState:
+        """Percorre uma unidade isolada e guarda o resultado com linhas relativas"""
+        self.parser.reset()
+        self._reset()
+        with self.profiler.phase('traversal'):
+            self._engine.run(node)
+        if not isinstance(node, ast.Module):
+            if 'parser._analyze_module' in self._handlers:
+                self.parser.build_scopes(node, (MODULE, CLASS) if in_class else (MODULE,))
+            if 'analyzer._visit_module' in self._handlers:
+                self.graphs = self._cfg_builder().build_function(node)
+        self._collect_graph_results(self.graphs)
+        
+        parser = self.parser
+        unused, pending, escapes, bindings = parser.scope_summary()
+        return UnitState(
+            digest=digest,
+            functions=[(name, line - base) for name, line in parser.function_entries()],
+            variables=[(name, line - base) for name, line in unused],
+            open_variables=[(key, name, line - base) for key, name, line in pending],
+            escapes=escapes,
+            bindings=bindings,
+            imports=[(line - base, col, name) for line, col, name in parser.import_entries],
+            loads=Counter(parser.name_loads),
+            issues=[_shift(issue, -base) for issue in
+                    self._pending_false_conditions + self._pending_after_return],
+            regions=[(start - base, end - base) for start, end in self._regions],
+            reachable=sorted(line - base for line in self.reachable_lines),
+        )
+    
+    def _merge_units(self, placed: List[Tuple[int, UnitState, int]], loads: Counter):
+        """Combina as unidades, já posicionadas, no estado do parser e do analisador"""
+        parser = self.parser
+        parser.reset()
+        self._reset()
+        
+        unused: List[Tuple[str, int]] = []
+        pending: List[Tuple[int, str, int]] = []
+        bindings: Dict[int, Set[str]] = {}
+        
+        for base, unit, class_line in placed:
+            for name, line in unit.functions:
+                parser.define_function(name, line + base)
+            unused.extend((name, line + base) for name, line in unit.variables)
+            for key, name, line in unit.open_variables:
+                pending.append((class_line if key == OPEN_ENCLOSING_CLASS else key, name, line + base))
+            for key, names in unit.bindings.items():
+                bindings.setdefault(class_line if key == OPEN_ENCLOSING_CLASS else key, set()).update(names)
+            for line, col, name in unit.imports:
+                parser.import_entries.append((line + base, col, name))
+            for issue in unit.issues:
+                if issue.type == "always_false_condition":
+                    self._pending_false_conditions.append(_shift(issue, base))
+                else:
+                    self._pending_after_return.append(_shift(issue, base))
+            for start, end in unit.regions:
+                self._regions.append((start + base, end + base))
+                self.unreachable_lines.update(range(start + base, end + base + 1))
+            self.reachable_lines.update(line + base for line in unit.reachable)
+        
+        used: Dict[int, Set[str]] = {}
+        for _, unit, class_line in placed:
+            for key, names in unit.escapes.items():
+                if key != OPEN_ENCLOSING_CLASS:
+                    used.setdefault(key, set()).update(names)
+                    continue
+                bound = bindings.get(class_line, ())
+                for name in names:
+                    used.setdefault(class_line if name in bound else OPEN_MODULE, set()).add(name)
+        
+        unused.extend((name, line) for key, name, line in pending if name not in used.get(key, ()))
+        intern = parser.symbols.intern
+        for name, line in unused:
+            parser.unused_variables.append(CLOSED, intern(name), line)
+        parser.name_loads.update(loads)
+        parser.resolve_usage()
+    
+    def _collect_graph_results(self, graphs: List[ControlFlowGraph]):
+        """Extrai linhas alcançáveis e regiões inalcançáveis dos grafos"""
+        for graph in graphs:
+            reachable = graph.reachable_blocks()
+            for block in graph.blocks:
+                if block.id in reachable:
+                    self.reachable_lines.update(stmt.lineno for stmt in block.statements)
+            
+            for start, end in graph.unreachable_regions():
+                self._regions.append((start, end))
+                self.unreachable_lines.update(range(start, end + 1))
+    
+    def _collect_issues(self):
+        self.issues.extend(self._iter_issues())
+    
+    def _iter_issues(self) -> Iterator[DeadCodeIssue]:
+        timed = self.profiler.timed_iter
+        for name in self.rules:
+            detector = getattr(self, REGISTRY[name].detector)
+            yield from timed(f'detect/{name}', detector())
+    
+    def _register_handlers(self, engine: TraversalEngine) -> Set[str]:
+        """
+        Registra no motor de travessia só os handlers das regras habilitadas
+        
+        Inclui as regras de que elas dependem (veja ``rules.Rule.requires``)
+        e devolve os nomes dos handlers registrados. A poda de ramos mortos
+        é registrada sempre, para que cada regra sozinha dê o mesmo
+        resultado que na análise completa.
+        """
+        owners = {'parser': self.parser, 'analyzer': self}
+        registered: Set[Tuple[str, str]] = set()
+        for name in required_rules(self.rules):
+            for node_name, handler in REGISTRY[name].visits:
+                node_type = getattr(ast, node_name, None)
+                if node_type is None or (node_name, handler) in registered:
+                    continue
+                registered.add((node_name, handler))
+                owner, method = handler.split('.')
+                engine.register(node_type, getattr(owners[owner], method))
+        engine.register(ast.If, self._prune_dead_branches)
+        engine.register(ast.While, self._prune_dead_branches)
+        return {handler for _, handler in registered}
     
-    def _analyze_return_flow(self, node: ast.Return, lines: List[str]):
-        """Analisa fluxo de controle após declarações return"""
-        return_line = node.lineno
+    def _cfg_builder(self) -> CFGBuilder:
+        evaluator = self.parser.evaluator
+        return CFGBuilder(evaluator.is_always_false, evaluator.is_always_true)
+    
+    def _visit_module(self, node: ast.Module):
+        """Constrói os grafos de fluxo de controle do módulo e das funções"""
+        self.graphs = self._cfg_builder().build(node)
+    
+    def _prune_dead_branches(self, node: ast.AST):
+        """
+        Poda da travessia os ramos que o avaliador de constantes prova mortos
+        
+        Registrado com qualquer seleção de regras: o que está dentro de um
+        ramo morto já é coberto pela condição sempre falsa (ou pelo código
+        inalcançável) e não é revisitado por nenhum handler.
+        """
+        for field in self._dead_fields(node):
+            self._engine.prune(getattr(node, field))
+    
+    def _dead_fields(self, node: ast.AST) -> Tuple[str, ...]:
+        """Listas de declarações de um if/while que nunca são executadas"""
+        if not isinstance(node, (ast.If, ast.While)):
+            return ()
+        evaluator = self.parser.evaluator
+        if evaluator.is_always_false(node.test):
+            return ('body',)
+        if node.orelse and evaluator.is_always_true(node.test):
+            return ('orelse',)
+        return ()
+    
+    def _visit_if(self, node: ast.If):
+        """Registra condições sempre falsas"""
+        if self.parser.evaluator.is_always_false(node.test):
+            body_end = getattr(node.body[-1], 'end_lineno', None) or node.lineno
+            self._pending_false_conditions.append(DeadCodeIssue(
+                type="always_false_condition",
+                line=node.lineno,
+                end_line=body_end,
+                description="Condição sempre falsa - código nunca será executado",
+                severity="warning"
+            ))
+    
+    def _visit_block_owner(self, node: ast.AST):
+        """Analisa cada lista de declarações pertencente ao nó, exceto as mortas"""
+        dead = self._dead_fields(node)
+        for field in BLOCK_FIELDS:
+            statements = getattr(node, field, None)
+            if statements and field not in dead:
+                self._analyze_block(statements)
+    
+    def _analyze_block(self, statements: List[ast.stmt]):
+        """Marca como mortas as declarações irmãs após um desvio incondicional"""
+        for index, statement in enumerate(statements):
+            keyword = TERMINATORS.get(statement.__class__)
+            if keyword is not None:
+                self._record_dead_siblings(keyword, statements[index + 1:])
+                return
+    
+    def _record_dead_siblings(self, keyword: str, siblings: List[ast.stmt]):
+        dead = [stmt for stmt in siblings if not self._is_bare_string(stmt)]
+        if not dead:
+            return
+        
+        start = dead[0].lineno
+        end = getattr(dead[-1], 'end_lineno', None) or dead[-1].lineno
         
-        for i in range(return_line, len(lines)):
-            line_num = i + 1 
-            if line_num not in self.reachable_lines:
-                self.unreachable_lines.add(line_num)
+        self._pending_after_return.append(DeadCodeIssue(
+            type="code_after_return",
+            line=start,
+            end_line=end,
+            description=f"Código após {keyword} - nunca será executado",
+            severity="warning"
+        ))
+    
+    def _is_bare_string(self, statement: ast.stmt) -> bool:
+        return (isinstance(statement, ast.Expr) and
+                isinstance(statement.value, ast.Constant) and
+                isinstance(statement.value.value, str))
     
-    def _detect_unused_functions(self):
+    def _detect_unused_functions(self) -> Iterator[DeadCodeIssue]:
         """Detecta funções que não são chamadas"""
-        unused_functions = self.parser.get_unused_functions()
+        unused_functions = sorted(self.parser.get_unused_functions(),
+                                  key=lambda func: (func.line, func.name))
         
         for func in unused_functions:
-            self.issues.append(DeadCodeIssue(
+            yield DeadCodeIssue(
                 type="unused_function",
                 line=func.line,
                 description=f"Função '{func.name}' definida mas nunca chamada",
                 severity="warning"
-            ))
+            )
     
-    def _detect_unused_variables(self):
+    def _detect_unused_variables(self) -> Iterator[DeadCodeIssue]:
         """Detecta variáveis que não são utilizadas"""
-        unused_variables = self.parser.get_unused_variables()
+        unused_variables = sorted(self.parser.get_unused_variables(),
+                                  key=lambda var: (var.line, var.name))
         
         for var in unused_variables:
-            self.issues.append(DeadCodeIssue(
+            yield DeadCodeIssue(
                 type="unused_variable",
                 line=var.line,
                 description=f"Variável '{var.name}' declarada mas nunca utilizada",
                 severity="warning"
-            ))
+            )
     
-    def _detect_unused_imports(self):
+    def _detect_unused_imports(self) -> Iterator[DeadCodeIssue]:
         """Detecta imports que não são utilizados"""
-        unused_imports = self.parser.get_unused_imports()
+        unused_imports = self.parser.get_unused_import_entries()
         
-        for import_name in unused_imports:
-            self.issues.append(DeadCodeIssue(
+        for line, column, import_name in unused_imports:
+            yield DeadCodeIssue(
                 type="unused_import",
-                line=0, 
+                line=line,
                 description=f"Import '{import_name}' não utilizado",
-                severity="warning"
-            ))
+                severity="warning",
+                column=column,
+            )
     
-    def _detect_always_false_conditions(self, tree: ast.AST):
+    def _detect_always_false_conditions(self) -> Iterator[DeadCodeIssue]:
         """Detecta condições que são sempre falsas"""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.If):
-                if self._is_always_false(node.test):
-                    self.issues.append(DeadCodeIssue(
-                        type="always_false_condition",
-                        line=node.lineno,
-                        description="Condição sempre falsa - código nunca será executado",
-                        severity="warning"
-                    ))
-    
-    def _detect_code_after_return(self, tree: ast.AST, source_code: str):
-        """Detecta código após declarações return"""
-        lines = source_code.split('\n')
-        return_lines = []
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Return):
-                return_lines.append(node.lineno)
-        
-        for return_line in return_lines:
-            for i in range(return_line, len(lines)):
-                line_num = i + 1
-                line_content = lines[i].strip()
-                
-                if (line_content and 
-                    not line_content.startswith('#') and
-                    not line_content.startswith('"""') and
-                    not line_content.startswith("'''")):
-                    
-                    if not self._is_control_structure_start(line_content):
-                        self.issues.append(DeadCodeIssue(
-                            type="code_after_return",
-                            line=line_num,
-                            description="Código após return - nunca será executado",
-                            severity="warning"
-                        ))
-                        break
-    
-    def _is_always_false(self, test: ast.expr) -> bool:
-        if isinstance(test, ast.Constant):
-            return test.value is False
-        elif isinstance(test, ast.Compare):
-            if len(test.ops) == 1 and len(test.comparators) == 1:
-                op = test.ops[0]
-                left = test.left
-                right = test.comparators[0]
-                
-                if isinstance(op, ast.Eq):
-                    if isinstance(left, ast.Constant) and isinstance(right, ast.Constant):
-                        return left.value != right.value
-                elif isinstance(op, ast.NotEq):
-                    if isinstance(left, ast.Constant) and isinstance(right, ast.Constant):
-                        return left.value == right.value
-        return False
-    
-    def _is_control_structure_start(self, line: str) -> bool:
-        control_keywords = ['if', 'elif', 'else', 'for', 'while', 'try', 'except', 'finally', 'with']
-        return any(line.startswith(keyword) for keyword in control_keywords)
+        return iter(sorted(self._pending_false_conditions, key=lambda issue: issue.line))
+    
+    def _detect_code_after_return(self) -> Iterator[DeadCodeIssue]:
+        """Detecta código após return, raise, break ou continue no mesmo bloco"""
+        return iter(sorted(self._pending_after_return, key=lambda issue: issue.line))
+    
+    def _detect_unreachable_code(self) -> Iterator[DeadCodeIssue]:
+        """Detecta regiões do grafo de fluxo que nenhum caminho alcança"""
+        reported = set()
+        for issue in self._pending_false_conditions + self._pending_after_return:
+            reported.update(range(issue.line, max(issue.line, issue.end_line) + 1))
+        
+        for start, end in sorted(self._regions, key=lambda region: (region[0], -region[1])):
+            if start in reported:
+                continue
+            reported.update(range(start, end + 1))
+            yield DeadCodeIssue(
+                type="unreachable_code",
+                line=start,
+                end_line=end,
+                description="Código inalcançável - nenhum caminho de execução chega aqui",
+                severity="warning"
+            )
     
     def get_summary(self) -> Dict[str, int]:
         summary = {
@@ -220,4 +646,18 @@ class DeadCodeAnalyzer:
             if issue.type in summary:
                 summary[issue.type] += 1
         
-        return summary 
\ No newline at end of file
+        return summary
+
+
+def estimate_memory(source_code: Text) -> int:
+    """Estimativa conservadora, em bytes, do pico de memória para analisar ``source_code``"""
+    return len(source_code) * MEMORY_PER_SOURCE_CHAR
+
+
+def _utf8_length(text: str) -> int:
+    return len(text.encode('utf-8', 'surrogatepass'))
+
+
+def _shift(issue: DeadCodeIssue, offset: int) -> DeadCodeIssue:
+    return replace(issue, line=issue.line + offset,
+                   end_line=issue.end_line + offset if issue.end_line else 0)
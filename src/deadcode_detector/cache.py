@@ -0,0 +1,125 @@
+"""
+Cache de Resultados - Reaproveita análises de arquivos que não mudaram
+"""
+
+import hashlib
+import json
+import os
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from . import DEFAULT_CACHE_DIR, __version__
+
+if TYPE_CHECKING:
+    from .analyzer import DeadCodeIssue
+
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+CACHE_FORMAT = 5
+
+
+class ResultCache:
+    """
+    Cache em disco dos problemas encontrados em cada arquivo
+
+    A chave é o hash do conteúdo do arquivo combinado com a versão do
+    analisador e o conjunto de regras habilitadas, de modo que qualquer
+    mudança em um deles invalida a entrada. Cada entrada é um arquivo JSON
+    com os problemas e, opcionalmente, o resumo de símbolos do arquivo;
+    o horário de modificação marca o último uso e ``prune`` remove as
+    entradas menos usadas recentemente até o cache caber em ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 rules: Optional[Iterable[str]] = None):
+        if rules is None:
+            from .rules import REGISTRY
+            rules = REGISTRY
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.rules = tuple(sorted(rules))
+        self.hits = 0
+        self.misses = 0
+        self._salt = f"{CACHE_FORMAT}\0{__version__}\0{','.join(self.rules)}\0".encode()
+
+    def key(self, content: bytes) -> str:
+        digest = hashlib.sha256(self._salt)
+        digest.update(content)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str, symbols: bool = False) -> str:
+        # Entradas com e sem símbolos têm nomes distintos: ``contains`` distingue
+        # as duas sem abrir o arquivo
+        return os.path.join(self.cache_dir, key[:2], key + (".json" if symbols else ".issues.json"))
+
+    def contains(self, key: str, need_symbols: bool = False) -> bool:
+        """Verificação barata de existência, sem ler nem validar a entrada"""
+        if os.path.exists(self._entry_path(key, symbols=True)):
+            return True
+        return not need_symbols and os.path.exists(self._entry_path(key))
+
+    def get(self, key: str) -> Optional[List["DeadCodeIssue"]]:
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key: str, need_symbols: bool = False
+                  ) -> Optional[Tuple[List["DeadCodeIssue"], Optional[Dict]]]:
+        """Devolve (problemas, símbolos); sem símbolos e com ``need_symbols`` é falha"""
+        data = None
+        for symbols in ((True,) if need_symbols else (True, False)):
+            path = self._entry_path(key, symbols)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                os.utime(path)
+                break
+            except (OSError, ValueError):
+                data = None
+        if data is None:
+            self.misses += 1
+            return None
+
+        from .analyzer import DeadCodeIssue
+        self.hits += 1
+        return [DeadCodeIssue(**item) for item in data['issues']], data.get('symbols')
+
+    def put(self, key: str, issues: List["DeadCodeIssue"], symbols: Optional[Dict] = None):
+        import tempfile
+        from dataclasses import asdict
+        path = self._entry_path(key, symbols is not None)
+        data = {'issues': [asdict(issue) for issue in issues], 'symbols': symbols}
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def prune(self):
+        """Remove as entradas menos usadas recentemente até caber no limite"""
+        entries = []
+        total = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                break
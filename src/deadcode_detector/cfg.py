@@ -0,0 +1,336 @@
+"""
+Grafo de Fluxo de Controle - Blocos básicos e análise de alcançabilidade
+"""
+
+import ast
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Set, Tuple
+
+
+_TRY_TYPES = tuple(getattr(ast, name) for name in ('Try', 'TryStar') if hasattr(ast, name))
+_MATCH = getattr(ast, 'Match', None)
+
+
+@dataclass(eq=False)
+class BasicBlock:
+    id: int
+    statements: List[ast.stmt] = None
+    successors: List[int] = None
+    predecessors: List[int] = None
+
+    def __post_init__(self):
+        if self.statements is None:
+            self.statements = []
+        if self.successors is None:
+            self.successors = []
+        if self.predecessors is None:
+            self.predecessors = []
+
+
+class ControlFlowGraph:
+    """
+    Grafo de Fluxo de Controle de uma função ou do módulo
+
+    Os blocos são guardados em uma lista indexada pelo id e as arestas são
+    listas de ids, o que mantém o grafo compacto e evita ciclos de referência.
+    """
+
+    def __init__(self, name: str, line: int):
+        self.name = name
+        self.line = line
+        self.blocks: List[BasicBlock] = []
+        self.entry = self.new_block()
+        self.exit = self.new_block()
+
+    def new_block(self) -> BasicBlock:
+        block = BasicBlock(id=len(self.blocks))
+        self.blocks.append(block)
+        return block
+
+    def link(self, source: BasicBlock, target: BasicBlock):
+        source.successors.append(target.id)
+        target.predecessors.append(source.id)
+
+    def reachable_blocks(self) -> Set[int]:
+        """Alcançabilidade por worklist a partir da entrada em O(nós + arestas)"""
+        blocks = self.blocks
+        reachable = {self.entry.id}
+        worklist = [self.entry.id]
+
+        while worklist:
+            for successor in blocks[worklist.pop()].successors:
+                if successor not in reachable:
+                    reachable.add(successor)
+                    worklist.append(successor)
+
+        return reachable
+
+    def unreachable_blocks(self) -> List[BasicBlock]:
+        reachable = self.reachable_blocks()
+        return [block for block in self.blocks if block.id not in reachable]
+
+    def unreachable_regions(self) -> List[Tuple[int, int]]:
+        """
+        Agrupa os blocos inalcançáveis em regiões contíguas
+
+        Cada região começa em um bloco sem predecessores e inclui os blocos
+        inalcançáveis que dependem dele. Retorna pares (linha inicial, linha
+        final) ordenados pela linha inicial.
+        """
+        reachable = self.reachable_blocks()
+        blocks = self.blocks
+        visited: Set[int] = set()
+        regions = []
+
+        for root in blocks:
+            if root.id in reachable or root.predecessors or root is self.exit:
+                continue
+
+            start = end = None
+            worklist = [root.id]
+            visited.add(root.id)
+            while worklist:
+                block = blocks[worklist.pop()]
+                for statement in block.statements:
+                    statement_end = getattr(statement, 'end_lineno', None) or statement.lineno
+                    if start is None or statement.lineno < start:
+                        start = statement.lineno
+                    if end is None or statement_end > end:
+                        end = statement_end
+                for successor in block.successors:
+                    if successor not in reachable and successor not in visited:
+                        visited.add(successor)
+                        worklist.append(successor)
+
+            if start is not None:
+                regions.append((start, end))
+
+        regions.sort()
+        return regions
+
+
+class CFGBuilder:
+    """
+    Construtor de Grafos de Fluxo de Controle
+
+    Percorre apenas as listas de declarações, uma vez cada, gerando um grafo
+    para o módulo e um para cada função (inclusive funções aninhadas).
+    """
+
+    def __init__(self, is_always_false: Optional[Callable[[ast.expr], bool]] = None,
+                 is_always_true: Optional[Callable[[ast.expr], bool]] = None):
+        self.is_always_false = is_always_false or (lambda test: False)
+        self.is_always_true = is_always_true or _is_true_constant
+        self.graphs: List[ControlFlowGraph] = []
+        self._graph: Optional[ControlFlowGraph] = None
+        self._loops: List[Tuple[BasicBlock, BasicBlock]] = []
+
+    def build(self, tree: ast.Module) -> List[ControlFlowGraph]:
+        self.graphs = []
+        self._build_graph('<module>', 0, tree.body)
+        return self.graphs
+
+    def build_function(self, node: ast.AST) -> List[ControlFlowGraph]:
+        """Constrói o grafo de uma única função e de suas funções aninhadas"""
+        self.graphs = []
+        self._build_graph(node.name, node.lineno, node.body)
+        return self.graphs
+
+    def _build_graph(self, name: str, line: int, body: List[ast.stmt]):
+        saved = (self._graph, self._loops)
+        graph = ControlFlowGraph(name, line)
+        self.graphs.append(graph)
+        self._graph, self._loops = graph, []
+
+        current = self._build_body(body, graph.entry)
+        if current is not None:
+            graph.link(current, graph.exit)
+
+        self._graph, self._loops = saved
+
+    def _build_body(self, statements: List[ast.stmt],
+                    current: Optional[BasicBlock]) -> Optional[BasicBlock]:
+        for statement in statements:
+            if current is None:
+                current = self._graph.new_block()
+            current = self._build_statement(statement, current)
+        return current
+
+    def _build_statement(self, statement: ast.stmt, current: BasicBlock) -> Optional[BasicBlock]:
+        graph = self._graph
+        current.statements.append(statement)
+
+        if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            self._build_graph(statement.name, statement.lineno, statement.body)
+            return current
+        elif isinstance(statement, ast.ClassDef):
+            return self._build_body(statement.body, current)
+        elif isinstance(statement, ast.If):
+            return self._build_if(statement, current)
+        elif isinstance(statement, ast.While):
+            return self._build_loop(statement, current,
+                                    self.is_always_false(statement.test),
+                                    self.is_always_true(statement.test))
+        elif isinstance(statement, (ast.For, ast.AsyncFor)):
+            return self._build_loop(statement, current, False, False)
+        elif isinstance(statement, (ast.With, ast.AsyncWith)):
+            return self._build_with(statement, current)
+        elif isinstance(statement, _TRY_TYPES):
+            return self._build_try(statement, current)
+        elif _MATCH is not None and isinstance(statement, _MATCH):
+            return self._build_match(statement, current)
+        elif isinstance(statement, (ast.Return, ast.Raise)):
+            graph.link(current, graph.exit)
+            return None
+        elif isinstance(statement, ast.Break):
+            if self._loops:
+                graph.link(current, self._loops[-1][1])
+            return None
+        elif isinstance(statement, ast.Continue):
+            if self._loops:
+                graph.link(current, self._loops[-1][0])
+            return None
+
+        return current
+
+    def _build_if(self, statement: ast.If, current: BasicBlock) -> Optional[BasicBlock]:
+        """Constrói if/elif/else percorrendo a cadeia de elif iterativamente"""
+        graph = self._graph
+        ends = []
+
+        while True:
+            always_false = self.is_always_false(statement.test)
+            always_true = self.is_always_true(statement.test)
+
+            body_entry = graph.new_block()
+            if not always_false:
+                graph.link(current, body_entry)
+            ends.append(self._build_body(statement.body, body_entry))
+
+            if not statement.orelse:
+                if not always_true:
+                    ends.append(current)
+                break
+
+            else_entry = graph.new_block()
+            if not always_true:
+                graph.link(current, else_entry)
+
+            orelse = statement.orelse
+            if len(orelse) == 1 and isinstance(orelse[0], ast.If):
+                statement = orelse[0]
+                current = else_entry
+                current.statements.append(statement)
+                continue
+
+            ends.append(self._build_body(orelse, else_entry))
+            break
+
+        return self._join(ends)
+
+    def _build_loop(self, statement: ast.stmt, current: BasicBlock,
+                    always_false: bool, always_true: bool) -> BasicBlock:
+        graph = self._graph
+        header = graph.new_block()
+        after = graph.new_block()
+        graph.link(current, header)
+
+        body_entry = graph.new_block()
+        if not always_false:
+            graph.link(header, body_entry)
+
+        self._loops.append((header, after))
+        body_end = self._build_body(statement.body, body_entry)
+        self._loops.pop()
+        if body_end is not None:
+            graph.link(body_end, header)
+
+        if statement.orelse:
+            else_entry = graph.new_block()
+            if not always_true:
+                graph.link(header, else_entry)
+            else_end = self._build_body(statement.orelse, else_entry)
+            if else_end is not None:
+                graph.link(else_end, after)
+        elif not always_true:
+            graph.link(header, after)
+
+        return after
+
+    def _build_with(self, statement: ast.stmt, current: BasicBlock) -> Optional[BasicBlock]:
+        """
+        O corpo segue no mesmo bloco; se ele termina desviando mas pode
+        levantar exceção, o gerenciador de contexto pode suprimi-la
+        (``contextlib.suppress``) e a execução continua após o ``with``
+        """
+        body_end = self._build_body(statement.body, current)
+        if body_end is not None or not _can_raise(statement.body):
+            return body_end
+
+        after = self._graph.new_block()
+        self._graph.link(current, after)
+        return after
+
+    def _build_try(self, statement: ast.stmt, current: BasicBlock) -> Optional[BasicBlock]:
+        graph = self._graph
+
+        body_entry = graph.new_block()
+        graph.link(current, body_entry)
+        body_end = self._build_body(statement.body, body_entry)
+        if statement.orelse and body_end is not None:
+            body_end = self._build_body(statement.orelse, body_end)
+        ends = [body_end]
+
+        for handler in statement.handlers:
+            handler_entry = graph.new_block()
+            graph.link(current, handler_entry)
+            ends.append(self._build_body(handler.body, handler_entry))
+
+        ends = [end for end in ends if end is not None]
+        if not statement.finalbody:
+            return self._join(ends)
+
+        final_entry = graph.new_block()
+        graph.link(current, final_entry)
+        for end in ends:
+            graph.link(end, final_entry)
+        final_end = self._build_body(statement.finalbody, final_entry)
+
+        return final_end if ends else None
+
+    def _build_match(self, statement: ast.stmt, current: BasicBlock) -> Optional[BasicBlock]:
+        graph = self._graph
+        ends = [current]
+
+        for case in statement.cases:
+            case_entry = graph.new_block()
+            graph.link(current, case_entry)
+            ends.append(self._build_body(case.body, case_entry))
+
+        return self._join(ends)
+
+    def _join(self, ends: List[Optional[BasicBlock]]) -> Optional[BasicBlock]:
+        ends = [end for end in ends if end is not None]
+        if not ends:
+            return None
+
+        after = self._graph.new_block()
+        for end in ends:
+            self._graph.link(end, after)
+        return after
+
+
+def _can_raise(statements: List[ast.stmt]) -> bool:
+    """Falso só para corpos que não avaliam nada (pass, break, continue, return de nome ou constante)"""
+    for statement in statements:
+        if isinstance(statement, (ast.Pass, ast.Break, ast.Continue)):
+            continue
+        if isinstance(statement, ast.Return) and (
+                statement.value is None or isinstance(statement.value, (ast.Constant, ast.Name))):
+            continue
+        return True
+    return False
+
+
+def _is_true_constant(test: ast.expr) -> bool:
+    return isinstance(test, ast.Constant) and bool(test.value)
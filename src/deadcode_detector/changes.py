@@ -0,0 +1,67 @@
+"""
+Arquivos Alterados - Consulta ao git para analisar só o que mudou
+"""
+
+import os
+import subprocess
+from typing import Iterable, List, Optional
+
+
+def changed_files(ref: Optional[str] = None, staged: bool = False,
+                  paths: Iterable[str] = (), cwd: Optional[str] = None) -> List[str]:
+    """
+    Arquivos Python alterados segundo o git, em uma única chamada ``git diff``
+
+    Com ``staged`` compara o índice (o que vai no próximo commit); sem ele,
+    a árvore de trabalho. ``ref`` é a base da comparação (padrão: o índice,
+    ou ``HEAD`` com ``staged``) e ``paths`` restringe a busca. Arquivos
+    removidos são ignorados e os caminhos são relativos a ``cwd``, que deve
+    estar dentro do repositório.
+    """
+    command = ['git', 'diff', '--name-only', '-z', '--relative', '--diff-filter=d']
+    if staged:
+        command.append('--cached')
+    if ref:
+        command.append(ref)
+    command.append('--')
+    command.extend(paths)
+    output = _git(command, cwd)
+    return [_join(cwd, name) for name in output.split('\0') if name.endswith('.py')]
+
+
+def files_mentioning(terms: Iterable[str], paths: Iterable[str] = (),
+                     cwd: Optional[str] = None) -> Optional[List[str]]:
+    """
+    Arquivos Python sob ``paths`` cujo texto contém algum de ``terms``
+
+    Um único ``git grep`` examina os arquivos rastreados e os não
+    rastreados; os ignorados pelo git ficam de fora. Devolve None fora de
+    um repositório ou se o git falhar, para que quem chama percorra os
+    diretórios por conta própria.
+    """
+    command = ['git', 'grep', '-l', '-z', '-F', '--untracked']
+    for term in sorted(set(terms)):
+        command.extend(['-e', term])
+    command.append('--')
+    command.extend(paths)
+    try:
+        output = _git(command, cwd, allowed=(0, 1))
+    except RuntimeError:
+        return None
+    return [_join(cwd, name) for name in output.split('\0') if name.endswith('.py')]
+
+
+def _git(command: List[str], cwd: Optional[str], allowed=(0,)) -> str:
+    try:
+        completed = subprocess.run(command, cwd=cwd, stdout=subprocess.PIPE,
+                                   stderr=subprocess.PIPE)
+    except OSError as e:
+        raise RuntimeError(f"não foi possível executar o git: {e.strerror}")
+    if completed.returncode not in allowed:
+        message = completed.stderr.decode('utf-8', 'replace').strip()
+        raise RuntimeError(message or f"{' '.join(command[:2])} falhou")
+    return completed.stdout.decode('utf-8', 'surrogateescape')
+
+
+def _join(cwd: Optional[str], name: str) -> str:
+    return os.path.join(cwd, name) if cwd else name
@@ -0,0 +1,358 @@
+"""
+Linha de Comando - Argumentos e despacho do DeadCodeDetector
+
+Importa apenas ``argparse`` e constantes no carregamento; analisador,
+relatórios e cores só são carregados depois de interpretar os argumentos,
+de modo que ``--version``, ``--help`` e erros de uso respondem rápido.
+"""
+
+import sys
+import argparse
+import os
+from time import perf_counter
+from typing import List, Optional
+
+from . import DEFAULT_CACHE_DIR, __version__
+
+# Como um processo terminado por SIGPIPE no shell (128 + 13)
+EXIT_BROKEN_PIPE = 141
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="DeadCodeDetector - Analisador de código morto para Python",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemplos:
+  python -m deadcode_detector exemplo.py
+  python -m deadcode_detector exemplo.py --output relatorio.txt
+  python -m deadcode_detector exemplo.py --no-colors
+  python -m deadcode_detector src/ tests/ --jobs 4
+  python -m deadcode_detector src/ --stream
+  python -m deadcode_detector src/ --select unused_import,unused_variable
+  python -m deadcode_detector src/ --ignore unreachable_code
+  python -m deadcode_detector src/ --format ndjson > problemas.ndjson
+  python -m deadcode_detector src/ --format sarif -o problemas.sarif
+  python -m deadcode_detector src/ --profile
+  python -m deadcode_detector src/ --memory-report --max-memory 512
+  python -m deadcode_detector . --staged
+  python -m deadcode_detector src/ --changed-since origin/main
+  python -m deadcode_detector src/ --watch
+  python -m deadcode_detector --daemon
+  python -m deadcode_detector --lsp
+        """
+    )
+    
+    parser.add_argument(
+        'paths',
+        nargs='*',
+        metavar='path',
+        help='Arquivos Python ou diretórios para analisar'
+    )
+    
+    parser.add_argument(
+        '--output', '-o',
+        help='Arquivo de saída para salvar o relatório'
+    )
+    
+    parser.add_argument(
+        '--no-colors',
+        action='store_true',
+        help='Desabilita cores na saída'
+    )
+    
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='Número de processos paralelos (padrão: número de CPUs)'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        default=DEFAULT_CACHE_DIR,
+        help=f'Diretório do cache de resultados (padrão: {DEFAULT_CACHE_DIR})'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Desabilita o cache de resultados'
+    )
+    
+    parser.add_argument(
+        '--no-project',
+        action='store_true',
+        help='Analisa cada arquivo isoladamente, sem o índice de símbolos do projeto'
+    )
+    
+    parser.add_argument(
+        '--select',
+        type=_rule_list,
+        metavar='REGRAS',
+        help='Executa só estas regras, separadas por vírgula (padrão: todas)'
+    )
+    
+    parser.add_argument(
+        '--ignore',
+        type=_rule_list,
+        metavar='REGRAS',
+        help='Não executa estas regras, separadas por vírgula'
+    )
+    
+    parser.add_argument(
+        '--changed-since',
+        metavar='REF',
+        help='Analisa só os arquivos alterados desde REF (git diff REF)'
+    )
+    
+    parser.add_argument(
+        '--staged',
+        action='store_true',
+        help='Analisa só os arquivos com mudanças no índice do git (para pre-commit)'
+    )
+    
+    parser.add_argument(
+        '--format',
+        choices=('text', 'ndjson', 'sarif'),
+        default='text',
+        help='Formato da saída: texto para leitura, ndjson (um objeto JSON por problema) '
+             'ou sarif (SARIF 2.1.0) (padrão: text)'
+    )
+    
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Mostra cada problema assim que é encontrado, uma linha por problema'
+    )
+    
+    measure = parser.add_mutually_exclusive_group()
+    
+    measure.add_argument(
+        '--profile',
+        action='store_true',
+        help='Mede o tempo de cada fase e de cada arquivo e mostra os mais caros ao final'
+    )
+    
+    measure.add_argument(
+        '--memory-report',
+        action='store_true',
+        help='Mede o pico de memória (tracemalloc) de cada fase e de cada arquivo'
+    )
+    
+    parser.add_argument(
+        '--max-memory',
+        type=int,
+        metavar='MIB',
+        help='Não analisa arquivos cuja análise passaria de MIB mebibytes; '
+             'eles são reportados como problema'
+    )
+    
+    parser.add_argument(
+        '--watch', '-w',
+        action='store_true',
+        help='Observa os arquivos e reanalisa os que mudarem'
+    )
+    
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help='Inicia o daemon de análise (JSON-RPC) em vez de analisar arquivos'
+    )
+    
+    parser.add_argument(
+        '--stdio',
+        action='store_true',
+        help='Com --daemon, atende JSON-RPC pela entrada/saída padrão'
+    )
+    
+    parser.add_argument(
+        '--socket',
+        help='Com --daemon, caminho do socket Unix do daemon'
+    )
+    
+    parser.add_argument(
+        '--lsp',
+        action='store_true',
+        help='Inicia o servidor LSP pela entrada/saída padrão'
+    )
+    
+    parser.add_argument(
+        '--version',
+        action='version',
+        version=f'DeadCodeDetector {__version__}'
+    )
+    
+    args = parser.parse_args()
+    
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs deve ser maior ou igual a 1")
+    
+    if args.max_memory is not None and args.max_memory < 1:
+        parser.error("--max-memory deve ser maior ou igual a 1")
+    
+    from .rules import select_rules
+    try:
+        rules = select_rules(args.select, args.ignore)
+    except ValueError as e:
+        parser.error(str(e))
+    if not rules:
+        parser.error("nenhuma regra habilitada")
+    
+    if args.daemon:
+        run_daemon(args.socket, args.stdio, rules)
+        sys.exit(0)
+    
+    if args.lsp:
+        from .lsp import serve
+        sys.exit(serve(rules=rules))
+    
+    if not args.paths:
+        parser.error("informe ao menos um arquivo ou diretório")
+    
+    for path in args.paths:
+        if not os.path.exists(path):
+            print(f"❌ Erro: Arquivo '{path}' não encontrado")
+            sys.exit(1)
+        
+        if os.path.isfile(path) and not path.endswith('.py'):
+            print(f"⚠️  Aviso: Arquivo '{path}' não parece ser um arquivo Python")
+    
+    from .main import analyze_changed, analyze_files, collect_python_files, iter_files
+    from .cache import ResultCache
+    from .reporter import OUTPUT_BUFFER_SIZE, Reporter, write_ndjson
+    from .profiling import NULL_PROFILER, MemoryProfiler, Profiler
+    
+    if args.watch:
+        from .watch import Watcher
+        cache = None if args.no_cache else ResultCache(args.cache_dir, rules=rules)
+        Watcher(args.paths, Reporter(use_colors=not args.no_colors), jobs=args.jobs,
+                cache=cache, project=not args.no_project, rules=rules).run()
+        sys.exit(0)
+    
+    started = perf_counter()
+    if args.profile:
+        profiler = Profiler()
+    elif args.memory_report:
+        profiler = MemoryProfiler()
+    else:
+        profiler = NULL_PROFILER
+    max_memory = args.max_memory * 1024 * 1024 if args.max_memory is not None else None
+    
+    def finish(code: int):
+        # Nos formatos de máquina o perfil não pode misturar-se à saída
+        stream = sys.stdout if args.format == 'text' else sys.stderr
+        if args.profile:
+            reporter.print_profile(profiler, perf_counter() - started, stream=stream)
+        elif args.memory_report:
+            reporter.print_memory_report(profiler, stream=stream)
+        sys.exit(code)
+    
+    try:
+        changed_only = bool(args.changed_since or args.staged)
+        with profiler.phase('collect'):
+            if changed_only:
+                from .changes import changed_files
+                files = changed_files(args.changed_since, args.staged, args.paths)
+            else:
+                files = collect_python_files(args.paths)
+        reporter = Reporter(use_colors=not args.no_colors)
+        cache = None if args.no_cache else ResultCache(args.cache_dir, rules=rules)
+        options = dict(jobs=args.jobs, cache=cache, project=not args.no_project,
+                       profiler=profiler, max_memory=max_memory, rules=rules)
+        
+        def analyze_all():
+            if changed_only:
+                return analyze_changed(files, args.paths, **options)
+            return analyze_files(files, **options)
+        
+        def analyze_stream():
+            if not changed_only:
+                return iter_files(files, **options)
+            # Os alterados são poucos: o fluxo só começa depois do contexto
+            return ((file_path, issue) for file_path, issues in analyze_all().items()
+                    for issue in issues)
+        
+        if args.format != 'text':
+            issues = analyze_stream()
+            write = write_ndjson if args.format == 'ndjson' else reporter.write_sarif
+            if args.output:
+                with open(args.output, 'w', encoding='utf-8',
+                          buffering=OUTPUT_BUFFER_SIZE) as output:
+                    total = write(issues, output)
+            else:
+                total = write(issues, sys.stdout)
+            if cache is not None:
+                cache.prune()
+            finish(1 if total else 0)
+        
+        print("🔍 Analisando código...")
+        if args.stream:
+            issues = analyze_stream()
+            if args.output:
+                total = reporter.save_stream(issues, args.output)
+                print(f"📄 Relatório salvo em: {args.output}")
+            else:
+                total = reporter.print_stream(issues)
+            if cache is not None:
+                cache.prune()
+            finish(1 if total else 0)
+        
+        results = analyze_all()
+        
+        if cache is not None:
+            cache.prune()
+        
+        with profiler.phase('report'):
+            if args.output:
+                reporter.save_results(results, args.output)
+                print(f"📄 Relatório salvo em: {args.output}")
+            else:
+                for file_path, issues in results.items():
+                    reporter.print_file_analysis(file_path, issues)
+        
+        if cache is not None:
+            print(f"💾 Cache: {cache.hits} acerto(s), {cache.misses} falha(s)")
+        
+        if any(results.values()):
+            finish(1)
+        else:
+            finish(0)
+            
+    except BrokenPipeError:
+        # Leitor fechou a saída (ex.: "| head"): encerra sem traceback
+        _silence_stdout()
+        sys.exit(EXIT_BROKEN_PIPE)
+    except Exception as e:
+        print(f"❌ Erro durante a análise: {str(e)}")
+        sys.exit(1)
+
+
+def _silence_stdout():
+    """Aponta a saída para o devnull, para que o flush final não falhe de novo"""
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    try:
+        os.dup2(devnull, sys.stdout.fileno())
+    finally:
+        os.close(devnull)
+
+
+def _rule_list(value: str) -> List[str]:
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def run_daemon(socket_path: Optional[str] = None, use_stdio: bool = False,
+               rules: Optional[List[str]] = None):
+    from .daemon import AnalysisService, default_socket_path, serve_stdio, serve_unix
+    
+    service = AnalysisService(rules=rules)
+    if use_stdio:
+        serve_stdio(service)
+        return
+    
+    socket_path = socket_path or default_socket_path()
+    print(f"🛰️  Daemon escutando em {socket_path}", file=sys.stderr)
+    try:
+        serve_unix(service, socket_path)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,139 @@
+"""
+Cliente do Daemon - Consulta o daemon de análise ou analisa localmente
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+from typing import Dict, List, Optional
+
+
+CONNECT_TIMEOUT = 0.2
+
+
+class DaemonClient:
+    """
+    Cliente JSON-RPC mínimo para o daemon em socket Unix
+
+    Importa apenas módulos da biblioteca padrão; o analisador só é carregado
+    quando não há daemon e a análise precisa ser feita no próprio processo.
+    """
+
+    def __init__(self, socket_path: Optional[str] = None, timeout: Optional[float] = None):
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+        self._sock = None
+        self._reader = None
+        self._next_id = 0
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        sock.settimeout(self.timeout)
+        self._sock = sock
+        self._reader = sock.makefile('rb')
+
+    def call(self, method: str, params: Optional[Dict] = None):
+        self._next_id += 1
+        request = {'jsonrpc': '2.0', 'id': self._next_id, 'method': method, 'params': params or {}}
+        self._sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Daemon encerrou a conexão")
+        response = json.loads(line)
+        if 'error' in response:
+            raise RuntimeError(response['error']['message'])
+        return response['result']
+
+    def close(self):
+        if self._sock is not None:
+            self._reader.close()
+            self._sock.close()
+            self._sock = None
+
+
+def analyze_paths(paths: List[str], socket_path: Optional[str] = None) -> Dict[str, List[Dict]]:
+    """Analisa via daemon ou, se não houver daemon, no próprio processo"""
+    files = _expand(paths)
+    client = DaemonClient(socket_path)
+    try:
+        client.connect()
+    except OSError:
+        return _analyze_in_process(files)
+
+    results = {}
+    try:
+        for index, file_path in enumerate(files):
+            try:
+                result = client.call('analyze', {'path': os.path.abspath(file_path)})
+            except RuntimeError as e:
+                print(f"❌ Erro ao analisar {file_path}: {e}", file=sys.stderr)
+                result = {'issues': []}
+            except OSError as e:
+                # Daemon encerrado ou reiniciando (ConnectionError, timeout...):
+                # o que faltou é analisado no próprio processo
+                print(f"⚠️  Daemon indisponível ({e}); analisando localmente", file=sys.stderr)
+                results.update(_analyze_in_process(files[index:]))
+                break
+            results[file_path] = result['issues']
+    finally:
+        client.close()
+    return results
+
+
+def _analyze_in_process(files: List[str]) -> Dict[str, List[Dict]]:
+    from dataclasses import asdict
+    from .main import analyze_file
+
+    return {file_path: [asdict(issue) for issue in analyze_file(file_path)] for file_path in files}
+
+
+def _expand(paths: List[str]) -> List[str]:
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            found = []
+            for directory, _, names in os.walk(path):
+                found.extend(os.path.join(directory, name) for name in names if name.endswith('.py'))
+            files.extend(sorted(found))
+        else:
+            files.append(path)
+    return files
+
+
+def default_socket_path() -> str:
+    import tempfile
+
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    uid = os.getuid() if hasattr(os, 'getuid') else 0
+    return os.path.join(runtime_dir, f"deadcode_detector-{uid}.sock")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Cliente do daemon do DeadCodeDetector (analisa localmente se não houver daemon)"
+    )
+    parser.add_argument('paths', nargs='+', metavar='path', help='Arquivos Python ou diretórios')
+    parser.add_argument('--socket', help='Caminho do socket do daemon')
+    args = parser.parse_args(argv)
+
+    results = analyze_paths(args.paths, args.socket)
+    total = 0
+    for file_path, issues in results.items():
+        for issue in issues:
+            print(f"{file_path}:{issue['line']}: {issue['description']} [{issue['type']}]")
+        total += len(issues)
+
+    sys.exit(1 if total else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,384 @@
+"""
+Avaliação de Constantes - Dobra de expressões para decidir condições sempre falsas ou verdadeiras
+"""
+
+import ast
+import operator
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+
+class _Unknown:
+    """Valor que não pode ser decidido estaticamente"""
+
+    def __repr__(self) -> str:
+        return 'UNKNOWN'
+
+
+UNKNOWN = _Unknown()
+
+TYPING_MODULES = ('typing', 'typing_extensions')
+
+# Limites para não materializar valores enormes ao dobrar (ex.: 'x' * 10**9)
+MAX_SEQUENCE_LENGTH = 4096
+MAX_EXPONENT = 128
+MAX_INT_BITS = 4096
+
+_NUMBERS = (bool, int, float, complex)
+_SEQUENCES = (str, bytes, tuple)
+_SINGLETONS = (None, True, False, Ellipsis)
+
+_UNARY = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+    ast.Invert: operator.invert,
+}
+
+_BINARY = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+    ast.LShift: operator.lshift,
+    ast.RShift: operator.rshift,
+    ast.BitOr: operator.or_,
+    ast.BitXor: operator.xor,
+    ast.BitAnd: operator.and_,
+}
+
+_COMPARE = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Is: operator.is_,
+    ast.IsNot: operator.is_not,
+    ast.In: lambda left, right: left in right,
+    ast.NotIn: lambda left, right: left not in right,
+}
+
+_BLOCK_FIELDS = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+
+
+class ConstantEvaluator:
+    """
+    Avaliador abstrato de expressões constantes, com memoização por nó
+
+    Dobra constantes, tuplas, ``BoolOp``, ``UnaryOp``, ``BinOp`` e
+    comparações, além dos nomes de constantes do módulo (atribuídas uma
+    única vez, veja ``constants``) e de ``TYPE_CHECKING``, falso em tempo
+    de execução. ``and``/``or`` decidem a veracidade mesmo com operandos
+    desconhecidos (``DEBUG and False`` é sempre falso).
+
+    Valores e veracidades ficam memorizados por ``id`` do nó (junto do
+    próprio nó, para que o id não seja reutilizado), de modo que cada nó é
+    avaliado no máximo uma vez e o custo total é linear no tamanho das
+    expressões.
+    """
+
+    def __init__(self, tree: Optional[ast.Module] = None):
+        self.tree = tree
+        self._constants: Optional[Dict[str, Any]] = None if tree is not None else {}
+        self._typing_aliases: Set[str] = set()
+        self._values: Dict[int, Tuple[ast.AST, Any]] = {}
+        self._truths: Dict[int, Tuple[ast.AST, Optional[bool]]] = {}
+
+    @property
+    def constants(self) -> Dict[str, Any]:
+        """Constantes do módulo, coletadas na primeira consulta a um nome"""
+        if self._constants is None:
+            self._collect_constants(self.tree)
+        return self._constants
+
+    @property
+    def typing_aliases(self) -> Set[str]:
+        """Nomes locais do módulo ``typing`` (``import typing as t``)"""
+        if self._constants is None:
+            self._collect_constants(self.tree)
+        return self._typing_aliases
+
+    def is_always_false(self, test: ast.expr) -> bool:
+        return self.truth(test) is False
+
+    def is_always_true(self, test: ast.expr) -> bool:
+        return self.truth(test) is True
+
+    def truth(self, node: ast.expr) -> Optional[bool]:
+        """Veracidade de ``node``: True, False ou None se não puder ser decidida"""
+        entry = self._truths.get(id(node))
+        if entry is not None:
+            return entry[1]
+        try:
+            result = self._truth(node)
+        except RecursionError:
+            result = None
+        self._truths[id(node)] = (node, result)
+        return result
+
+    def value(self, node: ast.expr) -> Any:
+        """Valor de ``node`` ou ``UNKNOWN``"""
+        entry = self._values.get(id(node))
+        if entry is not None:
+            return entry[1]
+        try:
+            result = self._fold(node)
+        except RecursionError:
+            result = UNKNOWN
+        self._values[id(node)] = (node, result)
+        return result
+
+    def _truth(self, node: ast.expr) -> Optional[bool]:
+        if isinstance(node, ast.BoolOp):
+            # and: basta um operando falso; or: basta um verdadeiro
+            decisive = isinstance(node.op, ast.Or)
+            undecided = False
+            for operand in node.values:
+                truth = self.truth(operand)
+                if truth is decisive:
+                    return decisive
+                if truth is None:
+                    undecided = True
+            return None if undecided else not decisive
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            truth = self.truth(node.operand)
+            return None if truth is None else not truth
+
+        value = self.value(node)
+        if value is UNKNOWN:
+            return None
+        try:
+            return bool(value)
+        except Exception:
+            return None
+
+    def _fold(self, node: ast.expr) -> Any:
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.Name):
+            return self.constants.get(node.id, UNKNOWN)
+        if isinstance(node, ast.Attribute):
+            if (node.attr == 'TYPE_CHECKING' and isinstance(node.value, ast.Name)
+                    and node.value.id in self.typing_aliases):
+                return False
+            return UNKNOWN
+        if isinstance(node, ast.Tuple):
+            items = tuple(self.value(item) for item in node.elts)
+            return UNKNOWN if UNKNOWN in items else items
+        if isinstance(node, ast.BoolOp):
+            return self._fold_bool_op(node)
+        if isinstance(node, ast.UnaryOp):
+            return self._fold_unary_op(node)
+        if isinstance(node, ast.BinOp):
+            return self._fold_bin_op(node)
+        if isinstance(node, ast.Compare):
+            return self._fold_compare(node)
+        return UNKNOWN
+
+    def _fold_bool_op(self, node: ast.BoolOp) -> Any:
+        stop_when = isinstance(node.op, ast.Or)
+        result = UNKNOWN
+        for operand in node.values:
+            result = self.value(operand)
+            if result is UNKNOWN:
+                return UNKNOWN
+            if bool(result) is stop_when:
+                return result
+        return result
+
+    def _fold_unary_op(self, node: ast.UnaryOp) -> Any:
+        operand = self.value(node.operand)
+        if operand is UNKNOWN:
+            return UNKNOWN
+        if isinstance(node.op, ast.Not):
+            return not operand
+        function = _UNARY.get(type(node.op))
+        if function is None or not isinstance(operand, _NUMBERS):
+            return UNKNOWN
+        try:
+            return function(operand)
+        except Exception:
+            return UNKNOWN
+
+    def _fold_bin_op(self, node: ast.BinOp) -> Any:
+        left = self.value(node.left)
+        if left is UNKNOWN:
+            return UNKNOWN
+        right = self.value(node.right)
+        if right is UNKNOWN or not _safe_operands(node.op, left, right):
+            return UNKNOWN
+        try:
+            return _BINARY[type(node.op)](left, right)
+        except Exception:
+            return UNKNOWN
+
+    def _fold_compare(self, node: ast.Compare) -> Any:
+        left = self.value(node.left)
+        if left is UNKNOWN:
+            return UNKNOWN
+        for op, comparator in zip(node.ops, node.comparators):
+            right = self.value(comparator)
+            if right is UNKNOWN:
+                return UNKNOWN
+            # Identidade só é estável entre singletons
+            if isinstance(op, (ast.Is, ast.IsNot)) and not (_is_singleton(left)
+                                                            or _is_singleton(right)):
+                return UNKNOWN
+            try:
+                if not _COMPARE[type(op)](left, right):
+                    return False
+            except Exception:
+                return UNKNOWN
+            left = right
+        return True
+
+    def _collect_constants(self, tree: ast.Module):
+        """
+        Constantes: nomes ligados uma única vez em todo o módulo, em uma
+        atribuição simples de nível de módulo com valor dobrável
+
+        Qualquer outra ligação do nome (em outra atribuição, parâmetro,
+        import, ``global``, ``for``, ``with``, ``except``, ``del``, ``:=``...),
+        em qualquer escopo, exclui o nome, pois poderia mudar ou sombrear o
+        valor. Um ``from x import *`` pode religar qualquer nome, então o
+        módulo fica sem constantes.
+        """
+        self._constants = {}
+        assignments: List[Tuple[str, ast.expr]] = []
+        flags: List[str] = []
+        aliases: List[str] = []
+        for statement in tree.body:
+            if isinstance(statement, ast.Assign):
+                if len(statement.targets) == 1 and isinstance(statement.targets[0], ast.Name):
+                    assignments.append((statement.targets[0].id, statement.value))
+            elif isinstance(statement, ast.AnnAssign):
+                if statement.value is not None and isinstance(statement.target, ast.Name):
+                    assignments.append((statement.target.id, statement.value))
+            elif isinstance(statement, ast.ImportFrom):
+                if statement.module in TYPING_MODULES and not statement.level:
+                    flags.extend(alias.asname or alias.name for alias in statement.names
+                                 if alias.name == 'TYPE_CHECKING')
+            elif isinstance(statement, ast.Import):
+                aliases.extend(alias.asname or alias.name for alias in statement.names
+                               if alias.name in TYPING_MODULES)
+        if not (assignments or flags or aliases):
+            return
+
+        # Só as ligações dos candidatos interessam
+        counts = dict.fromkeys([name for name, _ in assignments] + flags + aliases, 0)
+        for name in _bindings(tree):
+            if name in counts:
+                counts[name] += 1
+            elif name == '*':
+                return
+
+        for name in flags:
+            if counts[name] == 1:
+                self._constants[name] = False
+        self._typing_aliases.update(name for name in aliases if counts[name] == 1)
+        # Em ordem: uma constante pode usar as definidas antes dela
+        for name, node in assignments:
+            if counts[name] == 1:
+                value = self.value(node)
+                if value is not UNKNOWN:
+                    self._constants[name] = value
+
+
+def _safe_operands(op: ast.operator, left: Any, right: Any) -> bool:
+    """Só dobra números e concatenações/repetições curtas de sequências"""
+    if isinstance(left, _NUMBERS) and isinstance(right, _NUMBERS):
+        # O tamanho do inteiro resultante é estimado antes de calculá-lo,
+        # para que constantes encadeadas (B = A ** 128) não cresçam sem limite
+        integers = isinstance(left, int) and isinstance(right, int)
+        if isinstance(op, ast.Pow):
+            if not (isinstance(right, (int, float)) and abs(right) <= MAX_EXPONENT):
+                return False
+            return not integers or left.bit_length() * max(right, 1) <= MAX_INT_BITS
+        if isinstance(op, ast.LShift):
+            return integers and right <= MAX_EXPONENT and left.bit_length() + right <= MAX_INT_BITS
+        if isinstance(op, ast.Mult) and integers:
+            return left.bit_length() + right.bit_length() <= MAX_INT_BITS
+        return True
+    if isinstance(op, ast.Add):
+        return (type(left) is type(right) and isinstance(left, _SEQUENCES)
+                and len(left) + len(right) <= MAX_SEQUENCE_LENGTH)
+    if isinstance(op, ast.Mult):
+        sequence, count = (left, right) if isinstance(left, _SEQUENCES) else (right, left)
+        return (isinstance(sequence, _SEQUENCES) and isinstance(count, int)
+                and len(sequence) * max(count, 0) <= MAX_SEQUENCE_LENGTH)
+    return False
+
+
+def _is_singleton(value: Any) -> bool:
+    return any(value is singleton for singleton in _SINGLETONS)
+
+
+def _bindings(tree: ast.Module) -> Iterator[str]:
+    """
+    Nomes ligados pelas declarações de ``tree``, uma vez por ligação
+
+    Um ``from x import *`` gera o nome ``'*'``. Alvos de ``:=`` contam em
+    qualquer expressão das declarações, inclusive em compreensões.
+    """
+    pending: List[ast.AST] = [tree]
+    while pending:
+        node = pending.pop()
+        for field in _BLOCK_FIELDS:
+            children = getattr(node, field, None)
+            if children:
+                pending.extend(children)
+
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.expr):
+                for expression in ast.walk(child):
+                    if isinstance(expression, ast.NamedExpr):
+                        yield expression.target.id
+
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            yield node.name
+            arguments = node.args
+            for arg in arguments.posonlyargs + arguments.args + arguments.kwonlyargs:
+                yield arg.arg
+            for arg in (arguments.vararg, arguments.kwarg):
+                if arg is not None:
+                    yield arg.arg
+        elif isinstance(node, ast.ClassDef):
+            yield node.name
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                yield from _target_names(target)
+        elif isinstance(node, (ast.AugAssign, ast.AnnAssign, ast.For, ast.AsyncFor)):
+            yield from _target_names(node.target)
+        elif isinstance(node, (ast.With, ast.AsyncWith)):
+            for item in node.items:
+                if item.optional_vars is not None:
+                    yield from _target_names(item.optional_vars)
+        elif isinstance(node, ast.Delete):
+            for target in node.targets:
+                yield from _target_names(target)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                yield alias.asname or alias.name.partition('.')[0]
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            yield from node.names
+        elif isinstance(node, ast.ExceptHandler):
+            if node.name:
+                yield node.name
+        elif hasattr(ast, 'match_case') and isinstance(node, ast.match_case):
+            for pattern in ast.walk(node.pattern):
+                name = getattr(pattern, 'name', None) or getattr(pattern, 'rest', None)
+                if name:
+                    yield name
+
+
+def _target_names(target: ast.expr) -> Iterator[str]:
+    if isinstance(target, ast.Name):
+        yield target.id
+    elif isinstance(target, (ast.Tuple, ast.List)):
+        for element in target.elts:
+            yield from _target_names(element)
+    elif isinstance(target, ast.Starred):
+        yield from _target_names(target.value)
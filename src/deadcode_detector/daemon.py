@@ -0,0 +1,214 @@
+"""
+Daemon de Análise - Servidor JSON-RPC com analisador e cache em memória
+"""
+
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from . import __version__
+from .analyzer import DeadCodeAnalyzer, DeadCodeIssue
+from .client import default_socket_path
+from .source import load_source
+
+
+DEFAULT_MAX_ENTRIES = 256
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class RPCError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class AnalysisService:
+    """
+    Serviço de análise mantido aquecido entre requisições
+
+    Guarda um ``DeadCodeAnalyzer`` já montado e, por arquivo, a assinatura
+    (mtime, tamanho), o estado incremental e os problemas da última análise.
+    Um arquivo inalterado é respondido direto do cache; um arquivo alterado
+    é reanalisado de forma incremental a partir do estado anterior.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 rules: Optional[Iterable[str]] = None):
+        self.analyzer = DeadCodeAnalyzer(rules=rules)
+        self.max_entries = max_entries
+        self.files: "OrderedDict[str, Tuple[Any, Any, List[DeadCodeIssue]]]" = OrderedDict()
+        self.sources: "OrderedDict[str, List[DeadCodeIssue]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.stopping = False
+        self.lock = threading.Lock()
+
+    def analyze(self, path: Optional[str] = None, source: Optional[str] = None) -> List[DeadCodeIssue]:
+        with self.lock:
+            if path is not None:
+                return self._analyze_path(os.path.abspath(path), source)
+            return self._analyze_source(source)
+
+    def _analyze_path(self, path: str, source: Optional[str]) -> List[DeadCodeIssue]:
+        cached = self.files.get(path)
+
+        if source is None:
+            stat = os.stat(path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+        else:
+            signature = hashlib.sha1(source.encode('utf-8', 'surrogatepass')).hexdigest()
+
+        if cached is not None and cached[0] == signature:
+            self.files.move_to_end(path)
+            self.hits += 1
+            return cached[2]
+
+        if source is None:
+            with load_source(path) as loaded:
+                source = loaded.data[:]
+
+        self.misses += 1
+        previous_state = cached[1] if cached is not None else None
+        issues = self.analyzer.analyze_incremental(source, previous_state)
+        self.files[path] = (signature, self.analyzer.state, issues)
+        self.files.move_to_end(path)
+        self._evict(self.files)
+        return issues
+
+    def _analyze_source(self, source: str) -> List[DeadCodeIssue]:
+        key = hashlib.sha1(source.encode('utf-8', 'surrogatepass')).hexdigest()
+        cached = self.sources.get(key)
+        if cached is not None:
+            self.sources.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        issues = self.analyzer.analyze(source)
+        self.sources[key] = issues
+        self._evict(self.sources)
+        return issues
+
+    def _evict(self, entries: OrderedDict):
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def handle_line(self, line: str) -> Optional[str]:
+        """Processa uma linha JSON-RPC e devolve a resposta serializada"""
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return json.dumps(_error(None, PARSE_ERROR, "JSON inválido"))
+
+        response = self.handle(request)
+        return json.dumps(response, ensure_ascii=False) if response is not None else None
+
+    def handle(self, request: Any) -> Optional[Dict]:
+        if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+            return _error(None, INVALID_REQUEST, "Requisição inválida")
+
+        request_id = request.get('id')
+        params = request.get('params') or {}
+        try:
+            response = {'jsonrpc': '2.0', 'id': request_id,
+                        'result': self._dispatch(request['method'], params)}
+        except RPCError as e:
+            response = _error(request_id, e.code, e.message)
+        except Exception as e:
+            response = _error(request_id, INTERNAL_ERROR, str(e))
+
+        return response if 'id' in request else None
+
+    def _dispatch(self, method: str, params: Dict) -> Any:
+        if not isinstance(params, dict):
+            raise RPCError(INVALID_PARAMS, "Parâmetros devem ser um objeto")
+
+        if method == 'analyze':
+            path = params.get('path')
+            source = params.get('source')
+            if path is None and source is None:
+                raise RPCError(INVALID_PARAMS, "Informe 'path' ou 'source'")
+            try:
+                issues = self.analyze(path=path, source=source)
+            except OSError as e:
+                raise RPCError(INVALID_PARAMS, f"Não foi possível ler {path}: {e.strerror}")
+            return {'issues': [asdict(issue) for issue in issues]}
+        elif method == 'ping':
+            return {'version': __version__, 'hits': self.hits, 'misses': self.misses}
+        elif method == 'shutdown':
+            self.stopping = True
+            return None
+
+        raise RPCError(METHOD_NOT_FOUND, f"Método desconhecido: {method}")
+
+
+def serve_stdio(service: AnalysisService, stdin=None, stdout=None):
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+
+    for line in stdin:
+        if not line.strip():
+            continue
+        response = service.handle_line(line)
+        if response is not None:
+            stdout.write(response + '\n')
+            stdout.flush()
+        if service.stopping:
+            break
+
+
+def serve_unix(service: AnalysisService, socket_path: str):
+    if _is_listening(socket_path):
+        raise RuntimeError(f"Já existe um daemon em {socket_path}")
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for raw in self.rfile:
+                if not raw.strip():
+                    continue
+                response = service.handle_line(raw.decode('utf-8'))
+                if response is not None:
+                    self.wfile.write(response.encode('utf-8') + b'\n')
+                    self.wfile.flush()
+                if service.stopping:
+                    threading.Thread(target=self.server.shutdown).start()
+                    return
+
+    server = socketserver.ThreadingUnixStreamServer(socket_path, Handler)
+    server.daemon_threads = True
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def _is_listening(socket_path: str) -> bool:
+    if not os.path.exists(socket_path):
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+def _error(request_id: Any, code: int, message: str) -> Dict:
+    return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}}
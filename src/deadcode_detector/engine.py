@@ -0,0 +1,91 @@
+"""
+Motor de Travessia - Percorre a AST uma única vez despachando para os detectores
+"""
+
+import ast
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Set, Tuple, Type
+
+from .profiling import NULL_PROFILER
+
+
+Handler = Callable[[ast.AST], None]
+
+# Nós que só aparecem como filhos uns dos outros, nunca dentro de expressões,
+# argumentos, aliases etc.
+STATEMENT_LEVEL = tuple(
+    getattr(ast, name) for name in ('mod', 'stmt', 'excepthandler', 'match_case')
+    if hasattr(ast, name)
+)
+
+
+class TraversalEngine:
+    """
+    Motor de Travessia - Visita cada nó da AST exatamente uma vez
+
+    Os detectores registram handlers para os tipos de nó que lhes interessam
+    e o motor entrega cada nó a todos os handlers registrados para o seu tipo.
+    A ordem de visita é a mesma de ``ast.walk`` (em largura), de modo que os
+    resultados são idênticos aos das várias travessias independentes.
+    Com um ``profiler`` ligado, cada handler é envolvido por um medidor de
+    tempo (fase ``traversal/<handler>``); desligado, nada é envolvido.
+    Se todos os tipos registrados são de nível de declaração
+    (``STATEMENT_LEVEL``), expressões e demais nós internos nem entram na
+    fila, pois nenhum handler os receberia. Um handler pode podar com
+    ``prune`` subárvores ainda não visitadas (ex.: ramos provados mortos):
+    nem elas nem seus descendentes chegam aos handlers.
+    """
+
+    def __init__(self, profiler=NULL_PROFILER):
+        self._handlers: Dict[Type[ast.AST], List[Handler]] = {}
+        self._dispatch: Dict[type, Tuple[Handler, ...]] = {}
+        self._statements_only = True
+        self._pruned: Set[int] = set()
+        self.profiler = profiler
+
+    def register(self, node_type: Type[ast.AST], handler: Handler):
+        if self.profiler.enabled:
+            name = getattr(handler, '__qualname__', type(handler).__name__)
+            handler = self.profiler.timed(f"traversal/{name}", handler)
+        self._handlers.setdefault(node_type, []).append(handler)
+        self._dispatch.clear()
+        self._statements_only = all(issubclass(registered, STATEMENT_LEVEL)
+                                    for registered in self._handlers)
+
+    def prune(self, nodes: Iterable[ast.AST]):
+        """Descarta da travessia em andamento os nós dados e suas subárvores"""
+        self._pruned.update(map(id, nodes))
+
+    def _resolve(self, node_class: type) -> Tuple[Handler, ...]:
+        handlers: List[Handler] = []
+        for node_type, type_handlers in self._handlers.items():
+            if issubclass(node_class, node_type):
+                handlers.extend(type_handlers)
+        resolved = tuple(handlers)
+        self._dispatch[node_class] = resolved
+        return resolved
+
+    def run(self, tree: ast.AST):
+        dispatch = self._dispatch
+        resolve = self._resolve
+        iter_child_nodes = _statement_children if self._statements_only else ast.iter_child_nodes
+        pruned = self._pruned
+        pruned.clear()
+        todo = deque([tree])
+
+        while todo:
+            node = todo.popleft()
+            if pruned and id(node) in pruned:
+                continue
+            todo.extend(iter_child_nodes(node))
+
+            handlers = dispatch.get(node.__class__)
+            if handlers is None:
+                handlers = resolve(node.__class__)
+            for handler in handlers:
+                handler(node)
+        pruned.clear()
+
+
+def _statement_children(node: ast.AST) -> List[ast.AST]:
+    return [child for child in ast.iter_child_nodes(node) if isinstance(child, STATEMENT_LEVEL)]
@@ -0,0 +1,110 @@
+"""
+Análise Incremental - Reaproveita resultados de definições que não mudaram
+"""
+
+import ast
+import hashlib
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+from .source import LineIndex
+
+
+FUNCTION_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+@dataclass
+class UnitState:
+    """
+    Resultado da análise de uma unidade (função, método ou resto do módulo)
+
+    As linhas são relativas à linha do ``def`` da unidade, para que uma
+    unidade inalterada possa ser reaproveitada mesmo quando muda de posição.
+    ``variables`` são as variáveis não usadas já resolvidas; as que ficam no
+    módulo ou em uma classe de nível de módulo (``open_variables``) só são
+    decididas ao combinar as unidades, com as leituras externas
+    (``escapes``) e os nomes ligados nessas classes (``bindings``).
+    """
+    digest: str
+    functions: List[Tuple[str, int]] = field(default_factory=list)
+    variables: List[Tuple[str, int]] = field(default_factory=list)
+    open_variables: List[Tuple[int, str, int]] = field(default_factory=list)
+    escapes: Dict[int, List[str]] = field(default_factory=dict)
+    bindings: Dict[int, List[str]] = field(default_factory=dict)
+    imports: List[Tuple[int, int, str]] = field(default_factory=list)
+    loads: Counter = field(default_factory=Counter)
+    issues: List = field(default_factory=list)
+    regions: List[Tuple[int, int]] = field(default_factory=list)
+    reachable: List[int] = field(default_factory=list)
+
+
+@dataclass
+class AnalysisState:
+    """
+    Estado de uma análise incremental, usado como base para a próxima
+
+    ``constants`` são as constantes do módulo usadas nas condições (veja
+    ``constants.ConstantEvaluator``); se mudarem, nada é reaproveitado.
+    """
+    units: Dict[str, List[UnitState]]
+    remainder: UnitState
+    loads: Counter
+    reanalyzed: int = 0
+    constants: Dict[str, Any] = field(default_factory=dict)
+
+
+def split_units(tree: ast.Module) -> List[Tuple[ast.AST, List[ast.stmt], int]]:
+    """
+    Localiza as definições de nível de módulo e de classe
+
+    Retorna trincas (nó, lista que o contém, índice na lista), na ordem do
+    código fonte.
+    """
+    units = []
+    for index, statement in enumerate(tree.body):
+        if isinstance(statement, FUNCTION_TYPES):
+            units.append((statement, tree.body, index))
+        elif isinstance(statement, ast.ClassDef):
+            for member_index, member in enumerate(statement.body):
+                if isinstance(member, FUNCTION_TYPES):
+                    units.append((member, statement.body, member_index))
+    return units
+
+
+def unit_span(node: ast.AST) -> Tuple[int, int]:
+    """Linhas ocupadas pela definição, incluindo decorators"""
+    start = min([decorator.lineno for decorator in node.decorator_list] + [node.lineno])
+    return start, node.end_lineno
+
+
+def unit_digest(lines: LineIndex, node: ast.AST) -> str:
+    start, end = unit_span(node)
+    digest = hashlib.sha1(f"{node.lineno - start}\0".encode())
+    digest.update(_as_bytes(lines.segment(start - 1, end)))
+    return digest.hexdigest()
+
+
+def detach_units(lines: LineIndex, units: List[Tuple[ast.AST, List[ast.stmt], int]]) -> str:
+    """
+    Troca cada unidade por um ``pass`` na mesma posição e calcula o hash do resto
+
+    O ``pass`` mantém as linhas da definição, de modo que a análise do resto
+    do módulo enxerga os mesmos blocos e intervalos que a análise completa.
+    """
+    digest = hashlib.sha1()
+    previous_end = 0
+
+    for node, body, index in units:
+        start, end = unit_span(node)
+        body[index] = ast.copy_location(ast.Pass(), node)
+        digest.update(_as_bytes(lines.segment(previous_end, start - 1)))
+        digest.update(f"\0{start}:{node.lineno}:{end}\0".encode())
+        previous_end = end
+
+    digest.update(_as_bytes(lines.segment(previous_end, len(lines))))
+    return digest.hexdigest()
+
+
+def _as_bytes(text) -> bytes:
+    return text.encode('utf-8', 'surrogatepass') if isinstance(text, str) else text
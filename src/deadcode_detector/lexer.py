@@ -1,92 +1,112 @@
 """
-Analisador Léxico - Tokenização do código Python
+Analisador Léxico - Tokenização do código Python em fluxo, sobre o módulo tokenize
 """
 
-import ast
-from typing import List, Tuple, Any
+import io
+import keyword
+import tokenize as _tokenize
+from typing import Iterator, List
 from dataclasses import dataclass
 from enum import Enum, auto
+from .records import slotted
+from .source import Text
 
 
 class TokenType(Enum):
     IDENTIFIER = auto()
     KEYWORD = auto()
     LITERAL = auto()
+    STRING = auto()
     OPERATOR = auto()
     DELIMITER = auto()
     COMMENT = auto()
     WHITESPACE = auto()
     NEWLINE = auto()
+    NL = auto()
+    INDENT = auto()
+    DEDENT = auto()
 
 
+@slotted
 @dataclass
 class Token:
     type: TokenType
     value: str
     line: int
     column: int
-    node: Any = None
+    end_line: int = 0
+
+
+DELIMITERS = frozenset(('(', ')', '[', ']', '{', '}', ',', ':', ';', '.', '->', '@'))
+
+# Tipos do tokenize que viram tokens; ENCODING e ENDMARKER são descartados
+_TYPES = {
+    _tokenize.NUMBER: TokenType.LITERAL,
+    _tokenize.STRING: TokenType.STRING,
+    _tokenize.COMMENT: TokenType.COMMENT,
+    _tokenize.NEWLINE: TokenType.NEWLINE,
+    _tokenize.NL: TokenType.NL,
+    _tokenize.INDENT: TokenType.INDENT,
+    _tokenize.DEDENT: TokenType.DEDENT,
+    _tokenize.ERRORTOKEN: TokenType.OPERATOR,
+}
+# Python 3.12+: f-strings chegam em partes
+for _name in ('FSTRING_START', 'FSTRING_MIDDLE', 'FSTRING_END'):
+    if hasattr(_tokenize, _name):
+        _TYPES[getattr(_tokenize, _name)] = TokenType.STRING
 
 
 class Lexer:
-    
+
     def __init__(self):
         self.tokens: List[Token] = []
-        
-    def tokenize(self, source_code: str) -> List[Token]:
+
+    def tokenize(self, source_code: Text) -> List[Token]:
         self.tokens = []
-        
+
         try:
-            tree = ast.parse(source_code)
-            self._extract_tokens(tree, source_code)
-            
+            self.tokens.extend(self.iter_tokens(source_code))
+
         except SyntaxError as e:
             print(f"Erro de sintaxe na linha {e.lineno}: {e.text}")
-            
+        except _tokenize.TokenError as e:
+            print(f"Erro de sintaxe na linha {e.args[1][0]}: {e.args[0]}")
+
         return self.tokens
-    
-    def _extract_tokens(self, tree: ast.AST, source_code: str):
-        for node in ast.walk(tree):
-            if hasattr(node, 'lineno') and hasattr(node, 'col_offset'):
-                token_type = self._get_token_type(node)
-                token_value = self._get_token_value(node, source_code)
-                
-                if token_value:
-                    token = Token(
-                        type=token_type,
-                        value=token_value,
-                        line=getattr(node, 'lineno', 0),
-                        column=getattr(node, 'col_offset', 0),
-                        node=node
-                    )
-                    self.tokens.append(token)
-    
-    def _get_token_type(self, node: ast.AST) -> TokenType:
-        if isinstance(node, ast.Name):
-            return TokenType.IDENTIFIER
-        elif isinstance(node, (ast.Constant, ast.Num, ast.Str)):
-            return TokenType.LITERAL
-        elif isinstance(node, ast.keyword):
-            return TokenType.KEYWORD
-        elif isinstance(node, ast.operator):
-            return TokenType.OPERATOR
-        else:
-            return TokenType.IDENTIFIER
-    
-    def _get_token_value(self, node: ast.AST, source_code: str) -> str:
-        if hasattr(node, 'id'):
-            return node.id
-        elif hasattr(node, 'value'):
-            return str(node.value)
-        elif hasattr(node, 'arg'):
-            return node.arg
-        elif hasattr(node, 'attr'):
-            return node.attr
+
+    def iter_tokens(self, source_code: Text) -> Iterator[Token]:
+        """
+        Gera os tokens um a um, em uma única passada do ``tokenize``
+
+        Inclui comentários, strings, operadores e as quebras de linha
+        lógicas (NEWLINE) e físicas (NL). Aceita ``str``, ``bytes`` ou
+        ``mmap``; em bytes a codificação vem da declaração (PEP 263). Erros
+        de tokenização chegam como ``SyntaxError`` ou ``tokenize.TokenError``.
+        """
+        if isinstance(source_code, str):
+            raw = _tokenize.generate_tokens(io.StringIO(source_code).readline)
+        elif isinstance(source_code, bytes):
+            raw = _tokenize.tokenize(io.BytesIO(source_code).readline)
         else:
-            return str(node.__class__.__name__)
-    
+            source_code.seek(0)
+            raw = _tokenize.tokenize(source_code.readline)
+
+        types = _TYPES
+        name, op = _tokenize.NAME, _tokenize.OP
+        is_keyword = keyword.iskeyword
+        for kind, value, (line, column), (end_line, _), _ in raw:
+            if kind == name:
+                token_type = TokenType.KEYWORD if is_keyword(value) else TokenType.IDENTIFIER
+            elif kind == op:
+                token_type = TokenType.DELIMITER if value in DELIMITERS else TokenType.OPERATOR
+            else:
+                token_type = types.get(kind)
+                if token_type is None:
+                    continue
+            yield Token(token_type, value, line, column, end_line)
+
     def get_keywords(self) -> List[str]:
         return [token.value for token in self.tokens if token.type == TokenType.KEYWORD]
-    
+
     def get_identifiers(self) -> List[str]:
-        return [token.value for token in self.tokens if token.type == TokenType.IDENTIFIER] 
\ No newline at end of file
+        return [token.value for token in self.tokens if token.type == TokenType.IDENTIFIER]
@@ -0,0 +1,327 @@
+"""
+Servidor LSP - Publica os problemas encontrados como diagnósticos no editor
+"""
+
+import hashlib
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple
+
+from . import __version__
+from .analyzer import DIAGNOSTICS, DeadCodeAnalyzer, DeadCodeIssue
+from .daemon import INVALID_REQUEST, METHOD_NOT_FOUND, PARSE_ERROR
+
+
+DEFAULT_DEBOUNCE = 0.3
+RESULTS_PER_DOCUMENT = 8
+
+SYNC_INCREMENTAL = 2
+SEVERITIES = {"error": 1, "warning": 2, "info": 3}
+UNNECESSARY = 1
+SERVER_NOT_INITIALIZED = -32002
+
+
+class Document:
+    """Texto atual de um documento aberto e os resultados já calculados para ele"""
+
+    def __init__(self, uri: str, text: str, version: int):
+        self.uri = uri
+        self.text = text
+        self.version = version
+        self.state = None
+        self.results: "OrderedDict[str, List[DeadCodeIssue]]" = OrderedDict()
+
+    def apply_change(self, change: Dict):
+        if 'range' not in change:
+            self.text = change['text']
+            return
+
+        start = _offset(self.text, change['range']['start'])
+        end = _offset(self.text, change['range']['end'])
+        self.text = self.text[:start] + change['text'] + self.text[end:]
+
+
+class LanguageServer:
+    """
+    Servidor da Language Server Protocol sobre ``DeadCodeAnalyzer``
+
+    Cada alteração só agenda a análise do documento para depois de
+    ``debounce`` segundos sem novas edições; uma edição que chega antes disso
+    substitui a anterior, que nunca chega a ser analisada. A análise roda em
+    uma thread própria, de modo que a leitura de mensagens do editor nunca
+    espera por ela, e um resultado calculado para uma versão já superada é
+    descartado em vez de publicado.
+    """
+
+    def __init__(self, write: Callable[[Dict], None], debounce: float = DEFAULT_DEBOUNCE,
+                 rules: Optional[Iterable[str]] = None):
+        self.write = write
+        self.debounce = debounce
+        self.analyzer = DeadCodeAnalyzer(rules=rules)
+        self.documents: Dict[str, Document] = {}
+        self.pending: Dict[str, float] = {}
+        self.analyses = 0
+        self.initialized = False
+        self.shutdown_requested = False
+        self.stopping = False
+        self.condition = threading.Condition()
+        self._worker = None
+
+    def start(self):
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def stop(self):
+        with self.condition:
+            self.stopping = True
+            self.condition.notify()
+        if self._worker is not None:
+            self._worker.join()
+
+    def handle(self, message: Dict) -> Optional[Dict]:
+        """Processa uma mensagem do cliente e devolve a resposta, se houver"""
+        method = message.get('method')
+        if not isinstance(method, str):
+            return _error(message.get('id'), INVALID_REQUEST, "Mensagem inválida")
+
+        is_request = 'id' in message
+        params = message.get('params') or {}
+
+        if method == 'initialize':
+            self.initialized = True
+            return _result(message['id'], {
+                'capabilities': {
+                    'textDocumentSync': {'openClose': True, 'change': SYNC_INCREMENTAL},
+                },
+                'serverInfo': {'name': 'deadcode-detector', 'version': __version__},
+            })
+        if method == 'exit':
+            self.stopping = True
+            return None
+        if not self.initialized:
+            if is_request:
+                return _error(message['id'], SERVER_NOT_INITIALIZED, "Servidor não inicializado")
+            return None
+
+        if method == 'shutdown':
+            self.shutdown_requested = True
+            return _result(message['id'], None)
+        if method == 'textDocument/didOpen':
+            document = params['textDocument']
+            self._open(document['uri'], document['text'], document.get('version', 0))
+        elif method == 'textDocument/didChange':
+            document = params['textDocument']
+            self._change(document['uri'], document.get('version'), params['contentChanges'])
+        elif method == 'textDocument/didClose':
+            self._close(params['textDocument']['uri'])
+        elif is_request:
+            return _error(message['id'], METHOD_NOT_FOUND, f"Método desconhecido: {method}")
+
+        return None
+
+    def _open(self, uri: str, text: str, version: int):
+        with self.condition:
+            self.documents[uri] = Document(uri, text, version)
+            self._schedule(uri)
+
+    def _change(self, uri: str, version: Optional[int], changes: List[Dict]):
+        with self.condition:
+            document = self.documents.get(uri)
+            if document is None:
+                return
+            for change in changes:
+                document.apply_change(change)
+            document.version = version if version is not None else document.version + 1
+            self._schedule(uri)
+
+    def _close(self, uri: str):
+        with self.condition:
+            self.documents.pop(uri, None)
+            self.pending.pop(uri, None)
+        self._publish(uri, [])
+
+    def _schedule(self, uri: str):
+        self.pending[uri] = time.monotonic() + self.debounce
+        self.condition.notify()
+
+    def _run(self):
+        while True:
+            with self.condition:
+                jobs = self._take_due(time.monotonic())
+                while not jobs and not self.stopping:
+                    timeout = min(self.pending.values()) - time.monotonic() if self.pending else None
+                    self.condition.wait(timeout)
+                    jobs = self._take_due(time.monotonic())
+                if self.stopping:
+                    return
+            for job in jobs:
+                self._analyze(*job)
+
+    def process_due(self, now: Optional[float] = None) -> int:
+        """Analisa na thread atual os documentos cujo prazo já venceu"""
+        with self.condition:
+            jobs = self._take_due(time.monotonic() if now is None else now)
+        for job in jobs:
+            self._analyze(*job)
+        return len(jobs)
+
+    def _take_due(self, now: float) -> List[Tuple[str, int, str, Any]]:
+        jobs = []
+        for uri, deadline in list(self.pending.items()):
+            if deadline <= now:
+                del self.pending[uri]
+                document = self.documents[uri]
+                jobs.append((uri, document.version, document.text, document.state))
+        return jobs
+
+    def _analyze(self, uri: str, version: int, text: str, state):
+        digest = hashlib.sha1(text.encode('utf-8', 'surrogatepass')).hexdigest()
+        with self.condition:
+            document = self.documents.get(uri)
+            issues = document.results.get(digest) if document is not None else None
+
+        if issues is None:
+            self.analyses += 1
+            issues = self.analyzer.analyze_incremental(text, state)
+            state = self.analyzer.state
+
+        with self.condition:
+            document = self.documents.get(uri)
+            if document is None:
+                return
+            document.state = state
+            document.results[digest] = issues
+            document.results.move_to_end(digest)
+            while len(document.results) > RESULTS_PER_DOCUMENT:
+                document.results.popitem(last=False)
+            if document.version != version or uri in self.pending:
+                return
+            lines = text.split('\n') if issues else []
+            self._publish(uri, [to_diagnostic(issue, lines) for issue in issues], version)
+
+    def _publish(self, uri: str, diagnostics: List[Dict], version: Optional[int] = None):
+        params = {'uri': uri, 'diagnostics': diagnostics}
+        if version is not None:
+            params['version'] = version
+        self.write({'jsonrpc': '2.0', 'method': 'textDocument/publishDiagnostics', 'params': params})
+
+
+def to_diagnostic(issue: DeadCodeIssue, lines: List[str]) -> Dict:
+    """Converte um problema em diagnóstico LSP cobrindo as linhas afetadas"""
+    last = len(lines) - 1
+    start = min(max(issue.line - 1, 0), last)
+    end = min(max(issue.end_line - 1, start), last)
+    end_character = _utf16_length(lines[end].rstrip('\r'))
+    if issue.column and issue.line - 1 == start:
+        # A coluna vem em bytes UTF-8; o LSP conta unidades UTF-16
+        prefix = lines[start].encode('utf-8', 'surrogatepass')[:issue.column]
+        start_character = _utf16_length(prefix.decode('utf-8', 'ignore'))
+    else:
+        # A indentação é só espaço em branco: uma unidade UTF-16 por caractere
+        start_character = len(lines[start]) - len(lines[start].lstrip(' \t\f'))
+
+    diagnostic = {
+        'range': {
+            'start': {'line': start, 'character': start_character},
+            'end': {'line': end, 'character': end_character},
+        },
+        'severity': SEVERITIES.get(issue.severity, SEVERITIES["warning"]),
+        'source': 'deadcode-detector',
+        'code': issue.type,
+        'message': issue.description,
+    }
+    # Erros da própria análise não são código desnecessário
+    if issue.type not in DIAGNOSTICS:
+        diagnostic['tags'] = [UNNECESSARY]
+    return diagnostic
+
+
+def read_message(stream: BinaryIO) -> Optional[Dict]:
+    """Lê uma mensagem com cabeçalho Content-Length; None no fim da entrada"""
+    length = None
+    while True:
+        header = stream.readline()
+        if not header:
+            return None
+        header = header.strip()
+        if not header:
+            break
+        name, _, value = header.decode('ascii').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value.strip())
+
+    if length is None:
+        raise ValueError("Mensagem sem Content-Length")
+    return json.loads(stream.read(length).decode('utf-8'))
+
+
+def write_message(stream: BinaryIO, message: Dict):
+    body = json.dumps(message, ensure_ascii=False).encode('utf-8')
+    stream.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+    stream.flush()
+
+
+def serve(stdin: Optional[BinaryIO] = None, stdout: Optional[BinaryIO] = None,
+          debounce: float = DEFAULT_DEBOUNCE, rules: Optional[Iterable[str]] = None) -> int:
+    """Atende o editor pela entrada/saída padrão; devolve o código de saída"""
+    stdin = stdin or sys.stdin.buffer
+    stdout = stdout or sys.stdout.buffer
+    write_lock = threading.Lock()
+
+    def write(message: Dict):
+        with write_lock:
+            write_message(stdout, message)
+
+    server = LanguageServer(write, debounce, rules)
+    server.start()
+    try:
+        while not server.stopping:
+            try:
+                message = read_message(stdin)
+            except ValueError:
+                write(_error(None, PARSE_ERROR, "Mensagem inválida"))
+                continue
+            if message is None:
+                break
+            response = server.handle(message)
+            if response is not None:
+                write(response)
+    finally:
+        server.stop()
+
+    return 0 if server.shutdown_requested else 1
+
+
+def _offset(text: str, position: Dict) -> int:
+    """Converte (linha, caractere UTF-16) em índice no texto"""
+    line = position['line']
+    index = 0
+    for _ in range(line):
+        newline = text.find('\n', index)
+        if newline < 0:
+            return len(text)
+        index = newline + 1
+
+    end = text.find('\n', index)
+    line_text = text[index:] if end < 0 else text[index:end]
+    units = position['character']
+    for i, char in enumerate(line_text):
+        if units <= 0:
+            return index + i
+        units -= 2 if ord(char) > 0xFFFF else 1
+    return index + len(line_text)
+
+
+def _utf16_length(text: str) -> int:
+    return len(text.encode('utf-16-le')) // 2
+
+
+def _result(request_id: Any, result: Any) -> Dict:
+    return {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+
+
+def _error(request_id: Any, code: int, message: str) -> Dict:
+    return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}}
@@ -1,108 +1,369 @@
 """
-Interface Principal - DeadCodeDetector CLI
+Interface Principal - Análise de arquivos e diretórios
 """
 
 import sys
-import argparse
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List
-
-from .analyzer import DeadCodeAnalyzer
-from .reporter import Reporter
-
-
-def main():
-    parser = argparse.ArgumentParser(
-        description="DeadCodeDetector - Analisador de código morto para Python",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Exemplos:
-  python -m deadcode_detector exemplo.py
-  python -m deadcode_detector exemplo.py --output relatorio.txt
-  python -m deadcode_detector exemplo.py --no-colors
-        """
-    )
-    
-    parser.add_argument(
-        'file',
-        help='Arquivo Python para analisar'
-    )
-    
-    parser.add_argument(
-        '--output', '-o',
-        help='Arquivo de saída para salvar o relatório'
-    )
-    
-    parser.add_argument(
-        '--no-colors',
-        action='store_true',
-        help='Desabilita cores na saída'
-    )
-    
-    parser.add_argument(
-        '--version',
-        action='version',
-        version='DeadCodeDetector 1.0.0'
-    )
-    
-    args = parser.parse_args()
-    
-    if not os.path.exists(args.file):
-        print(f"❌ Erro: Arquivo '{args.file}' não encontrado")
-        sys.exit(1)
-    
-    if not args.file.endswith('.py'):
-        print(f"⚠️  Aviso: Arquivo '{args.file}' não parece ser um arquivo Python")
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .analyzer import DeadCodeAnalyzer, DeadCodeIssue, IssueBatch
+from .cache import ResultCache
+from .changes import files_mentioning
+from .cli import main, run_daemon
+from .profiling import NULL_PROFILER, Profiler
+from .rules import select_rules
+from .source import load_source
+from .project import ModuleSymbols, SymbolCollector, SymbolIndex
+
+
+def collect_python_files(paths: List[str]) -> List[str]:
+    """Expande diretórios em arquivos .py, em ordem estável e sem repetições"""
+    files = []
+    seen = set()
     
-    try:
-        with open(args.file, 'r', encoding='utf-8') as f:
-            source_code = f.read()
+    for path in paths:
+        if os.path.isdir(path):
+            candidates = sorted(str(p) for p in Path(path).glob("**/*.py"))
+        else:
+            candidates = [path]
+        
+        for candidate in candidates:
+            key = os.path.realpath(candidate)
+            if key not in seen:
+                seen.add(key)
+                files.append(candidate)
+    
+    return files
+
+
+def analyze_files(files: List[str], jobs: Optional[int] = None,
+                  cache: Optional[ResultCache] = None,
+                  project: bool = False,
+                  profiler: Optional[Profiler] = None,
+                  max_memory: Optional[int] = None,
+                  rules: Optional[Iterable[str]] = None) -> Dict[str, List]:
+    """
+    Analisa vários arquivos em um pool de processos
+    
+    Os resultados são devolvidos na ordem de ``files``, independentemente
+    da ordem em que os processos terminam. Com ``cache``, arquivos cujo
+    conteúdo já foi analisado não passam de novo pelo analisador. Com
+    ``project``, cada arquivo também devolve seu resumo de símbolos, que
+    alimenta um ``SymbolIndex`` à medida que os resultados chegam; funções
+    referenciadas por outros arquivos deixam de ser reportadas como não usadas.
+    Com ``profiler``, os tempos por fase e por arquivo de cada processo são
+    somados nele. Com ``max_memory`` (bytes), arquivos cuja análise passaria
+    do limite não são analisados e recebem um problema 'memory_limit'.
+    ``rules`` restringe as regras executadas (veja ``rules.select_rules``);
+    o ``cache``, se houver, deve ter sido criado com as mesmas regras.
+    """
+    results, symbols = analyze_files_with_symbols(files, jobs, cache, project,
+                                                  profiler, max_memory, rules)
+    if project:
+        apply_project_references(results, symbols)
+    
+    return results
+
+
+def analyze_files_with_symbols(files: List[str], jobs: Optional[int] = None,
+                               cache: Optional[ResultCache] = None,
+                               project: bool = False,
+                               profiler: Optional[Profiler] = None,
+                               max_memory: Optional[int] = None,
+                               rules: Optional[Iterable[str]] = None
+                               ) -> Tuple[Dict[str, List], Dict[str, ModuleSymbols]]:
+    """
+    Como ``analyze_files``, mas sem aplicar as referências entre arquivos
+    
+    Devolve os problemas de cada arquivo e, com ``project``, os resumos de
+    símbolos, para quem mantém o projeto atualizado aos poucos (o modo
+    observação) e aplica ``apply_project_references`` por conta própria.
+    """
+    results = {}
+    symbols = {}
+    
+    for file_path, issues, file_symbols in _iter_analyzed(files, jobs, cache, project,
+                                                          profiler, max_memory, rules):
+        results[file_path] = issues
+        if file_symbols is not None:
+            symbols[file_path] = file_symbols
+    
+    return results, symbols
+
+
+def iter_files(files: List[str], jobs: Optional[int] = None,
+               cache: Optional[ResultCache] = None,
+               project: bool = False,
+               profiler: Optional[Profiler] = None,
+               max_memory: Optional[int] = None,
+               rules: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, DeadCodeIssue]]:
+    """
+    Versão em fluxo de ``analyze_files``: produz pares (arquivo, problema)
+    
+    Os problemas de cada arquivo saem assim que ele é analisado, na ordem
+    de ``files``, e nenhuma lista de resultados é mantida. Com ``project``,
+    apenas os problemas 'unused_function' esperam o fim da análise, pois só
+    então se sabe se algum outro arquivo referencia a função; eles saem por
+    último, e só eles e os resumos de símbolos ficam em memória.
+    """
+    index = SymbolIndex()
+    deferred = []
+    
+    for file_path, issues, file_symbols in _iter_analyzed(files, jobs, cache, project,
+                                                          profiler, max_memory, rules):
+        if file_symbols is not None:
+            index.add(file_path, file_symbols)
+        held = []
+        for issue in issues:
+            if project and issue.type == "unused_function":
+                held.append(issue)
+            else:
+                yield file_path, issue
+        if held:
+            deferred.append((file_path, held, file_symbols))
+    
+    for file_path, held, file_symbols in deferred:
+        referenced = index.referenced_lines(file_path, file_symbols)
+        for issue in held:
+            if issue.line not in referenced:
+                yield file_path, issue
+
+
+def analyze_changed(changed: List[str], roots: List[str],
+                    jobs: Optional[int] = None,
+                    cache: Optional[ResultCache] = None,
+                    project: bool = True,
+                    profiler: Optional[Profiler] = None,
+                    max_memory: Optional[int] = None,
+                    rules: Optional[Iterable[str]] = None) -> Dict[str, List]:
+    """
+    Analisa só os arquivos ``changed``, com os demais arquivos de ``roots`` como contexto
+    
+    Sem ``project`` equivale a ``analyze_files(changed)``. Com ele, uma
+    função dos arquivos alterados ainda pode ser usada por um arquivo que
+    não mudou. Só são consultados os arquivos que mencionam o nome de uma
+    função candidata ou de um módulo alterado (um ``git grep``, veja
+    ``changes.files_mentioning``; sem git, todos os de ``roots``), e seus
+    resumos de símbolos vêm do ``cache``: são analisados apenas na falta
+    da entrada, que então é gravada. Servem só para descartar
+    'unused_function'; seus problemas não são reportados.
+    """
+    results, symbols = analyze_files_with_symbols(changed, jobs, cache, project,
+                                                  profiler, max_memory, rules)
+    
+    index = SymbolIndex()
+    terms = set()
+    for file_path, file_symbols in symbols.items():
+        lines = {issue.line for issue in results[file_path] if issue.type == "unused_function"}
+        names = {name for name, line in file_symbols.functions if line in lines}
+        if names:
+            terms.update(names)
+            # ``from modulo import *`` usa as funções sem citar seus nomes
+            terms.add(index.module_name(file_path)[0].rpartition('.')[2] or "import")
+    if not terms:
+        return results
+    
+    with (profiler or NULL_PROFILER).phase('context'):
+        others = files_mentioning(terms, roots)
+        if others is None:
+            others = collect_python_files(roots)
+    changed_paths = {os.path.realpath(file_path) for file_path in changed}
+    others = [file_path for file_path in others
+              if os.path.realpath(file_path) not in changed_paths]
+    for file_path, _, file_symbols in _iter_analyzed(others, jobs, cache, True,
+                                                     profiler, max_memory, rules):
+        if file_symbols is not None:
+            symbols[file_path] = file_symbols
+    
+    apply_project_references(results, symbols)
+    return results
+
+
+def _iter_analyzed(files: List[str], jobs: Optional[int],
+                   cache: Optional[ResultCache],
+                   project: bool,
+                   profiler: Optional[Profiler] = None,
+                   max_memory: Optional[int] = None,
+                   rules: Optional[Iterable[str]] = None
+                   ) -> Iterator[Tuple[str, List, Optional[ModuleSymbols]]]:
+    """
+    Produz (arquivo, problemas, símbolos) na ordem de ``files``, usando o cache
+    
+    Resultados de arquivos barrados por ``max_memory`` dependem do limite e
+    não vão para o cache.
+    """
+    profiler = profiler or NULL_PROFILER
+    if rules is not None:
+        rules = select_rules(rules)
+        if cache is not None and cache.rules != tuple(sorted(rules)):
+            raise ValueError("o cache foi criado para outro conjunto de regras")
+    keys = {}
+    if cache is not None:
+        for file_path in files:
+            try:
+                with open(file_path, 'rb') as f:
+                    keys[file_path] = cache.key(f.read())
+            except OSError:
+                continue
+    
+    pending = [file_path for file_path in files
+               if file_path not in keys or not cache.contains(keys[file_path], project)]
+    scheduled = set(pending)
+    worker = _analyze_project_file if project else _analyze_file_or_none
+    if max_memory is not None or rules is not None:
+        worker = partial(worker, max_memory=max_memory, rules=rules)
+    if profiler.enabled:
+        worker = partial(_run_profiled, type(profiler), worker)
+    with _WorkerPool(worker, jobs, len(pending)) as pool:
+        computed = pool.map(pending)
         
-        analyzer = DeadCodeAnalyzer()
-        reporter = Reporter(use_colors=not args.no_colors)
+        for file_path in files:
+            key = keys.get(file_path)
+            with profiler.phase('cache'):
+                entry = cache.get_entry(key, need_symbols=project) if key is not None else None
+            if file_path in scheduled:
+                result = next(computed)
+            else:
+                # Entrada que sumiu ou está corrompida desde a verificação: também vai ao pool
+                result = None if entry is not None else pool.run(file_path)
+            if profiler.enabled and result is not None:
+                result, profile = result
+                profiler.merge(type(profiler).from_dict(profile))
         
-        print("🔍 Analisando código...")
-        issues = analyzer.analyze(source_code)
+            if entry is not None:
+                yield file_path, entry[0], ModuleSymbols.from_dict(entry[1]) if project else None
+                continue
+            if result is None:
+                yield file_path, [], None
+                continue
         
-        if args.output:
-            reporter.save_report(issues, args.output, args.file)
-            print(f"📄 Relatório salvo em: {args.output}")
-        else:
-            reporter.print_file_analysis(args.file, issues)
+            issues, symbols = result if project else (result, None)
+            if key is not None and not any(issue.type == "memory_limit" for issue in issues):
+                cache.put(key, issues, symbols.to_dict() if project else None)
+            yield file_path, issues, symbols
+
+
+def apply_project_references(results: Dict[str, List], symbols: Dict[str, ModuleSymbols]):
+    """Remove 'unused_function' de funções referenciadas por outros arquivos"""
+    index = SymbolIndex()
+    for file_path, file_symbols in symbols.items():
+        index.add(file_path, file_symbols)
+        
+    for file_path, file_symbols in symbols.items():
+        referenced = index.referenced_lines(file_path, file_symbols)
+        if referenced and file_path in results:
+            results[file_path] = [issue for issue in results[file_path]
+                                  if not (issue.type == "unused_function" and issue.line in referenced)]
+
+
+class _WorkerPool:
+    """
+    Executa ``worker`` por arquivo em um pool de processos, ou no próprio processo com um job
+    
+    ``map`` entrega os resultados na ordem dos arquivos, conforme ficam
+    prontos; ``run`` manda um arquivo avulso para o mesmo pool. Os processos
+    só são criados no primeiro envio. Use como gerenciador de contexto.
+    """
+    
+    def __init__(self, worker: Callable, jobs: Optional[int], size: int):
+        self.worker = worker
+        self.jobs = min(jobs or os.cpu_count() or 1, size)
+        self.executor: Optional[ProcessPoolExecutor] = None
+        if self.jobs > 1:
+            self.executor = ProcessPoolExecutor(max_workers=self.jobs)
+    
+    def map(self, files: List[str]) -> Iterator[Optional[Any]]:
+        if self.executor is None:
+            return map(self.worker, files)
+        chunksize = max(1, len(files) // (self.jobs * 4))
+        return self.executor.map(self.worker, files, chunksize=chunksize)
+    
+    def run(self, file_path: str) -> Optional[Any]:
+        if self.executor is None:
+            return self.worker(file_path)
+        return self.executor.submit(self.worker, file_path).result()
+    
+    def __enter__(self) -> "_WorkerPool":
+        return self
+    
+    def __exit__(self, *exc_info):
+        if self.executor is not None:
+            self.executor.shutdown()
+
+
+def analyze_file(file_path: str, use_colors: bool = True,
+                 rules: Optional[Iterable[str]] = None) -> List:
+    rules = select_rules(rules) if rules is not None else None
+    return _analyze_file_or_none(file_path, rules=rules) or []
+
+
+def _run_profiled(factory: Callable[[], Profiler], worker: Callable,
+                  file_path: str) -> Tuple[Any, Dict]:
+    """Executa ``worker`` com um perfil próprio, devolvido como dicionário ao processo pai"""
+    profiler = factory()
+    with profiler.file(file_path):
+        result = worker(file_path, profiler)
+    return result, profiler.to_dict()
+
+
+def _analyze_file_or_none(file_path: str, profiler: Optional[Profiler] = None,
+                          max_memory: Optional[int] = None,
+                          rules: Optional[Tuple[str, ...]] = None) -> Optional[List]:
+    try:
+        with (profiler or NULL_PROFILER).phase('read'):
+            source = load_source(file_path)
+        
+        with source:
+            analyzer = DeadCodeAnalyzer(profiler, max_memory, rules)
+            return analyzer.analyze(source.data)
         
-        if issues:
-            sys.exit(1)  
-        else:
-            sys.exit(0)  
-            
     except Exception as e:
-        print(f"❌ Erro durante a análise: {str(e)}")
-        sys.exit(1)
+        print(f"❌ Erro ao analisar {file_path}: {str(e)}", file=sys.stderr)
+        return None
 
 
-def analyze_file(file_path: str, use_colors: bool = True) -> List:
+def _analyze_project_file(file_path: str, profiler: Optional[Profiler] = None,
+                          max_memory: Optional[int] = None,
+                          rules: Optional[Tuple[str, ...]] = None
+                          ) -> Optional[Tuple[List, ModuleSymbols]]:
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            source_code = f.read()
+        with (profiler or NULL_PROFILER).phase('read'):
+            source = load_source(file_path)
         
-        analyzer = DeadCodeAnalyzer()
-        return analyzer.analyze(source_code)
+        with source:
+            analyzer = DeadCodeAnalyzer(profiler, max_memory, rules)
+            collector = SymbolCollector()
+            analyzer.register_collector(collector)
+            return analyzer.analyze(source.data), collector.result()
         
     except Exception as e:
-        print(f"❌ Erro ao analisar {file_path}: {str(e)}")
-        return []
+        print(f"❌ Erro ao analisar {file_path}: {str(e)}", file=sys.stderr)
+        return None
 
 
-def analyze_directory(directory: str, use_colors: bool = True) -> dict:
-    results = {}
+def analyze_directory(directory: str, use_colors: bool = True,
+                      jobs: Optional[int] = None,
+                      cache: Optional[ResultCache] = None,
+                      project: bool = True,
+                      batch: bool = False,
+                      rules: Optional[Iterable[str]] = None) -> Union[dict, IssueBatch]:
+    """
+    Analisa todos os arquivos .py de um diretório
+    
+    Devolve um dicionário arquivo -> lista de problemas ou, com ``batch``,
+    um ``IssueBatch`` colunar preenchido em fluxo a partir de ``iter_files``.
+    """
+    results = IssueBatch() if batch else {}
     directory_path = Path(directory)
     
     if not directory_path.exists():
         print(f"❌ Diretório '{directory}' não encontrado")
         return results
     
-    python_files = list(directory_path.glob("**/*.py"))
+    python_files = collect_python_files([directory])
     
     if not python_files:
         print(f"⚠️  Nenhum arquivo Python encontrado em '{directory}'")
@@ -110,11 +371,24 @@ def analyze_directory(directory: str, use_colors: bool = True) -> dict:
     
     print(f"🔍 Analisando {len(python_files)} arquivo(s) Python...")
     
-    for file_path in python_files:
-        issues = analyze_file(str(file_path), use_colors)
-        results[str(file_path)] = issues
+    if batch:
+        for file_path in python_files:
+            results.add_file(file_path)
+        for file_path, issue in iter_files(python_files, jobs=jobs, cache=cache, project=project,
+                                           rules=rules):
+            results.append(file_path, issue)
+        return results
     
-    return results
+    return analyze_files(python_files, jobs=jobs, cache=cache, project=project, rules=rules)
+
+
+def iter_directory(directory: str, jobs: Optional[int] = None,
+                   cache: Optional[ResultCache] = None,
+                   project: bool = True,
+                   rules: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, DeadCodeIssue]]:
+    """Versão em fluxo de ``analyze_directory``: pares (arquivo, problema), veja ``iter_files``"""
+    return iter_files(collect_python_files([directory]), jobs=jobs, cache=cache, project=project,
+                      rules=rules)
 
 
 if __name__ == "__main__":
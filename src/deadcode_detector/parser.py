@@ -3,10 +3,17 @@ Analisador Sintático - Análise da estrutura do código Python
 """
 
 import ast
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
+from .constants import ConstantEvaluator
+from .engine import TraversalEngine
+from .records import slotted
+from .scopes import CLOSED, ScopeBuilder, SymbolTable, VariableTable
+from .source import Text
 
 
+@slotted
 @dataclass
 class FunctionInfo:
     name: str
@@ -19,6 +26,7 @@ class FunctionInfo:
             self.calls = []
 
 
+@slotted
 @dataclass
 class VariableInfo:
     name: str
@@ -33,107 +41,153 @@ class Parser:
     
     Utiliza o módulo ast do Python para fazer a análise sintática,
     extraindo informações sobre funções, variáveis e estrutura do código.
+    Os nomes são internados em ``self.symbols``: funções são guardadas como
+    id -> linha e variáveis em tabelas por escopo (veja ``scopes``), e
+    ``FunctionInfo``/``VariableInfo`` só são criados para os resultados.
     """
     
     def __init__(self):
         self.tree: Optional[ast.AST] = None
-        self.functions: Dict[str, FunctionInfo] = {}
-        self.variables: Dict[str, VariableInfo] = {}
+        self.evaluator = ConstantEvaluator()
+        self.symbols = SymbolTable()
+        self.functions: Dict[int, int] = {}
+        self.unused_variables = VariableTable()
+        self.scope_builder: Optional[ScopeBuilder] = None
         self.imports: List[str] = []
         self.control_flow: List[Dict] = []
+        self.name_loads: Counter = Counter()
+        self.import_entries: List[Tuple[int, int, str]] = []
         
-    def parse(self, source_code: str) -> ast.AST:
+    def parse(self, source_code: Text) -> ast.AST:
        
+        self.build_tree(source_code)
+        self._analyze_structure()
+        self.resolve_usage()
+        return self.tree
+    
+    def build_tree(self, source_code: Text) -> ast.AST:
+        """
+        Constrói a AST sem percorrê-la, limpando o estado anterior
+        
+        Aceita ``str`` ou bytes; em bytes, o BOM e a declaração de
+        codificação (PEP 263) são respeitados pelo próprio ``ast.parse``.
+        ``self.evaluator`` passa a avaliar as condições desta árvore.
+        """
         try:
             self.tree = ast.parse(source_code)
-            self._analyze_structure()
-            return self.tree
         except SyntaxError as e:
-            raise ValueError(f"Erro de sintaxe na linha {e.lineno}: {e.text}")
+            raise ValueError(f"Erro de sintaxe na linha {e.lineno}: {e.text}") from e
+        
+        self.reset()
+        self.evaluator = ConstantEvaluator(self.tree)
+        return self.tree
     
-    def _analyze_structure(self):
-        if not self.tree:
-            return
-            
+    def reset(self):
+        self.symbols = SymbolTable()
         self.functions.clear()
-        self.variables.clear()
+        self.unused_variables = VariableTable()
+        self.scope_builder = None
         self.imports.clear()
         self.control_flow.clear()
+        self.name_loads.clear()
+        self.import_entries.clear()
+    
+    def resolve_usage(self):
+        """
+        Resolve usos a partir das contagens de leitura de nomes
         
-        for node in ast.walk(self.tree):
-            self._visit_node(node)
-    
-    def _visit_node(self, node: ast.AST):
-        if isinstance(node, ast.FunctionDef):
-            self._analyze_function_def(node)
-        elif isinstance(node, ast.Call):
-            self._analyze_function_call(node)
-        elif isinstance(node, ast.Assign):
-            self._analyze_assignment(node)
-        elif isinstance(node, ast.Name):
-            self._analyze_name_usage(node)
-        elif isinstance(node, ast.Import):
-            self._analyze_import(node)
-        elif isinstance(node, ast.ImportFrom):
-            self._analyze_import_from(node)
-        elif isinstance(node, ast.If):
-            self._analyze_if_statement(node)
-        elif isinstance(node, ast.Return):
-            self._analyze_return_statement(node)
+        O resultado não depende da ordem de visita dos nós, o que permite
+        combinar contagens de partes do módulo analisadas separadamente.
+        As variáveis são resolvidas pelos escopos, quando construídos.
+        """
+        if self.scope_builder is not None:
+            self.unused_variables = self.scope_builder.unused
+        
+        self.import_entries.sort(key=lambda entry: entry[:2])
+        self.imports = [name for _, _, name in self.import_entries]
+    
+    def register_handlers(self, engine: TraversalEngine):
+        """Registra a análise de estrutura no motor de travessia compartilhado"""
+        engine.register(ast.Module, self._analyze_module)
+        engine.register(ast.FunctionDef, self._analyze_function_def)
+        engine.register(ast.Import, self._analyze_import)
+        engine.register(ast.ImportFrom, self._analyze_import_from)
+        engine.register(ast.If, self._analyze_if_statement)
+        engine.register(ast.Return, self._analyze_return_statement)
     
-    def _analyze_function_def(self, node: ast.FunctionDef):
-        func_info = FunctionInfo(
-            name=node.name,
-            line=getattr(node, 'lineno', 0)
-        )
-        self.functions[node.name] = func_info
+    def _analyze_structure(self):
+        if not self.tree:
+            return
         
-        for arg in node.args.args:
-            var_info = VariableInfo(
-                name=arg.arg,
-                line=getattr(node, 'lineno', 0),
-                is_assigned=True
-            )
-            self.variables[arg.arg] = var_info
-    
-    def _analyze_function_call(self, node: ast.Call):
-        if isinstance(node.func, ast.Name):
-            func_name = node.func.id
-            if func_name in self.functions:
-                self.functions[func_name].is_called = True
-    
-    def _analyze_assignment(self, node: ast.Assign):
-        for target in node.targets:
-            if isinstance(target, ast.Name):
-                var_name = target.id
-                if var_name not in self.variables:
-                    self.variables[var_name] = VariableInfo(
-                        name=var_name,
-                        line=getattr(node, 'lineno', 0)
-                    )
-                self.variables[var_name].is_assigned = True
-    
-    def _analyze_name_usage(self, node: ast.Name):
-        name = node.id
+        engine = TraversalEngine()
+        self.register_handlers(engine)
+        engine.run(self.tree)
+    
+    def _analyze_module(self, node: ast.Module):
+        self.build_scopes(node)
+    
+    def build_scopes(self, node: ast.AST, enclosing: Tuple[int, ...] = ()):
+        """
+        Constrói os escopos e conta as leituras de nomes de ``node``
+        
+        Para uma unidade isolada (função ou método), ``enclosing`` lista os
+        tipos dos escopos que a envolvem, representados por stubs.
+        """
+        builder = ScopeBuilder(self.symbols, self.name_loads)
+        builder.build(node, enclosing)
+        self.scope_builder = builder
+    
+    def scope_summary(self) -> Tuple[List[Tuple[str, int]], List[Tuple[int, str, int]],
+                                     Dict[int, List[str]], Dict[int, List[str]]]:
+        """
+        Separa o resultado dos escopos no que ainda depende de outras unidades
         
-        if name in self.variables:
-            self.variables[name].is_used = True
+        Retorna (não usadas definitivas, abertas, leituras externas, ligações
+        de classe). Variáveis abertas, leituras externas e ligações são
+        indexadas pela chave do escopo (veja ``scopes.ScopeBuilder``).
+        """
+        builder = self.scope_builder
+        if builder is None:
+            return [], [], {}, {}
+        names = self.symbols.names
         
-        if isinstance(node.ctx, ast.Load):
-            if name in self.functions:
-                self.functions[name].is_called = True
+        unused, pending = [], []
+        for key, name, line in builder.unused:
+            if key == CLOSED:
+                unused.append((names[name], line))
+            else:
+                pending.append((key, names[name], line))
+        
+        escapes = {key: sorted(names[name] for name in loaded)
+                   for key, loaded in builder.escapes.items()}
+        bindings = {key: sorted(names[name] for name in bound)
+                    for key, bound in builder.bindings.items()}
+        return unused, pending, escapes, bindings
+    
+    def _analyze_function_def(self, node: ast.FunctionDef):
+        self.define_function(node.name, getattr(node, 'lineno', 0))
+    
+    def define_function(self, name: str, line: int):
+        """Registra uma função; entre homônimas vale a última definição"""
+        symbol = self.symbols.intern(name)
+        if line >= self.functions.get(symbol, line):
+            self.functions[symbol] = line
+    
+    def function_entries(self) -> List[Tuple[str, int]]:
+        names = self.symbols.names
+        return [(names[symbol], line) for symbol, line in self.functions.items()]
     
     def _analyze_import(self, node: ast.Import):
         for alias in node.names:
-            self.imports.append(alias.name)
+            self.import_entries.append((node.lineno, node.col_offset, alias.name))
     
     def _analyze_import_from(self, node: ast.ImportFrom):
         module = node.module or ""
         for alias in node.names:
-            self.imports.append(f"{module}.{alias.name}")
+            self.import_entries.append((node.lineno, node.col_offset, f"{module}.{alias.name}"))
     
     def _analyze_if_statement(self, node: ast.If):
-        if self._is_always_false(node.test):
+        if self.evaluator.is_always_false(node.test):
             self.control_flow.append({
                 'type': 'always_false_condition',
                 'line': getattr(node, 'lineno', 0),
@@ -146,29 +200,20 @@ class Parser:
             'line': getattr(node, 'lineno', 0)
         })
     
-    def _is_always_false(self, test: ast.expr) -> bool:
-        if isinstance(test, ast.Constant):
-            return test.value is False
-        elif isinstance(test, ast.Compare):
-            if len(test.ops) == 1 and len(test.comparators) == 1:
-                op = test.ops[0]
-                left = test.left
-                right = test.comparators[0]
-                
-                if isinstance(op, ast.Eq):
-                    if isinstance(left, ast.Constant) and isinstance(right, ast.Constant):
-                        return left.value != right.value
-                elif isinstance(op, ast.NotEq):
-                    if isinstance(left, ast.Constant) and isinstance(right, ast.Constant):
-                        return left.value == right.value
-        return False
-    
     def get_unused_functions(self) -> List[FunctionInfo]:
-        return [func for func in self.functions.values() if not func.is_called]
+        loads = self.name_loads
+        names = self.symbols.names
+        return [FunctionInfo(name=names[symbol], line=line)
+                for symbol, line in self.functions.items() if names[symbol] not in loads]
     
     def get_unused_variables(self) -> List[VariableInfo]:
-        return [var for var in self.variables.values() 
-                if var.is_assigned and not var.is_used]
+        names = self.symbols.names
+        return [VariableInfo(name=names[symbol], line=line, is_assigned=True)
+                for _, symbol, line in self.unused_variables]
     
     def get_unused_imports(self) -> List[str]:
-        return self.imports.copy() 
\ No newline at end of file
+        return self.imports.copy() 
+    
+    def get_unused_import_entries(self) -> List[Tuple[int, int, str]]:
+        """Como ``get_unused_imports``, com linha e coluna de cada import"""
+        return self.import_entries.copy()
\ No newline at end of file
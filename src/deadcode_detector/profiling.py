@@ -0,0 +1,233 @@
+"""
+Perfil de Execução - Tempo ou pico de memória por fase, por detector e por arquivo
+"""
+
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class Profiler:
+    """
+    Registro de tempos acumulados por fase e por arquivo
+
+    As fases são nomes livres (``parse``, ``traversal``, ``detect/...``);
+    cada uma acumula segundos e número de chamadas. Os handlers da travessia
+    são medidos individualmente com ``timed``, e os detectores, que são
+    geradores, com ``timed_iter``, que desconta o tempo gasto por quem
+    consome os problemas. Perfis de processos diferentes são combinados com
+    ``merge`` a partir de ``to_dict``.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.files: Dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float, calls: int = 1):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+        self.calls[phase] = self.calls.get(phase, 0) + calls
+
+    def add_file(self, file_path: str, seconds: float):
+        self.files[file_path] = self.files.get(file_path, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, perf_counter() - start)
+
+    @contextmanager
+    def file(self, file_path: str) -> Iterator[None]:
+        """Mede toda a análise de ``file_path``"""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add_file(file_path, perf_counter() - start)
+
+    def timed(self, name: str, function: Callable) -> Callable:
+        """Envolve ``function`` para acumular o tempo de cada chamada em ``name``"""
+        add = self.add
+
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                add(name, perf_counter() - start)
+
+        return wrapper
+
+    def timed_iter(self, name: str, iterable: Iterable) -> Iterator:
+        """Mede só o tempo gasto produzindo os itens de ``iterable``"""
+        iterator = iter(iterable)
+        elapsed = 0.0
+        try:
+            while True:
+                start = perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    elapsed += perf_counter() - start
+                    return
+                elapsed += perf_counter() - start
+                yield item
+        finally:
+            self.add(name, elapsed)
+
+    def merge(self, other: "Profiler"):
+        for phase, seconds in other.phases.items():
+            self.add(phase, seconds, other.calls.get(phase, 0))
+        for file_path, seconds in other.files.items():
+            self.add_file(file_path, seconds)
+
+    def top_phases(self, limit: Optional[int] = None) -> List[Tuple[str, float, int]]:
+        """Fases em ordem decrescente de tempo: (nome, segundos, chamadas)"""
+        rows = sorted(self.phases.items(), key=lambda item: (-item[1], item[0]))
+        return [(phase, seconds, self.calls.get(phase, 0)) for phase, seconds in rows[:limit]]
+
+    def slowest_files(self, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        return sorted(self.files.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+    def to_dict(self) -> Dict:
+        return {'phases': self.phases, 'calls': self.calls, 'files': self.files}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Profiler":
+        profiler = cls()
+        profiler.phases = dict(data['phases'])
+        profiler.calls = dict(data['calls'])
+        profiler.files = dict(data['files'])
+        return profiler
+
+
+class MemoryProfiler(Profiler):
+    """
+    Pico de memória alocada (``tracemalloc``) por fase e por arquivo, em bytes
+
+    Cada fase registra o maior pico acima da memória em uso quando começou;
+    ``merge`` fica com o maior valor em vez de somar. Fases aninhadas são
+    suportadas: o pico de uma fase interna conta também para a externa. Os
+    handlers da travessia não são medidos um a um. ``peak`` é o maior pico
+    absoluto visto. Sem ``tracemalloc.reset_peak`` (Python 3.8) mede-se só o
+    crescimento líquido de cada fase.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.peak = 0
+        self._frames: List[List[int]] = []
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def add(self, phase: str, size: float, calls: int = 1):
+        self.phases[phase] = max(self.phases.get(phase, 0), size)
+        self.calls[phase] = self.calls.get(phase, 0) + calls
+
+    def add_file(self, file_path: str, size: float):
+        self.files[file_path] = max(self.files.get(file_path, 0), size)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        self._enter()
+        try:
+            yield
+        finally:
+            self.add(name, self._exit())
+
+    @contextmanager
+    def file(self, file_path: str) -> Iterator[None]:
+        self._enter()
+        try:
+            yield
+        finally:
+            self.add_file(file_path, self._exit())
+
+    def timed(self, name: str, function: Callable) -> Callable:
+        return function
+
+    def timed_iter(self, name: str, iterable: Iterable) -> Iterator:
+        iterator = iter(iterable)
+        peak = 0
+        try:
+            while True:
+                self._enter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    peak = max(peak, self._exit())
+                yield item
+        finally:
+            self.add(name, peak)
+
+    def merge(self, other: "Profiler"):
+        super().merge(other)
+        self.peak = max(self.peak, getattr(other, 'peak', 0))
+
+    def to_dict(self) -> Dict:
+        data = super().to_dict()
+        data['peak'] = self.peak
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "MemoryProfiler":
+        profiler = super().from_dict(data)
+        profiler.peak = data.get('peak', 0)
+        return profiler
+
+    def _enter(self):
+        current, peak = tracemalloc.get_traced_memory()
+        if self._frames:
+            self._frames[-1][1] = max(self._frames[-1][1], peak)
+        if _RESET_PEAK is not None:
+            _RESET_PEAK()
+            peak = current
+        self._frames.append([current, peak])
+
+    def _exit(self) -> int:
+        start, seen = self._frames.pop()
+        current, peak = tracemalloc.get_traced_memory()
+        if _RESET_PEAK is None:
+            return max(0, current - start)
+        peak = max(peak, seen)
+        if self._frames:
+            self._frames[-1][1] = max(self._frames[-1][1], peak)
+        self.peak = max(self.peak, peak)
+        return peak - start
+
+
+class NullProfiler:
+    """Perfil desligado: a mesma interface, sem medir nada"""
+
+    enabled = False
+
+    def add(self, phase: str, seconds: float, calls: int = 1):
+        pass
+
+    def add_file(self, file_path: str, seconds: float):
+        pass
+
+    def phase(self, name: str):
+        return _NULL_CONTEXT
+
+    def file(self, file_path: str):
+        return _NULL_CONTEXT
+
+    def timed(self, name: str, function: Callable) -> Callable:
+        return function
+
+    def timed_iter(self, name: str, iterable: Iterable) -> Iterable:
+        return iterable
+
+
+_RESET_PEAK = getattr(tracemalloc, 'reset_peak', None)
+_NULL_CONTEXT = nullcontext()
+NULL_PROFILER = NullProfiler()
@@ -0,0 +1,192 @@
+"""
+Índice de Símbolos do Projeto - Referências entre arquivos para funções não usadas
+"""
+
+import ast
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from .engine import TraversalEngine
+
+
+FUNCTION_DEFS = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+@dataclass
+class ModuleSymbols:
+    """
+    Resumo de um arquivo para o índice do projeto
+
+    As referências são guardadas como (nível, módulo, nome), com o nível de
+    ``from . import`` ainda não resolvido, de modo que o resumo depende apenas
+    do conteúdo do arquivo e pode ser guardado no cache de resultados.
+    """
+    functions: List[Tuple[str, int]] = field(default_factory=list)
+    references: List[Tuple[int, str, str]] = field(default_factory=list)
+    star_imports: List[Tuple[int, str]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return {
+            'functions': self.functions,
+            'references': self.references,
+            'star_imports': self.star_imports,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ModuleSymbols":
+        return cls(
+            functions=[tuple(item) for item in data['functions']],
+            references=[tuple(item) for item in data['references']],
+            star_imports=[tuple(item) for item in data['star_imports']],
+        )
+
+
+class SymbolCollector:
+    """
+    Extrai definições e referências de um arquivo durante a travessia única
+
+    Registra-se no mesmo ``TraversalEngine`` do analisador, como o Parser.
+    São referências os nomes trazidos por ``from x import y`` e os acessos
+    ``modulo.atributo`` em que ``modulo`` foi ligado por um import do arquivo.
+    """
+
+    def __init__(self):
+        self.functions: List[Tuple[str, int]] = []
+        self.references: List[Tuple[int, str, str]] = []
+        self.star_imports: List[Tuple[int, str]] = []
+        self.bindings: Dict[str, Tuple[int, str]] = {}
+        self.chains: List[Tuple[str, str, str]] = []
+
+    def register_handlers(self, engine: TraversalEngine):
+        engine.register(ast.Module, self._visit_module)
+        engine.register(ast.Import, self._visit_import)
+        engine.register(ast.ImportFrom, self._visit_import_from)
+        engine.register(ast.Attribute, self._visit_attribute)
+
+    def _visit_module(self, node: ast.Module):
+        for statement in node.body:
+            if isinstance(statement, FUNCTION_DEFS):
+                self.functions.append((statement.name, statement.lineno))
+
+    def _visit_import(self, node: ast.Import):
+        for alias in node.names:
+            if alias.asname:
+                self.bindings[alias.asname] = (0, alias.name)
+            else:
+                root = alias.name.split('.', 1)[0]
+                self.bindings[root] = (0, root)
+
+    def _visit_import_from(self, node: ast.ImportFrom):
+        module = node.module or ""
+        for alias in node.names:
+            if alias.name == '*':
+                self.star_imports.append((node.level, module))
+                continue
+            self.references.append((node.level, module, alias.name))
+            submodule = f"{module}.{alias.name}" if module else alias.name
+            self.bindings[alias.asname or alias.name] = (node.level, submodule)
+
+    def _visit_attribute(self, node: ast.Attribute):
+        parts = []
+        value = node.value
+        while isinstance(value, ast.Attribute):
+            parts.append(value.attr)
+            value = value.value
+        if isinstance(value, ast.Name):
+            self.chains.append((value.id, '.'.join(reversed(parts)), node.attr))
+
+    def result(self) -> ModuleSymbols:
+        """Resolve os acessos por atributo contra os imports do arquivo"""
+        references = list(self.references)
+        for root, path, attr in self.chains:
+            binding = self.bindings.get(root)
+            if binding is None:
+                continue
+            level, module = binding
+            references.append((level, f"{module}.{path}" if path else module, attr))
+        return ModuleSymbols(self.functions, references, self.star_imports)
+
+
+class SymbolIndex:
+    """
+    Índice das referências de todos os arquivos do projeto
+
+    Alimentado arquivo a arquivo com ``add``, em uma única passada; cada
+    referência é resolvida para o nome qualificado ``pacote.modulo.funcao`` e
+    contada em um dicionário, de modo que ``references`` é O(1) e o custo
+    total é linear no tamanho do projeto.
+    """
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.star_modules: Set[str] = set()
+        self._modules: Dict[str, Tuple[str, bool]] = {}
+        self._packages: Dict[str, Optional[str]] = {}
+
+    def add(self, file_path: str, symbols: ModuleSymbols):
+        module, is_package = self.module_name(file_path)
+        self._modules[file_path] = (module, is_package)
+
+        for level, target, name in symbols.references:
+            resolved = _resolve(module, is_package, level, target)
+            if resolved is not None:
+                self.counts[f"{resolved}.{name}" if resolved else name] += 1
+        for level, target in symbols.star_imports:
+            resolved = _resolve(module, is_package, level, target)
+            if resolved is not None:
+                self.star_modules.add(resolved)
+
+    def references(self, qualified_name: str) -> int:
+        return self.counts.get(qualified_name, 0)
+
+    def is_referenced(self, qualified_name: str) -> bool:
+        if qualified_name in self.counts:
+            return True
+        return qualified_name.rpartition('.')[0] in self.star_modules
+
+    def referenced_lines(self, file_path: str, symbols: ModuleSymbols) -> Set[int]:
+        """Linhas das funções do arquivo referenciadas por algum outro arquivo"""
+        module, _ = self._modules.get(file_path) or self.module_name(file_path)
+        return {line for name, line in symbols.functions
+                if self.is_referenced(f"{module}.{name}")}
+
+    def module_name(self, file_path: str) -> Tuple[str, bool]:
+        """Nome do módulo, subindo pelos diretórios que têm ``__init__.py``"""
+        directory, filename = os.path.split(os.path.abspath(file_path))
+        stem = os.path.splitext(filename)[0]
+        package = self._package_name(directory)
+        if stem == '__init__':
+            return package or "", True
+        return f"{package}.{stem}" if package else stem, False
+
+    def _package_name(self, directory: str) -> Optional[str]:
+        if directory in self._packages:
+            return self._packages[directory]
+
+        if os.path.isfile(os.path.join(directory, '__init__.py')):
+            parent, name = os.path.split(directory)
+            outer = self._package_name(parent) if parent != directory else None
+            package = f"{outer}.{name}" if outer else name
+        else:
+            package = None
+        self._packages[directory] = package
+        return package
+
+
+def _resolve(module: str, is_package: bool, level: int, target: str) -> Optional[str]:
+    """Converte um import relativo em nome absoluto do módulo"""
+    if level == 0:
+        return target
+
+    parts = module.split('.') if module else []
+    if not is_package:
+        parts = parts[:-1]
+    if level - 1 > len(parts):
+        return None
+    if level > 1:
+        parts = parts[:len(parts) - (level - 1)]
+    if target:
+        parts.append(target)
+    return '.'.join(parts)
@@ -0,0 +1,24 @@
+"""
+Registros Compactos - Dataclasses sem ``__dict__`` por instância
+"""
+
+from dataclasses import fields
+
+
+def slotted(cls: type) -> type:
+    """
+    Recria uma dataclass com ``__slots__``, como ``dataclass(slots=True)``
+
+    Disponível também no Python 3.8 e 3.9. Os valores padrão continuam nos
+    parâmetros do ``__init__`` gerado; só os atributos de classe que os
+    guardavam, incompatíveis com ``__slots__``, são removidos. Deve ser
+    aplicado por fora de ``@dataclass``.
+    """
+    names = tuple(field.name for field in fields(cls))
+    namespace = {key: value for key, value in cls.__dict__.items()
+                 if key not in names and key not in ('__dict__', '__weakref__')}
+    namespace['__slots__'] = names
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
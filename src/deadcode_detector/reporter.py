@@ -2,12 +2,52 @@
 Gerador de Relatórios - Saída formatada dos problemas encontrados
 """
 
+import json
 import os
-from typing import List, Dict
-from colorama import Fore, Back, Style, init
-from .analyzer import DeadCodeIssue
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple
+from urllib.parse import quote
+from . import __version__
+from .analyzer import DeadCodeIssue, DIAGNOSTICS, RULES
 
-init(autoreset=True)
+OUTPUT_BUFFER_SIZE = 64 * 1024
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_RULES = RULES + DIAGNOSTICS
+
+
+class _LazyColors:
+    """
+    Substituto de ``colorama.Fore``/``colorama.Style`` carregado no primeiro uso
+    
+    Importar o relatório não carrega o colorama nem chama ``init``; isso só
+    acontece quando alguma cor é de fato usada. Cada código é guardado na
+    instância depois do primeiro acesso.
+    """
+    
+    def __init__(self, group: str):
+        self._group = group
+    
+    def __getattr__(self, name: str) -> str:
+        value = getattr(getattr(_colorama(), self._group), name)
+        setattr(self, name, value)
+        return value
+
+
+_colorama_module = None
+
+
+def _colorama():
+    global _colorama_module
+    if _colorama_module is None:
+        import colorama
+        colorama.init(autoreset=True)
+        _colorama_module = colorama
+    return _colorama_module
+
+
+Fore = _LazyColors('Fore')
+Style = _LazyColors('Style')
 
 
 class Reporter:
@@ -93,11 +133,101 @@ class Reporter:
             'always_false_condition': 'Condição sempre falsa',
             'code_after_return': 'Código após return',
             'unreachable_code': 'Código inalcançável',
-            'parse_error': 'Erro de análise'
+            'parse_error': 'Erro de análise',
+            'memory_limit': 'Limite de memória excedido'
         }
         return names.get(issue_type, issue_type)
     
     def save_report(self, issues: List[DeadCodeIssue], output_file: str, source_file: str = None):
+        self._write_to_file(output_file, lambda: self.print_report(issues, source_file))
+    
+    def save_results(self, results: Dict[str, List[DeadCodeIssue]], output_file: str):
+        def write_all():
+            for source_file, issues in results.items():
+                self.print_report(issues, source_file)
+        
+        self._write_to_file(output_file, write_all)
+    
+    def print_stream(self, issues: Iterable[Tuple[str, DeadCodeIssue]]) -> int:
+        """
+        Imprime cada problema assim que chega, no formato ``arquivo:linha: [tipo] descrição``
+        
+        Não guarda os problemas: consome pares (arquivo, problema), como os de
+        ``main.iter_files``, e devolve quantos foram impressos.
+        """
+        total = 0
+        for file_path, issue in issues:
+            total += 1
+            location = f"{file_path}:{issue.line}"
+            if self.use_colors:
+                print(f"{Fore.CYAN}{location}:{Style.RESET_ALL} "
+                      f"{Fore.RED}[{issue.type}]{Style.RESET_ALL} {issue.description}", flush=True)
+            else:
+                print(f"{location}: [{issue.type}] {issue.description}", flush=True)
+        
+        if self.use_colors:
+            print(f"{Fore.YELLOW}📊 Total: {total} problema(s) encontrado(s){Style.RESET_ALL}")
+        else:
+            print(f"📊 Total: {total} problema(s) encontrado(s)")
+        return total
+    
+    def save_stream(self, issues: Iterable[Tuple[str, DeadCodeIssue]], output_file: str) -> int:
+        totals = []
+        self._write_to_file(output_file, lambda: totals.append(self.print_stream(issues)))
+        return totals[0]
+    
+    def write_sarif(self, issues: Iterable[Tuple[str, DeadCodeIssue]], stream: TextIO) -> int:
+        """
+        Escreve um relatório SARIF 2.1.0 a partir de pares (arquivo, problema)
+        
+        Cada tipo de problema vira uma regra com o próprio nome como id
+        estável. O documento é escrito em partes pelo buffer de ``stream``:
+        o cabeçalho com as regras e depois um resultado por vez, montado a
+        partir de fragmentos fixos em que só os textos passam pelo codificador
+        JSON, de modo que nem os resultados nem o JSON completo ficam em
+        memória. Devolve o número de resultados escritos.
+        """
+        encode = json.JSONEncoder(ensure_ascii=False).encode
+        write = stream.write
+        driver = {
+            'name': 'DeadCodeDetector',
+            'version': __version__,
+            'rules': [{
+                'id': rule,
+                'name': ''.join(part.capitalize() for part in rule.split('_')),
+                'shortDescription': {'text': self._get_type_display_name(rule)},
+                'defaultConfiguration': {'level': 'error' if rule == 'parse_error' else 'warning'},
+            } for rule in SARIF_RULES],
+        }
+        
+        write(f'{{"$schema":{encode(SARIF_SCHEMA)},"version":"2.1.0","runs":[{{')
+        write(f'"tool":{{"driver":{encode(driver)}}},"results":[')
+        
+        rules = {rule: f'"ruleId":{encode(rule)},"ruleIndex":{index}'
+                 for index, rule in enumerate(SARIF_RULES)}
+        locations: Dict[str, str] = {}
+        total = 0
+        for file_path, issue in issues:
+            rule = rules.get(issue.type) or f'"ruleId":{encode(issue.type)}'
+            location = locations.get(file_path)
+            if location is None:
+                uri = encode(_artifact_uri(file_path))
+                location = locations[file_path] = f'"artifactLocation":{{"uri":{uri}}}'
+            if issue.line > 0:
+                region = f',"region":{{"startLine":{issue.line},"endLine":{max(issue.line, issue.end_line)}}}'
+            else:
+                region = ''
+            level = 'error' if issue.severity == 'error' else 'warning'
+            write(f'{"," if total else ""}{{{rule},"level":"{level}",'
+                  f'"message":{{"text":{encode(issue.description)}}},'
+                  f'"locations":[{{"physicalLocation":{{{location}{region}}}}}]}}')
+            total += 1
+        
+        write(']}]}\n')
+        stream.flush()
+        return total
+    
+    def _write_to_file(self, output_file: str, write):
         with open(output_file, 'w', encoding='utf-8') as f:
             original_use_colors = self.use_colors
             self.use_colors = False
@@ -107,7 +237,7 @@ class Reporter:
             sys.stdout = f
             
             try:
-                self.print_report(issues, source_file)
+                write()
             finally:
                 sys.stdout = original_stdout
                 self.use_colors = original_use_colors
@@ -122,11 +252,15 @@ class Reporter:
         print("Opções:")
         print("  --output arquivo.txt    Salva relatório em arquivo")
         print("  --no-colors            Desabilita cores na saída")
+        print("  --jobs N               Número de processos paralelos")
+        print("  --stream               Mostra cada problema assim que é encontrado")
+        print("  --watch                Reanalisa continuamente os arquivos alterados")
         print("  --help                 Mostra esta ajuda")
         print()
         print("Exemplos:")
         print("  python -m deadcode_detector exemplo.py")
         print("  python -m deadcode_detector exemplo.py --output relatorio.txt")
+        print("  python -m deadcode_detector src/ --jobs 4")
         print()
         print("Tipos de problemas detectados:")
         print("  • Funções definidas mas nunca chamadas")
@@ -147,4 +281,116 @@ class Reporter:
         else:
             print(f"{Fore.GREEN}✅ Nenhum problema encontrado{Style.RESET_ALL}")
         
-        self.print_report(issues, file_name) 
\ No newline at end of file
+        self.print_report(issues, file_name)
+    
+    def print_changes(self, file_path: str, added: List[DeadCodeIssue], resolved: List[DeadCodeIssue]):
+        if self.use_colors:
+            print(f"\n{Fore.CYAN}🔄 {file_path}{Style.RESET_ALL}")
+        else:
+            print(f"\n🔄 {file_path}")
+        
+        for issue in added:
+            line_info = f"Linha {issue.line}" if issue.line > 0 else "Arquivo"
+            if self.use_colors:
+                print(f"   {Fore.RED}+ {line_info}:{Style.RESET_ALL} {issue.description}")
+            else:
+                print(f"   + {line_info}: {issue.description}")
+        
+        for issue in resolved:
+            line_info = f"Linha {issue.line}" if issue.line > 0 else "Arquivo"
+            if self.use_colors:
+                print(f"   {Fore.GREEN}- {line_info}:{Style.RESET_ALL} {issue.description}")
+            else:
+                print(f"   - {line_info}: {issue.description}")
+    
+    def print_profile(self, profiler, elapsed: float, limit: int = 10,
+                      stream: Optional[TextIO] = None):
+        """
+        Imprime as fases mais caras e os arquivos mais lentos de um ``Profiler``
+        
+        ``elapsed`` é o tempo total da execução; as porcentagens são relativas
+        a ele. Com vários processos as fases somam o tempo de todos e podem
+        passar de 100%.
+        """
+        title = f"⏱️  Perfil: {elapsed:.3f} s no total"
+        if self.use_colors:
+            title = f"{Fore.CYAN}{title}{Style.RESET_ALL}"
+        print(f"\n{title}", file=stream)
+        print(f"   {'Fase':<48} {'Tempo':>10} {'%':>7} {'Chamadas':>9}", file=stream)
+        for phase, seconds, calls in profiler.top_phases(limit):
+            share = seconds / elapsed * 100 if elapsed else 0.0
+            print(f"   {phase:<48} {seconds:>8.3f} s {share:>6.1f}% {calls:>9}", file=stream)
+        
+        files = profiler.slowest_files(limit)
+        if files:
+            print("\n🐢 Arquivos mais lentos", file=stream)
+            for file_path, seconds in files:
+                print(f"   {seconds:>8.3f} s  {file_path}", file=stream)
+    
+    def print_memory_report(self, profiler, limit: int = 10,
+                            stream: Optional[TextIO] = None):
+        """
+        Imprime os picos de memória de um ``MemoryProfiler`` por fase e por arquivo
+        
+        Cada valor é o pico acima da memória já em uso quando a fase (ou o
+        arquivo) começou; com vários processos vale o maior entre eles.
+        """
+        title = f"🧠 Memória: pico de {_mebibytes(profiler.peak)} por processo"
+        if self.use_colors:
+            title = f"{Fore.CYAN}{title}{Style.RESET_ALL}"
+        print(f"\n{title}", file=stream)
+        print(f"   {'Fase':<48} {'Pico':>12} {'Chamadas':>9}", file=stream)
+        for phase, size, calls in profiler.top_phases(limit):
+            print(f"   {phase:<48} {_mebibytes(size):>12} {calls:>9}", file=stream)
+        
+        files = profiler.slowest_files(limit)
+        if files:
+            print("\n🐘 Arquivos que mais alocam", file=stream)
+            for file_path, size in files:
+                print(f"   {_mebibytes(size):>12}  {file_path}", file=stream)
+
+
+def write_ndjson(issues: Iterable[Tuple[str, DeadCodeIssue]], stream: TextIO) -> int:
+    """
+    Escreve um objeto JSON por linha para cada par (arquivo, problema)
+    
+    Os campos são ``file``, ``line``, ``type``, ``severity`` e
+    ``description``. A escrita passa pelo buffer de ``stream``, que é
+    esvaziado a cada troca de arquivo, de modo que quem acompanha a saída
+    (``tail -f``, coletores de log) recebe cada arquivo completo assim que
+    termina. Devolve o número de problemas escritos.
+    """
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    write = stream.write
+    total = 0
+    current = None
+    
+    for file_path, issue in issues:
+        if file_path != current:
+            if current is not None:
+                stream.flush()
+            current = file_path
+        write(encode({
+            'file': file_path,
+            'line': issue.line,
+            'type': issue.type,
+            'severity': issue.severity,
+            'description': issue.description,
+        }))
+        write('\n')
+        total += 1
+    
+    stream.flush()
+    return total
+
+
+def _mebibytes(size: float) -> str:
+    return f"{size / (1024 * 1024):.2f} MiB"
+
+
+def _artifact_uri(file_path: str) -> str:
+    """URI do arquivo para SARIF: relativo como caminho POSIX, absoluto como file://"""
+    path = Path(file_path)
+    if path.is_absolute():
+        return path.as_uri()
+    return quote(path.as_posix())
@@ -0,0 +1,92 @@
+"""
+Registro de Regras - O que cada regra visita na AST e de que outras regras depende
+
+Não importa o analisador: a linha de comando valida ``--select`` e
+``--ignore`` sem carregá-lo.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+
+# Donos de listas de declarações, visitados por 'code_after_return'
+BLOCK_OWNER_NAMES = (
+    'Module', 'FunctionDef', 'AsyncFunctionDef', 'ClassDef',
+    'If', 'For', 'AsyncFor', 'While', 'With', 'AsyncWith',
+    'Try', 'TryStar', 'ExceptHandler', 'match_case',
+)
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    Uma regra de código morto
+
+    ``name`` é o tipo dos problemas produzidos. ``visits`` lista os pares
+    (tipo de nó da AST, handler) de que a regra precisa na travessia única;
+    o handler é ``parser.<método>`` ou ``analyzer.<método>`` e o mesmo par
+    pedido por várias regras é registrado uma só vez. ``detector`` é o
+    método do analisador que produz os problemas depois da travessia.
+    ``requires`` lista regras cujos dados esta usa: elas rodam mesmo
+    desligadas, mas seus problemas não são reportados.
+    """
+    name: str
+    title: str
+    visits: Tuple[Tuple[str, str], ...]
+    detector: str
+    requires: Tuple[str, ...] = ()
+
+
+REGISTRY: Dict[str, Rule] = {rule.name: rule for rule in (
+    Rule('unused_function', 'Função não utilizada',
+         visits=(('Module', 'parser._analyze_module'),
+                 ('FunctionDef', 'parser._analyze_function_def')),
+         detector='_detect_unused_functions'),
+    Rule('unused_variable', 'Variável não utilizada',
+         visits=(('Module', 'parser._analyze_module'),),
+         detector='_detect_unused_variables'),
+    Rule('unused_import', 'Import não utilizado',
+         visits=(('Import', 'parser._analyze_import'),
+                 ('ImportFrom', 'parser._analyze_import_from')),
+         detector='_detect_unused_imports'),
+    Rule('always_false_condition', 'Condição sempre falsa',
+         visits=(('If', 'analyzer._visit_if'),),
+         detector='_detect_always_false_conditions'),
+    Rule('code_after_return', 'Código após return',
+         visits=tuple((owner, 'analyzer._visit_block_owner') for owner in BLOCK_OWNER_NAMES),
+         detector='_detect_code_after_return'),
+    # As regiões já reportadas pelas duas regras anteriores não se repetem
+    Rule('unreachable_code', 'Código inalcançável',
+         visits=(('Module', 'analyzer._visit_module'),),
+         detector='_detect_unreachable_code',
+         requires=('always_false_condition', 'code_after_return')),
+)}
+
+
+def select_rules(select: Optional[Iterable[str]] = None,
+                 ignore: Optional[Iterable[str]] = None) -> Tuple[str, ...]:
+    """
+    Regras habilitadas, na ordem do registro
+
+    Sem ``select`` valem todas; ``ignore`` é aplicado depois. Nomes
+    desconhecidos levantam ``ValueError``.
+    """
+    selected = set(REGISTRY if select is None else select)
+    ignored = set(ignore or ())
+    unknown = sorted((selected | ignored) - REGISTRY.keys())
+    if unknown:
+        raise ValueError(f"regra(s) desconhecida(s): {', '.join(unknown)}; "
+                         f"disponíveis: {', '.join(REGISTRY)}")
+    return tuple(name for name in REGISTRY if name in selected and name not in ignored)
+
+
+def required_rules(rules: Iterable[str]) -> Tuple[str, ...]:
+    """As regras em ``rules`` mais as de que dependem, na ordem do registro"""
+    needed: Set[str] = set()
+    todo = list(rules)
+    while todo:
+        name = todo.pop()
+        if name not in needed:
+            needed.add(name)
+            todo.extend(REGISTRY[name].requires)
+    return tuple(name for name in REGISTRY if name in needed)
@@ -0,0 +1,373 @@
+"""
+Tabelas de Símbolos - Escopos aninhados com nomes internados em ids inteiros
+"""
+
+import ast
+from array import array
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+
+MODULE, CLASS, FUNCTION, LAMBDA, COMPREHENSION = range(5)
+SCOPE_KINDS = ('module', 'class', 'function', 'lambda', 'comprehension')
+
+OPEN_MODULE = 0
+OPEN_ENCLOSING_CLASS = -1
+CLOSED = -2
+
+COMPREHENSIONS = (ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
+MATCH_CAPTURES = tuple(getattr(ast, name) for name in ('MatchAs', 'MatchStar', 'MatchMapping')
+                       if hasattr(ast, name))
+
+
+class SymbolTable:
+    """Interna nomes: cada nome distinto recebe um id inteiro estável"""
+
+    __slots__ = ('names', '_ids')
+
+    def __init__(self):
+        self.names: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def intern(self, name: str) -> int:
+        symbol = self._ids.get(name)
+        if symbol is None:
+            symbol = self._ids[name] = len(self.names)
+            self.names.append(name)
+        return symbol
+
+    def __getitem__(self, symbol: int) -> str:
+        return self.names[symbol]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class Scope:
+    """
+    Um escopo léxico enquanto está sendo percorrido
+
+    Guarda, como conjuntos de ids, os nomes ligados, os nomes lidos no
+    próprio escopo ou vindos livres de escopos internos, as declarações
+    ``global``/``nonlocal`` e as variáveis rastreadas (id -> menor linha).
+    Os conjuntos são descartados quando o escopo é fechado, de modo que só
+    a cadeia de escopos abertos ocupa memória durante a travessia.
+
+    Um escopo ``stub`` representa o escopo que envolve uma unidade analisada
+    isoladamente; o que chega até ele é exportado para ser resolvido quando
+    as unidades forem combinadas.
+    """
+
+    __slots__ = ('kind', 'parent', 'line', 'stub', 'bound', 'loads',
+                 'globals', 'nonlocals', 'defs', 'nonlocal_defs')
+
+    def __init__(self, kind: int, parent: Optional["Scope"], line: int = 0, stub: bool = False):
+        self.kind = kind
+        self.parent = parent
+        self.line = line
+        self.stub = stub
+        self.bound: Set[int] = set()
+        self.loads: Set[int] = set()
+        self.globals: Optional[Set[int]] = None
+        self.nonlocals: Optional[Set[int]] = None
+        self.defs: Optional[Dict[int, int]] = None
+        self.nonlocal_defs: Optional[List[Tuple[int, int]]] = None
+
+    def define(self, symbol: int, line: int):
+        if self.defs is None:
+            self.defs = {}
+        if line < self.defs.get(symbol, line + 1):
+            self.defs[symbol] = line
+
+    def up(self) -> "Scope":
+        """Escopo onde continua a busca de um nome livre: o primeiro que não é classe"""
+        parent = self.parent
+        while parent.kind == CLASS:
+            parent = parent.parent
+        return parent
+
+
+class VariableTable:
+    """Variáveis não usadas, em colunas: chave do escopo, id do nome e linha"""
+
+    __slots__ = ('keys', 'names', 'lines')
+
+    def __init__(self):
+        self.keys = array('i')
+        self.names = array('i')
+        self.lines = array('i')
+
+    def append(self, key: int, name: int, line: int):
+        self.keys.append(key)
+        self.names.append(name)
+        self.lines.append(line)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int]]:
+        return zip(self.keys, self.names, self.lines)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class ScopeBuilder:
+    """
+    Constrói os escopos de uma árvore e resolve cada leitura de nome
+
+    Segue as regras do Python: ``global`` e ``nonlocal``, escopos de classe
+    invisíveis para as funções aninhadas, decorators, valores padrão e
+    anotações avaliados no escopo externo, e o primeiro iterável de uma
+    compreensão avaliado fora dela. Como no ``symtable`` do CPython, cada
+    escopo é resolvido ao ser fechado: o que ele não liga sobe como nome
+    livre para o escopo de fora.
+
+    São rastreadas as variáveis atribuídas com ``=`` a um nome e os
+    parâmetros de ``def`` (exceto o primeiro parâmetro de métodos, que é
+    ligado implicitamente). Cada variável não usada recebe uma chave:
+    ``OPEN_MODULE`` no módulo, a linha da classe em classes de nível de
+    módulo e ``CLOSED`` nos demais escopos.
+    """
+
+    def __init__(self, symbols: SymbolTable, name_loads: Optional[Counter] = None):
+        self.symbols = symbols
+        self.unused = VariableTable()
+        self.escapes: Dict[int, Set[int]] = {}
+        self.bindings: Dict[int, Set[int]] = {}
+        self.name_loads: Counter = Counter() if name_loads is None else name_loads
+        self.scope_count = 0
+
+    def build(self, tree: ast.AST, enclosing: Tuple[int, ...] = ()):
+        """Percorre ``tree``; com ``enclosing``, cria escopos stub com esses tipos"""
+        stubs = []
+        parent = None
+        for kind in enclosing:
+            parent = self._new_scope(kind, parent, stub=True)
+            stubs.append(parent)
+
+        if isinstance(tree, ast.Module):
+            root = self._new_scope(MODULE, parent)
+            self._walk(tree.body, root)
+            self._close(root)
+        else:
+            self._walk([tree], parent)
+        for stub in reversed(stubs):
+            self._close(stub)
+
+    def _new_scope(self, kind: int, parent: Optional[Scope], line: int = 0,
+                   stub: bool = False) -> Scope:
+        self.scope_count += 1
+        return Scope(kind, parent, line, stub)
+
+    def _walk(self, nodes: List[ast.AST], scope: Scope):
+        intern = self.symbols.intern
+        name_loads = self.name_loads
+        stack = [(node, scope) for node in reversed(nodes)]
+        pop = stack.pop
+        push = stack.append
+        iter_child_nodes = ast.iter_child_nodes
+        Name, Load = ast.Name, ast.Load
+
+        while stack:
+            node, scope = pop()
+            if node is None:
+                self._close(scope)
+                continue
+            node_class = node.__class__
+
+            if node_class is Name:
+                if node.ctx.__class__ is Load:
+                    scope.loads.add(intern(node.id))
+                    name_loads[node.id] += 1
+                else:
+                    self._bind(scope, intern(node.id))
+                continue
+
+            if node_class is ast.FunctionDef or node_class is ast.AsyncFunctionDef:
+                self._bind(scope, intern(node.name))
+                inner = self._new_scope(FUNCTION, scope)
+                push((None, inner))
+                for child in reversed(node.body):
+                    push((child, inner))
+                self._visit_arguments(node.args, scope, inner, push)
+                if node_class is ast.FunctionDef:
+                    self._track_parameters(node, scope, inner)
+                for child in node.decorator_list:
+                    push((child, scope))
+                if node.returns is not None:
+                    push((node.returns, scope))
+                continue
+
+            if node_class is ast.Lambda:
+                inner = self._new_scope(LAMBDA, scope)
+                push((None, inner))
+                push((node.body, inner))
+                self._visit_arguments(node.args, scope, inner, push)
+                continue
+
+            if node_class is ast.ClassDef:
+                self._bind(scope, intern(node.name))
+                inner = self._new_scope(CLASS, scope, node.lineno)
+                push((None, inner))
+                for child in reversed(node.body):
+                    push((child, inner))
+                for child in node.bases + [keyword.value for keyword in node.keywords] + node.decorator_list:
+                    push((child, scope))
+                continue
+
+            if node_class in COMPREHENSIONS:
+                inner = self._new_scope(COMPREHENSION, scope)
+                push((None, inner))
+                generators = node.generators
+                if node_class is ast.DictComp:
+                    push((node.value, inner))
+                    push((node.key, inner))
+                else:
+                    push((node.elt, inner))
+                for index, generator in enumerate(generators):
+                    for condition in generator.ifs:
+                        push((condition, inner))
+                    if index:
+                        push((generator.iter, inner))
+                    push((generator.target, inner))
+                push((generators[0].iter, scope))
+                continue
+
+            if node_class is ast.Assign:
+                for target in node.targets:
+                    if target.__class__ is Name:
+                        self._define(scope, intern(target.id), node.lineno)
+            elif node_class is ast.Global:
+                if scope.globals is None:
+                    scope.globals = set()
+                scope.globals.update(intern(name) for name in node.names)
+                continue
+            elif node_class is ast.Nonlocal:
+                if scope.nonlocals is None:
+                    scope.nonlocals = set()
+                scope.nonlocals.update(intern(name) for name in node.names)
+                continue
+            elif node_class is ast.Import or node_class is ast.ImportFrom:
+                for alias in node.names:
+                    if alias.name != '*':
+                        self._bind(scope, intern(alias.asname or alias.name.split('.', 1)[0]))
+                continue
+            elif node_class is ast.ExceptHandler and node.name:
+                self._bind(scope, intern(node.name))
+            elif node_class is ast.NamedExpr:
+                target = scope
+                while target.kind == COMPREHENSION:
+                    target = target.parent
+                self._bind(target, intern(node.target.id))
+                push((node.value, scope))
+                continue
+            elif node_class in MATCH_CAPTURES:
+                for field in ('name', 'rest'):
+                    name = getattr(node, field, None)
+                    if name:
+                        self._bind(scope, intern(name))
+
+            children = list(iter_child_nodes(node))
+            for child in reversed(children):
+                push((child, scope))
+
+    def _visit_arguments(self, args: ast.arguments, outer: Scope, inner: Scope, push):
+        intern = self.symbols.intern
+        for default in args.defaults + [d for d in args.kw_defaults if d is not None]:
+            push((default, outer))
+        for arg in self._all_arguments(args):
+            inner.bound.add(intern(arg.arg))
+            if arg.annotation is not None:
+                push((arg.annotation, outer))
+
+    def _track_parameters(self, node: ast.FunctionDef, outer: Scope, inner: Scope):
+        parameters = node.args.args
+        if outer.kind == CLASS and parameters and not self._is_static(node):
+            parameters = parameters[1:]
+        for arg in parameters:
+            inner.define(self.symbols.intern(arg.arg), node.lineno)
+
+    def _is_static(self, node: ast.FunctionDef) -> bool:
+        return any(isinstance(decorator, ast.Name) and decorator.id == 'staticmethod'
+                   for decorator in node.decorator_list)
+
+    def _all_arguments(self, args: ast.arguments) -> List[ast.arg]:
+        arguments = list(getattr(args, 'posonlyargs', [])) + args.args + args.kwonlyargs
+        if args.vararg is not None:
+            arguments.append(args.vararg)
+        if args.kwarg is not None:
+            arguments.append(args.kwarg)
+        return arguments
+
+    def _bind(self, scope: Scope, symbol: int):
+        """Liga o nome no escopo, exceto quando declarado global ou nonlocal"""
+        if scope.globals is not None and symbol in scope.globals:
+            return
+        if scope.nonlocals is not None and symbol in scope.nonlocals:
+            return
+        scope.bound.add(symbol)
+
+    def _define(self, scope: Scope, symbol: int, line: int):
+        """Registra uma variável rastreada no escopo que recebe a atribuição"""
+        if scope.globals is not None and symbol in scope.globals:
+            self._root(scope).define(symbol, line)
+        elif scope.nonlocals is not None and symbol in scope.nonlocals:
+            if scope.nonlocal_defs is None:
+                scope.nonlocal_defs = []
+            scope.nonlocal_defs.append((symbol, line))
+        else:
+            scope.define(symbol, line)
+
+    def _root(self, scope: Scope) -> Scope:
+        while scope.parent is not None:
+            scope = scope.parent
+        return scope
+
+    def _close(self, scope: Scope):
+        """Resolve as leituras que chegaram ao escopo e descarta seus conjuntos"""
+        if scope.parent is None:
+            self.escapes.setdefault(OPEN_MODULE, set()).update(scope.loads)
+            self._collect_unused(scope, scope.loads, OPEN_MODULE)
+            return
+        if scope.stub:
+            self.escapes.setdefault(OPEN_ENCLOSING_CLASS, set()).update(scope.loads)
+            self.bindings.setdefault(OPEN_ENCLOSING_CLASS, set()).update(scope.bound)
+            return
+
+        up = scope.up()
+        bound = scope.bound
+        declared_global = scope.globals or ()
+        declared_nonlocal = scope.nonlocals or ()
+        used = set()
+
+        for symbol in scope.loads:
+            if symbol in declared_global:
+                self._root(scope).loads.add(symbol)
+            elif symbol in declared_nonlocal or symbol not in bound:
+                up.loads.add(symbol)
+            else:
+                used.add(symbol)
+
+        key = CLOSED
+        if scope.kind == CLASS and scope.parent.kind == MODULE and not scope.parent.stub:
+            key = scope.line
+            self.bindings.setdefault(key, set()).update(bound)
+        self._collect_unused(scope, used, key)
+
+    def _collect_unused(self, scope: Scope, used: Set[int], key: int):
+        if scope.nonlocal_defs:
+            pending = []
+            for symbol, line in scope.nonlocal_defs:
+                if scope.kind != CLASS and symbol in scope.bound:
+                    scope.define(symbol, line)
+                else:
+                    pending.append((symbol, line))
+            if pending and scope.parent is not None:
+                up = scope.up()
+                if up.nonlocal_defs is None:
+                    up.nonlocal_defs = []
+                up.nonlocal_defs.extend(pending)
+
+        if scope.defs:
+            for symbol, line in scope.defs.items():
+                if symbol not in used:
+                    self.unused.append(key, symbol, line)
+        scope.bound = scope.loads = scope.defs = scope.nonlocal_defs = None
@@ -0,0 +1,131 @@
+"""
+Carregamento de Código - Bytes do arquivo, codificação (PEP 263) e índice de linhas
+"""
+
+import mmap
+import os
+import tokenize
+from array import array
+from typing import List, Optional, Union
+
+# A partir deste tamanho o arquivo é mapeado em memória em vez de lido
+MMAP_THRESHOLD = 1024 * 1024
+
+Text = Union[str, bytes]
+
+
+class LineIndex:
+    """
+    Deslocamento do início de cada linha, em um ``array('Q')``
+
+    Substitui ``texto.split('\\n')``: as linhas e trechos são fatiados do
+    texto original (``str``, ``bytes`` ou ``mmap``) só quando pedidos, e
+    o índice ocupa 8 bytes por linha. Há sempre ``texto.count('\\n') + 1``
+    linhas, como no ``split``.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        newline = '\n' if isinstance(text, str) else b'\n'
+        offsets = array('Q', [0])
+        find = text.find
+        append = offsets.append
+        position = find(newline)
+        while position != -1:
+            append(position + 1)
+            position = find(newline, position + 1)
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def line(self, number: int) -> Text:
+        """Linha ``number`` (a partir de 1), sem a quebra de linha"""
+        return self.segment(number - 1, number)
+
+    def segment(self, first: int, last: int) -> Text:
+        """
+        Linhas ``first`` até ``last`` (exclusivo, a partir de 0) unidas por quebras
+
+        Equivale a ``'\\n'.join(texto.split('\\n')[first:last])``.
+        """
+        offsets = self.offsets
+        count = len(offsets)
+        last = min(last, count)
+        if first >= last:
+            return self.text[0:0]
+        end = offsets[last] - 1 if last < count else len(self.text)
+        return self.text[offsets[first]:end]
+
+
+class SourceFile:
+    """
+    Conteúdo de um arquivo Python em bytes, sem decodificar
+
+    ``data`` é um ``bytes`` ou, para arquivos grandes, um ``mmap`` somente
+    leitura; ambos podem ir direto para ``ast.parse``, que trata BOM e a
+    declaração de codificação. ``encoding`` é detectada como em
+    ``tokenize.detect_encoding``, só quando pedida. Use como gerenciador
+    de contexto para liberar o mapeamento.
+    """
+
+    def __init__(self, data, path: str = ""):
+        self.data = data
+        self.path = path
+        self._encoding: Optional[str] = None
+        self._lines: Optional[LineIndex] = None
+
+    @property
+    def encoding(self) -> str:
+        if self._encoding is None:
+            self._encoding = detect_encoding(self.data)
+        return self._encoding
+
+    @property
+    def lines(self) -> LineIndex:
+        if self._lines is None:
+            self._lines = LineIndex(self.data)
+        return self._lines
+
+    def text(self) -> str:
+        """O código decodificado, para quem precisa de ``str``"""
+        return str(self.data[:], self.encoding)
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def __enter__(self) -> "SourceFile":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_source(path: str, mmap_threshold: int = MMAP_THRESHOLD) -> SourceFile:
+    """Lê ``path`` como bytes, mapeando em memória os arquivos a partir de ``mmap_threshold``"""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= mmap_threshold and size > 0:
+            return SourceFile(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), path)
+        return SourceFile(f.read(), path)
+
+
+def detect_encoding(data) -> str:
+    """
+    Codificação de um código Python em bytes, como ``tokenize.detect_encoding``
+
+    Só as duas primeiras linhas são examinadas; um BOM ou uma declaração
+    inválida levanta ``SyntaxError``.
+    """
+    lines: List[bytes] = []
+    start = 0
+    for _ in range(2):
+        end = data.find(b'\n', start)
+        if end == -1:
+            lines.append(data[start:])
+            break
+        lines.append(data[start:end + 1])
+        start = end + 1
+    encoding, _ = tokenize.detect_encoding(iter(lines).__next__)
+    return encoding
@@ -0,0 +1,335 @@
+"""
+Modo Observação - Reanalisa continuamente os arquivos alterados
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .analyzer import DeadCodeIssue
+from .main import analyze_files_with_symbols, apply_project_references, collect_python_files
+
+
+DEFAULT_INTERVAL = 0.5
+SETTLE_TIME = 0.05
+
+
+class PollingBackend:
+    """
+    Detecta mudanças comparando mtime e tamanho dos arquivos
+
+    Os diretórios só são relistados quando o próprio mtime muda (arquivo
+    criado, removido ou renomeado); nos demais ciclos basta um ``stat`` por
+    arquivo já conhecido.
+    """
+
+    def __init__(self, roots: List[str], files: Iterable[str]):
+        self.roots = [root for root in roots if os.path.isdir(root)]
+        self.files: Dict[str, Tuple[int, int]] = {}
+        self.dirs: Dict[str, int] = {}
+
+        for path in files:
+            self.files[path] = _signature(path)
+        for root in self.roots:
+            for directory, _, _ in os.walk(root):
+                self.dirs[os.path.normpath(directory)] = _mtime(directory)
+
+    def wait(self, timeout: float) -> Set[str]:
+        time.sleep(timeout)
+        return self.poll()
+
+    def poll(self) -> Set[str]:
+        changed = set()
+
+        for directory, mtime in list(self.dirs.items()):
+            current = _mtime(directory)
+            if current == mtime:
+                continue
+            if current is None:
+                del self.dirs[directory]
+                continue
+            self.dirs[directory] = current
+            changed.update(self._rescan(directory))
+
+        for path, signature in list(self.files.items()):
+            current = _signature(path)
+            if current != signature:
+                changed.add(path)
+                if current is None:
+                    del self.files[path]
+                else:
+                    self.files[path] = current
+
+        return changed
+
+    def _rescan(self, directory: str) -> Set[str]:
+        added = set()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return added
+
+        for entry in entries:
+            path = os.path.normpath(entry.path)
+            if entry.is_dir():
+                if path not in self.dirs:
+                    for subdirectory, _, files in os.walk(path):
+                        self.dirs[os.path.normpath(subdirectory)] = _mtime(subdirectory)
+                        for name in files:
+                            added.add(os.path.normpath(os.path.join(subdirectory, name)))
+            elif path not in self.files and path.endswith('.py'):
+                added.add(path)
+
+        for path in added:
+            if path.endswith('.py'):
+                self.files[path] = _signature(path)
+        return added
+
+    def close(self):
+        pass
+
+
+class InotifyBackend:
+    """
+    Detecta mudanças com inotify do Linux, acessado via ctypes
+
+    Cada diretório observado recebe um watch; arquivos citados diretamente
+    na linha de comando são observados pelo diretório que os contém.
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_ISDIR = 0x40000000
+    MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT = struct.Struct('iIII')
+
+    _libc = None
+
+    @classmethod
+    def available(cls) -> bool:
+        if not sys.platform.startswith('linux'):
+            return False
+        if cls._libc is None:
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library('c') or None, use_errno=True)
+                libc.inotify_init1
+                libc.inotify_add_watch
+            except (OSError, AttributeError):
+                return False
+            cls._libc = libc
+        return True
+
+    def __init__(self, roots: List[str], files: Iterable[str]):
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 falhou")
+        self.watches: Dict[int, str] = {}
+
+        for root in roots:
+            if os.path.isdir(root):
+                for directory, _, _ in os.walk(root):
+                    self._add_watch(directory)
+        for path in files:
+            self._add_watch(os.path.dirname(path) or '.')
+
+    def _add_watch(self, directory: str):
+        directory = os.path.normpath(directory)
+        if directory in self.watches.values():
+            return
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), self.MASK)
+        if wd >= 0:
+            self.watches[wd] = directory
+
+    def wait(self, timeout: float) -> Set[str]:
+        changed: Set[str] = set()
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        while ready:
+            changed.update(self._read_events())
+            ready, _, _ = select.select([self.fd], [], [], SETTLE_TIME)
+        return changed
+
+    def _read_events(self) -> Set[str]:
+        changed = set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset + self.EVENT.size <= len(data):
+            wd, mask, _, length = self.EVENT.unpack_from(data, offset)
+            offset += self.EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+
+            directory = self.watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.normpath(os.path.join(directory, name))
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    for subdirectory, _, files in os.walk(path):
+                        self._add_watch(subdirectory)
+                        changed.update(os.path.normpath(os.path.join(subdirectory, f)) for f in files)
+            else:
+                changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class Watcher:
+    """
+    Mantém os resultados em memória e reporta apenas o que mudou
+
+    Os arquivos alterados são reanalisados com as mesmas opções da análise
+    completa: regras (``rules``), cache e, com ``project``, os resumos de
+    símbolos, de modo que uma mudança em um arquivo também pode fazer
+    aparecer ou sumir 'unused_function' de outro. Os problemas são
+    comparados por tipo e descrição, de modo que um problema que só mudou
+    de linha não aparece como novo.
+    """
+
+    def __init__(self, paths: List[str], reporter, jobs: Optional[int] = None,
+                 interval: float = DEFAULT_INTERVAL, use_inotify: Optional[bool] = None,
+                 cache=None, project: bool = True, rules: Optional[Iterable[str]] = None):
+        self.paths = paths
+        self.reporter = reporter
+        self.jobs = jobs
+        self.interval = interval
+        self.use_inotify = InotifyBackend.available() if use_inotify is None else use_inotify
+        self.cache = cache
+        self.project = project
+        self.rules = rules
+        self.roots = [os.path.normpath(path) for path in paths if os.path.isdir(path)]
+        self.explicit = {os.path.normpath(path) for path in paths if os.path.isfile(path)}
+        self.results: Dict[str, List[DeadCodeIssue]] = {}
+        self.backend = None
+        # Problemas antes das referências entre arquivos, e os símbolos de cada arquivo
+        self._issues: Dict[str, List[DeadCodeIssue]] = {}
+        self._symbols: Dict = {}
+
+    def start(self) -> Dict[str, List[DeadCodeIssue]]:
+        files = [os.path.normpath(path) for path in collect_python_files(self.paths)]
+        self._analyze(files)
+        self.results = self._resolve()
+        backend_class = InotifyBackend if self.use_inotify else PollingBackend
+        self.backend = backend_class(self.roots, files)
+        return self.results
+
+    def step(self, timeout: Optional[float] = None) -> Dict[str, Tuple[List, List]]:
+        """Espera por mudanças e devolve (adicionados, resolvidos) por arquivo"""
+        changed = self.backend.wait(self.interval if timeout is None else timeout)
+        touched = [path for path in sorted(changed) if self._is_tracked(path)]
+        if not touched:
+            return {}
+
+        existing = [path for path in touched if os.path.isfile(path)]
+        for path in touched:
+            self._issues.pop(path, None)
+            self._symbols.pop(path, None)
+        self._analyze(existing)
+
+        previous = self.results
+        self.results = self._resolve()
+        # Com o índice do projeto, qualquer arquivo pode ter mudado de resultado
+        candidates = list(self.results) if self.project else existing
+        changes = {}
+        for path in dict.fromkeys(touched + candidates):
+            added, resolved = diff_issues(previous.get(path, []), self.results.get(path, []))
+            if added or resolved:
+                changes[path] = (added, resolved)
+
+        return changes
+
+    def _analyze(self, files: List[str]):
+        if not files:
+            return
+        issues, symbols = analyze_files_with_symbols(files, jobs=self.jobs, cache=self.cache,
+                                                     project=self.project, rules=self.rules)
+        self._issues.update(issues)
+        self._symbols.update(symbols)
+        # Como na análise completa, o cache volta ao limite após cada rodada
+        if self.cache is not None:
+            self.cache.prune()
+
+    def _resolve(self) -> Dict[str, List[DeadCodeIssue]]:
+        results = dict(self._issues)
+        if self.project:
+            apply_project_references(results, self._symbols)
+        return results
+
+    def _is_tracked(self, path: str) -> bool:
+        if path in self.explicit:
+            return True
+        if not path.endswith('.py'):
+            return False
+        return any(path == root or path.startswith(root + os.sep) or root == '.'
+                   for root in self.roots)
+
+    def run(self):
+        results = self.start()
+        for file_path, issues in results.items():
+            self.reporter.print_file_analysis(file_path, issues)
+
+        backend_name = "inotify" if self.use_inotify else "polling"
+        print(f"👀 Observando {len(results)} arquivo(s) ({backend_name}). Ctrl+C para sair.")
+        try:
+            while True:
+                for file_path, (added, resolved) in self.step().items():
+                    self.reporter.print_changes(file_path, added, resolved)
+        except KeyboardInterrupt:
+            print("\n👋 Observação encerrada")
+        finally:
+            self.backend.close()
+
+
+def diff_issues(previous: List[DeadCodeIssue],
+                current: List[DeadCodeIssue]) -> Tuple[List[DeadCodeIssue], List[DeadCodeIssue]]:
+    """Compara duas listas de problemas ignorando deslocamentos de linha"""
+    def key(issue):
+        return issue.type, issue.description
+
+    remaining = Counter(key(issue) for issue in previous)
+    added = []
+    for issue in current:
+        if remaining[key(issue)] > 0:
+            remaining[key(issue)] -= 1
+        else:
+            added.append(issue)
+
+    remaining = Counter(key(issue) for issue in current)
+    resolved = []
+    for issue in previous:
+        if remaining[key(issue)] > 0:
+            remaining[key(issue)] -= 1
+        else:
+            resolved.append(issue)
+
+    return added, resolved
+
+
+def _signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
@@ -49,6 +49,47 @@ teste_variaveis()
         issue_types = [i.type for i in issues]
         self.assertTrue(len(issue_types) > 0)
     
+    def test_only_reads_count_as_variable_use(self):
+        code = """
+def teste_atribuicoes():
+    x = 1
+    x = 2
+    y = 3
+    y += 1
+    z = 4
+    return z
+
+teste_atribuicoes()
+"""
+        issues = self.analyzer.analyze(code)
+
+        unused = sorted(i.description for i in issues if i.type == 'unused_variable')
+        self.assertEqual(len(unused), 2)
+        self.assertIn("'x'", unused[0])
+        self.assertIn("'y'", unused[1])
+    
+    def test_unused_names_are_reported_in_line_order(self):
+        code = """
+def f():
+    pass
+
+def g():
+    a = 1
+    def h():
+        b = 2
+    h()
+    c = 3
+
+def f():
+    pass
+"""
+        issues = self.analyzer.analyze(code)
+
+        for issue_type in ('unused_function', 'unused_variable'):
+            lines = [i.line for i in issues if i.type == issue_type]
+            self.assertEqual(lines, sorted(lines))
+        self.assertEqual([i.line for i in issues if i.type == 'unused_variable'], [6, 8, 10])
+    
     def test_code_after_return_detection(self):
         code = """
 def teste_return():
@@ -60,6 +101,28 @@ def teste_return():
         code_after_return_issues = [i for i in issues if i.type == 'code_after_return']
         self.assertGreaterEqual(len(code_after_return_issues), 1)
     
+    def test_code_after_return_stays_in_block(self):
+        code = """
+def primeira():
+    return 1
+
+def segunda():
+    for i in range(3):
+        if i:
+            break
+            print("morto")
+            i += 1
+    raise ValueError()
+    segunda()
+
+primeira()
+segunda()
+"""
+        issues = self.analyzer.analyze(code)
+
+        after_return = [(i.line, i.end_line) for i in issues if i.type == 'code_after_return']
+        self.assertEqual(after_return, [(9, 10), (12, 12)])
+
     def test_always_false_condition_detection(self):
         code = """
 def teste_condicao():
@@ -163,6 +226,32 @@ resultado = funcao_com_problemas()
         
         total_expected = sum(summary[k] for k in summary if k != 'total')
         self.assertEqual(summary['total'], total_expected)
+    
+    def test_analyze_iter_yields_same_issues(self):
+        code = """
+import os
+
+def funcao_nao_utilizada():
+    x = 10
+    return "nunca chamada"
+    print("Código após return")
+
+while True:
+    break
+    print("inalcançável")
+"""
+        expected = DeadCodeAnalyzer().analyze(code)
+        
+        streamed = self.analyzer.analyze_iter(code)
+        
+        self.assertFalse(isinstance(streamed, list))
+        self.assertEqual(list(streamed), expected)
+        self.assertEqual(self.analyzer.issues, [])
+    
+    def test_analyze_iter_reports_syntax_error(self):
+        issues = list(self.analyzer.analyze_iter("def quebrada(:\n"))
+        
+        self.assertEqual([issue.type for issue in issues], ['parse_error'])
 
 
 class TestDeadCodeIssue(unittest.TestCase):
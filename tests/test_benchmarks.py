@@ -0,0 +1,64 @@
+"""
+Testes unitários para o gerador de corpus e o executor de benchmarks
+"""
+
+import unittest
+import sys
+import os
+import ast
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from benchmarks.corpus import CorpusSpec, generate
+from benchmarks.runner import compare, run
+from deadcode_detector.analyzer import DeadCodeAnalyzer
+
+
+class TestCorpus(unittest.TestCase):
+
+    def test_generation_is_deterministic(self):
+        spec = CorpusSpec(lines=500, seed=7)
+
+        self.assertEqual(generate(spec), generate(CorpusSpec(lines=500, seed=7)))
+        self.assertNotEqual(generate(spec), generate(CorpusSpec(lines=500, seed=8)))
+
+    def test_size_and_shape_follow_the_spec(self):
+        spec = CorpusSpec(lines=2000, functions=10, depth=4, returns=3, ladder=6)
+
+        source = generate(spec)
+        tree = ast.parse(source)
+
+        functions = [node for node in tree.body if isinstance(node, ast.FunctionDef)]
+        self.assertEqual(len(functions), 10)
+        self.assertAlmostEqual(source.count('\n'), 2000, delta=200)
+        self.assertTrue(all(sum(isinstance(node, ast.Return) for node in ast.walk(function)) == 3
+                            for function in functions))
+
+    def test_corpus_contains_dead_code(self):
+        issues = DeadCodeAnalyzer().analyze(generate(CorpusSpec(lines=300, functions=4)))
+
+        types = {issue.type for issue in issues}
+        self.assertTrue({'unused_function', 'unused_variable', 'code_after_return',
+                         'always_false_condition'} <= types)
+
+
+class TestRunner(unittest.TestCase):
+
+    def test_run_measures_every_stage(self):
+        data = run(sizes=[100], repeat=1, only=['parser', 'reporter'])
+
+        self.assertEqual(sorted(data['results']), ['parser/100', 'reporter/100'])
+        self.assertTrue(all(seconds > 0 for seconds in data['results'].values()))
+
+    def test_compare_flags_regressions_above_threshold(self):
+        baseline = {'results': {'analyzer/1000': 1.0, 'lexer/1000': 1.0, 'parser/1000': 1.0}}
+        current = {'results': {'analyzer/1000': 1.2, 'lexer/1000': 1.3}}
+
+        rows = compare(baseline, current, threshold=0.25)
+
+        self.assertEqual(rows, [('analyzer/1000', 1.0, 1.2, False), ('lexer/1000', 1.0, 1.3, True)])
+
+
+if __name__ == '__main__':
+    unittest.main()
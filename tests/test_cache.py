@@ -0,0 +1,64 @@
+"""
+Testes unitários para o ResultCache
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadcode_detector.analyzer import DeadCodeIssue
+from deadcode_detector.cache import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache = ResultCache(self.tmp.name)
+
+    def test_round_trip_counts_hits_and_misses(self):
+        key = self.cache.key(b"x = 1\n")
+        issues = [DeadCodeIssue(type="unused_variable", line=1, description="x", end_line=1)]
+
+        self.assertIsNone(self.cache.get(key))
+        self.cache.put(key, issues)
+
+        self.assertEqual(self.cache.get(key), issues)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_contains_tells_entries_with_symbols_apart(self):
+        key = self.cache.key(b"def f(): pass\n")
+        self.cache.put(key, [])
+
+        self.assertTrue(self.cache.contains(key))
+        self.assertFalse(self.cache.contains(key, need_symbols=True))
+        self.cache.put(key, [], {'functions': []})
+        self.assertTrue(self.cache.contains(key, need_symbols=True))
+        self.assertEqual(self.cache.get_entry(key, need_symbols=True), ([], {'functions': []}))
+
+    def test_key_depends_on_enabled_rules(self):
+        other = ResultCache(self.tmp.name, rules=['unused_import'])
+
+        self.assertNotEqual(self.cache.key(b"x = 1\n"), other.key(b"x = 1\n"))
+
+    def test_prune_evicts_least_recently_used(self):
+        old_key = self.cache.key(b"old")
+        new_key = self.cache.key(b"new")
+        self.cache.put(old_key, [])
+        self.cache.put(new_key, [])
+        old_path = self.cache._entry_path(old_key)
+        os.utime(old_path, (0, 0))
+
+        self.cache.max_bytes = os.path.getsize(old_path)
+        self.cache.prune()
+
+        self.assertIsNone(self.cache.get(old_key))
+        self.assertEqual(self.cache.get(new_key), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
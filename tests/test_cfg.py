@@ -0,0 +1,124 @@
+"""
+Testes unitários para o grafo de fluxo de controle
+"""
+
+import ast
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadcode_detector.cfg import CFGBuilder
+from deadcode_detector.analyzer import DeadCodeAnalyzer
+
+
+class TestControlFlowGraph(unittest.TestCase):
+
+    def build(self, code):
+        return CFGBuilder().build(ast.parse(code))
+
+    def test_one_graph_per_function_and_module(self):
+        graphs = self.build("""
+def externa():
+    def interna():
+        pass
+    return interna
+
+class Classe:
+    def metodo(self):
+        pass
+""")
+        self.assertEqual([g.name for g in graphs], ['<module>', 'externa', 'interna', 'metodo'])
+
+    def test_code_after_exhaustive_if_is_unreachable(self):
+        graphs = self.build("""
+def f(x):
+    if x:
+        return 1
+    else:
+        return 2
+    print("morto")
+""")
+        self.assertEqual(graphs[1].unreachable_regions(), [(7, 7)])
+
+    def test_loop_with_break_reaches_following_code(self):
+        graphs = self.build("""
+def f(x):
+    while True:
+        if x:
+            break
+    return x
+""")
+        self.assertEqual(graphs[1].unreachable_regions(), [])
+
+    def test_with_may_swallow_exceptions(self):
+        graphs = self.build("""
+import contextlib
+def f():
+    with contextlib.suppress(ValueError):
+        raise ValueError
+    return 1
+
+def g(lock):
+    with lock:
+        return 1
+    print("morto")
+""")
+        self.assertEqual(graphs[1].unreachable_regions(), [])
+        self.assertEqual(graphs[2].unreachable_regions(), [(11, 11)])
+
+    def test_deep_elif_ladder(self):
+        code = "if x == 0:\n    pass\n" + "".join(
+            f"elif x == {i}:\n    pass\n" for i in range(1, 2000))
+        graphs = self.build(code)
+        self.assertEqual(graphs[0].unreachable_regions(), [])
+
+
+class TestUnreachableCode(unittest.TestCase):
+
+    def test_unreachable_code_issue(self):
+        code = """
+def f():
+    while True:
+        pass
+    print("nunca")
+
+f()
+"""
+        issues = DeadCodeAnalyzer().analyze(code)
+
+        unreachable = [(i.line, i.end_line) for i in issues if i.type == 'unreachable_code']
+        self.assertEqual(unreachable, [(5, 5)])
+
+    def test_code_after_suppressed_raise_is_reachable(self):
+        code = """
+import contextlib
+def f():
+    with contextlib.suppress(ValueError):
+        raise ValueError
+    return 1
+
+f()
+"""
+        issues = DeadCodeAnalyzer().analyze(code)
+
+        self.assertNotIn('unreachable_code', [i.type for i in issues])
+
+    def test_no_duplicate_for_code_after_return(self):
+        code = """
+def f():
+    return 1
+    print("morto")
+
+f()
+"""
+        issues = DeadCodeAnalyzer().analyze(code)
+
+        issue_types = [i.type for i in issues]
+        self.assertIn('code_after_return', issue_types)
+        self.assertNotIn('unreachable_code', issue_types)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Testes unitários para o modo de arquivos alterados (git diff)
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import subprocess
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadcode_detector.cache import ResultCache
+from deadcode_detector.changes import changed_files, files_mentioning
+from deadcode_detector.main import analyze_changed, analyze_files
+
+
+MODULE_A = """
+def usada_fora():
+    return 1
+
+def nunca():
+    return 2
+"""
+
+MODULE_B = """
+from pacote.a import usada_fora
+
+usada_fora()
+"""
+
+
+@unittest.skipIf(shutil.which('git') is None, "git não disponível")
+class TestChangedFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = os.getcwd()
+        self.directory = tempfile.mkdtemp()
+        os.chdir(self.directory)
+        os.makedirs('pacote')
+        self.write('pacote/__init__.py', "")
+        self.write('pacote/a.py', MODULE_A)
+        self.write('pacote/b.py', MODULE_B)
+        self.write('pacote/c.py', "x = 1\n")
+        self.git('init', '-q')
+        self.git('add', '.')
+        self.git('-c', 'user.name=t', '-c', 'user.email=t@t', 'commit', '-qm', 'inicial')
+
+    def tearDown(self):
+        os.chdir(self.previous)
+        shutil.rmtree(self.directory)
+
+    def write(self, path, text):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def git(self, *args):
+        subprocess.run(['git'] + list(args), check=True, stdout=subprocess.DEVNULL)
+
+    def test_working_tree_and_staged(self):
+        self.write('pacote/a.py', MODULE_A + "\n# alterado\n")
+        self.write('pacote/c.py', "x = 2\n")
+        self.git('add', 'pacote/c.py')
+        self.write('notas.txt', "não é Python")
+        self.git('add', 'notas.txt')
+
+        self.assertEqual(changed_files(), [os.path.join('pacote', 'a.py')])
+        self.assertEqual(changed_files(staged=True), [os.path.join('pacote', 'c.py')])
+        self.assertEqual(sorted(changed_files('HEAD')),
+                         [os.path.join('pacote', 'a.py'), os.path.join('pacote', 'c.py')])
+        self.assertEqual(changed_files('HEAD', paths=['pacote/c.py']),
+                         [os.path.join('pacote', 'c.py')])
+
+    def test_removed_files_are_ignored(self):
+        os.remove('pacote/c.py')
+
+        self.assertEqual(changed_files(), [])
+
+    def test_files_mentioning(self):
+        self.assertEqual(files_mentioning(['usada_fora'], ['pacote']),
+                         [os.path.join('pacote', 'a.py'), os.path.join('pacote', 'b.py')])
+        self.assertEqual(files_mentioning(['inexistente'], ['pacote']), [])
+
+    def test_unchanged_references_come_from_cache(self):
+        files = [os.path.join('pacote', name) for name in ('__init__.py', 'a.py', 'b.py', 'c.py')]
+        cache = ResultCache('cache')
+        analyze_files(files, jobs=1, cache=cache, project=True)
+        self.write('pacote/a.py', MODULE_A + "\nvalor = nunca()\n\ndef outra():\n    pass\n")
+
+        cache = ResultCache('cache')
+        results = analyze_changed(changed_files(), ['pacote'], jobs=1, cache=cache)
+
+        self.assertEqual(list(results), [os.path.join('pacote', 'a.py')])
+        self.assertEqual([issue.description for issue in results[os.path.join('pacote', 'a.py')]
+                          if issue.type == "unused_function"],
+                         ["Função 'outra' definida mas nunca chamada"])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_outside_a_repository(self):
+        outside = tempfile.mkdtemp()
+        try:
+            with self.assertRaises(RuntimeError):
+                changed_files(cwd=outside)
+            self.assertIsNone(files_mentioning(['x'], cwd=outside))
+        finally:
+            shutil.rmtree(outside)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+"""
+Testes unitários para o avaliador de constantes e a poda de ramos mortos
+"""
+
+import ast
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadcode_detector.analyzer import DeadCodeAnalyzer, RULES
+from deadcode_detector.constants import UNKNOWN, ConstantEvaluator
+
+
+MODULE = """
+import typing as t
+from typing import TYPE_CHECKING
+
+DEBUG = False
+LEVEL = 2 * 3
+NAME: str = "a" + "b"
+FLAGS = (DEBUG, LEVEL)
+REBOUND = False
+REBOUND = True
+SHADOWED = False
+
+def f(SHADOWED):
+    global OUTRO
+    OUTRO = 1
+
+OUTRO = False
+"""
+
+
+class TestConstantEvaluator(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = ast.parse(MODULE)
+        self.evaluator = ConstantEvaluator(self.tree)
+
+    def truth(self, expression: str):
+        return self.evaluator.truth(ast.parse(expression, mode='eval').body)
+
+    def test_module_constants(self):
+        self.assertEqual(self.evaluator.constants, {
+            'TYPE_CHECKING': False, 'DEBUG': False, 'LEVEL': 6, 'NAME': 'ab',
+            'FLAGS': (False, 6),
+        })
+        self.assertEqual(self.evaluator.typing_aliases, {'t'})
+
+    def test_folding(self):
+        cases = {
+            'False': False, '0': False, '""': False, 'None': False, '1': True,
+            'not True': False, 'not DEBUG': True, '-1 + 1': False, '2 ** 3 == 8': True,
+            'LEVEL > 10': False, 'NAME == "ab"': True, '1 < 2 < 2': False,
+            'FLAGS == (False, 6)': True, '"b" in NAME': True, 'DEBUG is None': False,
+            'TYPE_CHECKING': False, 't.TYPE_CHECKING': False,
+        }
+        for expression, expected in cases.items():
+            self.assertIs(self.truth(expression), expected, expression)
+
+    def test_bool_ops_with_unknown_operands(self):
+        self.assertIs(self.truth('DEBUG and x'), False)
+        self.assertIs(self.truth('x and False'), False)
+        self.assertIs(self.truth('x or True'), True)
+        self.assertIsNone(self.truth('x and True'))
+        self.assertIsNone(self.truth('x or DEBUG'))
+
+    def test_unknowns(self):
+        for expression in ('x', 'REBOUND', 'SHADOWED', 'OUTRO', 'x is None', '1 is 1',
+                           "'a' * 10 ** 9", '2 ** 100000', '1 / 0', '1 < "a"', 'f()', 'os.DEBUG'):
+            self.assertIsNone(self.truth(expression), expression)
+
+    def test_chained_powers_stay_bounded(self):
+        evaluator = ConstantEvaluator(ast.parse(
+            "A = 2 ** 128\nB = A ** 128\nC = B ** 128\nD = A * A\nE = 1 << 128\nF = E << 128\n"))
+
+        self.assertEqual(evaluator.constants, {'A': 2 ** 128, 'D': 2 ** 256, 'E': 2 ** 128, 'F': 2 ** 256})
+        self.assertIsNone(evaluator.truth(ast.parse("C > 0", mode='eval').body))
+
+    def test_values_are_memoized(self):
+        test = ast.parse("LEVEL * 2 > 3", mode='eval').body
+
+        self.assertEqual(self.evaluator.value(test), True)
+        self.assertIn(id(test.left), self.evaluator._values)
+        self.assertEqual(self.evaluator.value(test.left), 12)
+        self.assertIs(self.evaluator.value(ast.Name(id='x')), UNKNOWN)
+
+    def test_constants_are_collected_lazily(self):
+        evaluator = ConstantEvaluator(self.tree)
+        evaluator.truth(ast.parse("1 == 2", mode='eval').body)
+
+        self.assertIsNone(evaluator._constants)
+
+
+SOURCE = """
+from typing import TYPE_CHECKING
+
+DEBUG = False
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+def f(x):
+    if DEBUG and x:
+        return 1
+        print("depois")
+    if not True:
+        def nunca():
+            pass
+    if 0:
+        pass
+    return 0
+
+f(1)
+"""
+
+
+class TestDeadBranches(unittest.TestCase):
+
+    def test_folded_conditions_are_reported(self):
+        issues = DeadCodeAnalyzer().analyze(SOURCE)
+
+        self.assertEqual([(issue.line, issue.end_line) for issue in issues
+                          if issue.type == "always_false_condition"],
+                         [(6, 7), (10, 12), (13, 15), (16, 17)])
+
+    def test_dead_subtrees_are_not_reported_again(self):
+        issues = DeadCodeAnalyzer().analyze(SOURCE)
+
+        self.assertEqual([issue.type for issue in issues if issue.type != "always_false_condition"],
+                         ["unused_import"])
+        self.assertIn("TYPE_CHECKING", issues[0].description)
+
+    def test_each_rule_alone_matches_full_run(self):
+        full = DeadCodeAnalyzer().analyze(SOURCE)
+
+        for name in RULES:
+            self.assertEqual(DeadCodeAnalyzer(rules=[name]).analyze(SOURCE),
+                             [issue for issue in full if issue.type == name], name)
+
+    def test_star_import_may_rebind_constants(self):
+        source = (
+            "DEBUG = False\n"
+            "try:\n"
+            "    from local_settings import *\n"
+            "except ImportError:\n"
+            "    pass\n"
+            "if DEBUG:\n"
+            "    import pdb\n"
+        )
+        issues = DeadCodeAnalyzer().analyze(source)
+
+        self.assertEqual(ConstantEvaluator(ast.parse(source)).constants, {})
+        self.assertNotIn("always_false_condition", [issue.type for issue in issues])
+        self.assertTrue(any(issue.type == "unused_import" and "'pdb'" in issue.description
+                            for issue in issues))
+
+    def test_walrus_rebinds_constants(self):
+        source = (
+            "FLAG = False\n"
+            "if (FLAG := True):\n"
+            "    pass\n"
+            "while FLAG:\n"
+            "    print(1)\n"
+            "print([LIMITE := 2 for _ in ()])\n"
+            "LIMITE = 0\n"
+            "print(LIMITE)\n"
+        )
+        issues = DeadCodeAnalyzer().analyze(source)
+
+        self.assertEqual(ConstantEvaluator(ast.parse(source)).constants, {})
+        self.assertEqual(issues, [])
+
+    def test_incremental_state_depends_on_constants(self):
+        analyzer = DeadCodeAnalyzer()
+        analyzer.analyze_incremental(SOURCE)
+        analyzer.analyze_incremental(SOURCE, analyzer.state)
+        self.assertEqual(analyzer.state.reanalyzed, 0)
+
+        changed = SOURCE.replace("DEBUG = False", "DEBUG = True")
+        issues = analyzer.analyze_incremental(changed, analyzer.state)
+
+        self.assertEqual(issues, DeadCodeAnalyzer().analyze(changed))
+        self.assertEqual(analyzer.state.constants['DEBUG'], True)
+        self.assertIn("code_after_return", [issue.type for issue in issues])
+
+
+if __name__ == '__main__':
+    unittest.main()
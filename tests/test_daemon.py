@@ -0,0 +1,128 @@
+"""
+Testes unitários para o daemon JSON-RPC e seu cliente
+"""
+
+import io
+import json
+import socket
+import unittest
+import sys
+import os
+import tempfile
+import threading
+import time
+from contextlib import redirect_stderr
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadcode_detector.client import DaemonClient, analyze_paths
+from deadcode_detector.daemon import AnalysisService, METHOD_NOT_FOUND, serve_unix
+
+
+CODE = "import os\n\ndef f():\n    return 1\n"
+
+
+class TestAnalysisService(unittest.TestCase):
+
+    def setUp(self):
+        self.service = AnalysisService()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'modulo.py')
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(CODE)
+
+    def call(self, method, params=None):
+        line = json.dumps({'jsonrpc': '2.0', 'id': 1, 'method': method, 'params': params or {}})
+        return json.loads(self.service.handle_line(line))
+
+    def test_analyze_source(self):
+        response = self.call('analyze', {'source': CODE})
+
+        types = [issue['type'] for issue in response['result']['issues']]
+        self.assertEqual(types, ['unused_function', 'unused_import'])
+
+    def test_selected_rules(self):
+        self.service = AnalysisService(rules=['unused_import'])
+
+        response = self.call('analyze', {'source': CODE})
+
+        types = [issue['type'] for issue in response['result']['issues']]
+        self.assertEqual(types, ['unused_import'])
+
+    def test_unchanged_file_is_served_from_memory(self):
+        first = self.call('analyze', {'path': self.path})
+        second = self.call('analyze', {'path': self.path})
+
+        self.assertEqual(first['result'], second['result'])
+        self.assertEqual((self.service.hits, self.service.misses), (1, 1))
+
+    def test_unknown_method(self):
+        response = self.call('formatar')
+
+        self.assertEqual(response['error']['code'], METHOD_NOT_FOUND)
+
+    def test_notification_has_no_response(self):
+        line = json.dumps({'jsonrpc': '2.0', 'method': 'ping'})
+
+        self.assertIsNone(self.service.handle_line(line))
+
+
+class TestDaemonClient(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.socket_path = os.path.join(self.tmp.name, 'daemon.sock')
+        self.path = os.path.join(self.tmp.name, 'modulo.py')
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(CODE)
+
+    def test_falls_back_to_in_process_analysis(self):
+        results = analyze_paths([self.path], self.socket_path)
+
+        self.assertEqual(len(results[self.path]), 2)
+
+    def test_daemon_dying_mid_session_falls_back(self):
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(self.socket_path)
+        listener.listen(1)
+        self.addCleanup(listener.close)
+
+        def accept_and_die():
+            connection, _ = listener.accept()
+            connection.close()
+
+        server = threading.Thread(target=accept_and_die)
+        server.start()
+        with redirect_stderr(io.StringIO()) as errors:
+            results = analyze_paths([self.path], self.socket_path)
+        server.join(timeout=5)
+
+        self.assertEqual(len(results[self.path]), 2)
+        self.assertIn("Daemon indisponível", errors.getvalue())
+
+    def test_round_trip_through_unix_socket(self):
+        service = AnalysisService()
+        server = threading.Thread(target=serve_unix, args=(service, self.socket_path))
+        server.start()
+        for _ in range(100):
+            if os.path.exists(self.socket_path):
+                break
+            time.sleep(0.01)
+
+        results = analyze_paths([self.path], self.socket_path)
+
+        client = DaemonClient(self.socket_path)
+        client.connect()
+        client.call('shutdown')
+        client.close()
+        server.join(timeout=5)
+
+        self.assertEqual(len(results[self.path]), 2)
+        self.assertEqual(service.misses, 1)
+        self.assertFalse(server.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
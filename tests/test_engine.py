@@ -0,0 +1,81 @@
+"""
+Testes unitários para o TraversalEngine
+"""
+
+import ast
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadcode_detector.engine import TraversalEngine
+
+
+class TestTraversalEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = ast.parse("""
+def f(a):
+    if a:
+        return a
+    return f(a - 1)
+
+x = f(3)
+""")
+
+    def test_visits_in_ast_walk_order(self):
+        visited = []
+        engine = TraversalEngine()
+        engine.register(ast.AST, visited.append)
+        engine.run(self.tree)
+
+        self.assertEqual(visited, list(ast.walk(self.tree)))
+
+    def test_dispatch_to_every_registered_handler(self):
+        returns = []
+        statements = []
+        engine = TraversalEngine()
+        engine.register(ast.Return, returns.append)
+        engine.register(ast.stmt, statements.append)
+        engine.run(self.tree)
+
+        self.assertEqual(len(returns), 2)
+        self.assertTrue(all(isinstance(node, ast.stmt) for node in statements))
+        self.assertEqual(len(statements), 5)
+
+    def test_statement_handlers_skip_expressions(self):
+        visited = []
+        engine = TraversalEngine()
+        engine.register(ast.stmt, visited.append)
+        engine.register(ast.Module, visited.append)
+        engine.run(self.tree)
+
+        expected = [node for node in ast.walk(self.tree) if isinstance(node, (ast.stmt, ast.Module))]
+        self.assertTrue(engine._statements_only)
+        self.assertEqual(visited, expected)
+
+    def test_expression_handler_disables_skipping(self):
+        engine = TraversalEngine()
+        engine.register(ast.stmt, lambda node: None)
+        engine.register(ast.Call, lambda node: None)
+
+        self.assertFalse(engine._statements_only)
+
+    def test_pruned_subtrees_are_not_visited(self):
+        visited = []
+        engine = TraversalEngine()
+        engine.register(ast.If, lambda node: engine.prune(node.body))
+        engine.register(ast.AST, visited.append)
+        engine.run(self.tree)
+
+        returned = self.tree.body[0].body[0].body[0]
+        self.assertFalse(any(node is returned or node is returned.value for node in visited))
+        self.assertEqual(len(visited), len(list(ast.walk(self.tree))) - len(list(ast.walk(returned))))
+
+        visited.clear()
+        engine.run(self.tree.body[1])
+        self.assertEqual(len(visited), len(list(ast.walk(self.tree.body[1]))))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Testes unitários para a análise incremental
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadcode_detector.analyzer import DeadCodeAnalyzer
+
+
+ORIGINAL = """
+import os
+
+def auxiliar():
+    return 1
+
+class Servico:
+    def executar(self):
+        if False:
+            print("morto")
+        return auxiliar()
+
+    def parar(self):
+        return None
+        print("morto")
+
+Servico().executar()
+"""
+
+
+class TestIncrementalAnalysis(unittest.TestCase):
+
+    def setUp(self):
+        self.analyzer = DeadCodeAnalyzer()
+        self.analyzer.analyze_incremental(ORIGINAL)
+        self.state = self.analyzer.state
+
+    def assert_same_as_full(self, source_code, issues):
+        self.assertEqual(issues, DeadCodeAnalyzer().analyze(source_code))
+
+    def test_initial_analysis_matches_full_analysis(self):
+        self.assert_same_as_full(ORIGINAL, self.analyzer.issues)
+        self.assertEqual(self.state.reanalyzed, 4)
+
+    def test_only_changed_method_is_reanalyzed(self):
+        edited = ORIGINAL.replace('return None', 'valor = 1\n        return None')
+        issues = self.analyzer.analyze_incremental(edited, self.state)
+
+        self.assert_same_as_full(edited, issues)
+        self.assertEqual(self.analyzer.state.reanalyzed, 2)
+
+    def test_unchanged_units_are_rebased_after_shift(self):
+        edited = "\n\n\n" + ORIGINAL
+        issues = self.analyzer.analyze_incremental(edited, self.state)
+
+        self.assert_same_as_full(edited, issues)
+        self.assertEqual(self.analyzer.state.reanalyzed, 1)
+
+    def test_usage_counts_follow_removed_calls(self):
+        edited = ORIGINAL.replace('return auxiliar()', 'return 2')
+        issues = self.analyzer.analyze_incremental(edited, self.state)
+
+        self.assert_same_as_full(edited, issues)
+        unused = [i.description for i in issues if i.type == 'unused_function']
+        self.assertTrue(any('auxiliar' in description for description in unused))
+
+    def test_syntax_error_keeps_previous_state(self):
+        issues = self.analyzer.analyze_incremental("def quebrado(:\n", self.state)
+
+        self.assertEqual([i.type for i in issues], ['parse_error'])
+        self.assertIs(self.analyzer.state, self.state)
+
+
+if __name__ == '__main__':
+    unittest.main()
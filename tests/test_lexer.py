@@ -0,0 +1,85 @@
+"""
+Testes unitários para o analisador léxico em fluxo
+"""
+
+import unittest
+import sys
+import os
+import io
+import types
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadcode_detector.lexer import Lexer, TokenType
+
+
+SOURCE = '''def f(x):  # comentário
+    """Docstring"""
+
+    return x + 1.5
+'''
+
+
+class TestLexer(unittest.TestCase):
+
+    def test_token_stream(self):
+        tokens = Lexer().tokenize(SOURCE)
+
+        self.assertEqual([(token.type, token.value) for token in tokens[:8]], [
+            (TokenType.KEYWORD, 'def'),
+            (TokenType.IDENTIFIER, 'f'),
+            (TokenType.DELIMITER, '('),
+            (TokenType.IDENTIFIER, 'x'),
+            (TokenType.DELIMITER, ')'),
+            (TokenType.DELIMITER, ':'),
+            (TokenType.COMMENT, '# comentário'),
+            (TokenType.NEWLINE, '\n'),
+        ])
+        kinds = [token.type for token in tokens]
+        self.assertIn(TokenType.NL, kinds)
+        self.assertEqual(kinds.count(TokenType.INDENT), kinds.count(TokenType.DEDENT))
+        docstring = tokens[kinds.index(TokenType.STRING)]
+        self.assertEqual((docstring.value, docstring.line, docstring.column), ('"""Docstring"""', 2, 4))
+        self.assertEqual([token.value for token in tokens if token.type == TokenType.OPERATOR], ['+'])
+        self.assertEqual([token.value for token in tokens if token.type == TokenType.LITERAL], ['1.5'])
+
+    def test_tokens_are_lazy(self):
+        tokens = Lexer().iter_tokens(SOURCE)
+
+        self.assertIsInstance(tokens, types.GeneratorType)
+        self.assertEqual(next(tokens).value, 'def')
+
+    def test_bytes_use_declared_encoding(self):
+        source = "# coding: latin-1\nnome = 'ação'\n"
+        lexer = Lexer()
+
+        tokens = lexer.tokenize(source.encode('latin-1'))
+
+        self.assertEqual(tokens, lexer.tokenize(source))
+        self.assertEqual(lexer.get_identifiers(), ['nome'])
+
+    def test_multiline_string_spans_lines(self):
+        tokens = Lexer().tokenize('x = """a\nb\nc"""\n')
+
+        string = next(token for token in tokens if token.type == TokenType.STRING)
+        self.assertEqual((string.line, string.end_line), (1, 3))
+
+    def test_unterminated_statement(self):
+        lexer = Lexer()
+        with redirect_stdout(io.StringIO()) as output:
+            tokens = lexer.tokenize("x = (1,\n")
+
+        self.assertIn("Erro de sintaxe", output.getvalue())
+        self.assertEqual([token.value for token in tokens[:3]], ['x', '=', '('])
+
+    def test_keywords(self):
+        lexer = Lexer()
+        lexer.tokenize("if a and not b:\n    pass\n")
+
+        self.assertEqual(lexer.get_keywords(), ['if', 'and', 'not', 'pass'])
+        self.assertEqual(lexer.get_identifiers(), ['a', 'b'])
+
+
+if __name__ == '__main__':
+    unittest.main()
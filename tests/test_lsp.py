@@ -0,0 +1,169 @@
+"""
+Testes unitários para o servidor LSP
+"""
+
+import io
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadcode_detector.analyzer import DeadCodeAnalyzer, DeadCodeIssue
+from deadcode_detector.lsp import Document, LanguageServer, read_message, serve, to_diagnostic, write_message
+
+
+URI = 'file:///tmp/modulo.py'
+CODE = "def f():\n    return 1\n    x = 2\n\nf()\n"
+
+
+class TestLanguageServer(unittest.TestCase):
+
+    def setUp(self):
+        self.messages = []
+        self.server = LanguageServer(self.messages.append, debounce=10)
+        self.server.handle({'jsonrpc': '2.0', 'id': 0, 'method': 'initialize', 'params': {}})
+
+    def open(self, text=CODE):
+        self.server.handle({'jsonrpc': '2.0', 'method': 'textDocument/didOpen', 'params': {
+            'textDocument': {'uri': URI, 'languageId': 'python', 'version': 1, 'text': text}}})
+
+    def change(self, version, text):
+        self.server.handle({'jsonrpc': '2.0', 'method': 'textDocument/didChange', 'params': {
+            'textDocument': {'uri': URI, 'version': version},
+            'contentChanges': [{'text': text}]}})
+
+    def flush(self):
+        return self.server.process_due(now=float('inf'))
+
+    def published(self):
+        return [m['params'] for m in self.messages if m['method'] == 'textDocument/publishDiagnostics']
+
+    def test_publishes_diagnostics_with_ranges(self):
+        self.open()
+        self.flush()
+
+        [params] = self.published()
+        diagnostics = {d['code']: d for d in params['diagnostics']}
+        diagnostic = diagnostics['code_after_return']
+        self.assertEqual(params['version'], 1)
+        self.assertEqual(diagnostic['range'], {'start': {'line': 2, 'character': 4},
+                                               'end': {'line': 2, 'character': 9}})
+
+    def test_selected_rules(self):
+        self.server = LanguageServer(self.messages.append, debounce=10, rules=['code_after_return'])
+        self.server.handle({'jsonrpc': '2.0', 'id': 0, 'method': 'initialize', 'params': {}})
+        self.open()
+        self.flush()
+
+        [params] = self.published()
+        self.assertEqual({d['code'] for d in params['diagnostics']}, {'code_after_return'})
+
+    def test_nothing_runs_before_debounce(self):
+        self.open()
+
+        self.assertEqual(self.server.process_due(), 0)
+        self.assertEqual(self.published(), [])
+
+    def test_superseded_edits_are_never_analyzed(self):
+        self.open()
+        self.change(2, CODE + "y = 3\n")
+        self.change(3, CODE)
+
+        self.flush()
+
+        self.assertEqual(self.server.analyses, 1)
+        self.assertEqual([p['version'] for p in self.published()], [3])
+
+    def test_stale_result_is_dropped(self):
+        self.open()
+        uri, version, text, state = self.server._take_due(float('inf'))[0]
+        self.change(2, "def g():\n    pass\n")
+
+        self.server._analyze(uri, version, text, state)
+
+        self.assertEqual(self.published(), [])
+
+    def test_reverted_text_reuses_cached_result(self):
+        self.open()
+        self.flush()
+        self.change(2, "import os\n")
+        self.flush()
+        self.change(3, CODE)
+        self.flush()
+
+        self.assertEqual(self.server.analyses, 2)
+        self.assertEqual(len(self.published()), 3)
+
+    def test_close_clears_diagnostics(self):
+        self.open()
+        self.server.handle({'jsonrpc': '2.0', 'method': 'textDocument/didClose',
+                            'params': {'textDocument': {'uri': URI}}})
+
+        self.assertEqual(self.flush(), 0)
+        self.assertEqual(self.published(), [{'uri': URI, 'diagnostics': []}])
+
+
+class TestDocument(unittest.TestCase):
+
+    def test_incremental_change_uses_utf16_columns(self):
+        document = Document(URI, "s = '😀a'\nx = 1\n", 1)
+
+        document.apply_change({'range': {'start': {'line': 0, 'character': 7},
+                                         'end': {'line': 0, 'character': 8}}, 'text': 'b'})
+        document.apply_change({'range': {'start': {'line': 1, 'character': 4},
+                                         'end': {'line': 1, 'character': 5}}, 'text': '2'})
+
+        self.assertEqual(document.text, "s = '😀b'\nx = 2\n")
+
+    def test_diagnostic_spans_end_line(self):
+        issue = DeadCodeIssue(type="always_false", line=1, end_line=2, description="if False")
+
+        diagnostic = to_diagnostic(issue, "if False:\n    x = '😀'\r\n".split('\n'))
+
+        self.assertEqual(diagnostic['range']['start'], {'line': 0, 'character': 0})
+        self.assertEqual(diagnostic['range']['end'], {'line': 1, 'character': 12})
+
+    def test_parse_error_is_not_unnecessary_and_has_its_line(self):
+        text = "x = 1\ny = (\n"
+        issues = DeadCodeAnalyzer().analyze(text)
+
+        diagnostic = to_diagnostic(issues[0], text.split('\n'))
+
+        self.assertEqual(diagnostic['code'], "parse_error")
+        self.assertEqual(diagnostic['range']['start']['line'], 1)
+        self.assertNotIn('tags', diagnostic)
+
+    def test_unused_import_uses_its_position(self):
+        text = "x = 'é'; import os\n"
+        issues = DeadCodeAnalyzer(rules=["unused_import"]).analyze(text)
+
+        diagnostic = to_diagnostic(issues[0], text.split('\n'))
+
+        self.assertEqual((issues[0].line, issues[0].column), (1, 10))
+        self.assertEqual(diagnostic['range']['start'], {'line': 0, 'character': 9})
+        self.assertEqual(diagnostic['tags'], [1])
+
+
+class TestServe(unittest.TestCase):
+
+    def test_session_over_stdio(self):
+        stdin = io.BytesIO()
+        for message in ({'jsonrpc': '2.0', 'id': 1, 'method': 'initialize', 'params': {}},
+                        {'jsonrpc': '2.0', 'id': 2, 'method': 'shutdown'},
+                        {'jsonrpc': '2.0', 'method': 'exit'}):
+            write_message(stdin, message)
+        stdin.seek(0)
+        stdout = io.BytesIO()
+
+        code = serve(stdin, stdout, debounce=0)
+
+        stdout.seek(0)
+        responses = [read_message(stdout), read_message(stdout)]
+        self.assertEqual(code, 0)
+        self.assertIn('capabilities', responses[0]['result'])
+        self.assertEqual(responses[1], {'jsonrpc': '2.0', 'id': 2, 'result': None})
+
+
+if __name__ == '__main__':
+    unittest.main()
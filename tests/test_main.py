@@ -0,0 +1,184 @@
+"""
+Testes unitários para a análise de vários arquivos
+"""
+
+import unittest
+import sys
+import os
+import json
+import subprocess
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadcode_detector.cache import ResultCache
+from deadcode_detector import main as main_module
+from deadcode_detector.main import collect_python_files, analyze_files, iter_directory, iter_files
+from deadcode_detector.reporter import Reporter, write_ndjson
+
+
+class TestAnalyzeFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        os.makedirs(os.path.join(self.tmp.name, 'pacote'))
+        self.files = []
+        for name in ('b.py', 'a.py', os.path.join('pacote', 'c.py')):
+            path = os.path.join(self.tmp.name, name)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("import os\n\ndef nunca():\n    return 1\n")
+            self.files.append(path)
+
+    def test_collect_expands_directories_in_stable_order(self):
+        files = collect_python_files([self.files[0], self.tmp.name])
+
+        self.assertEqual(files, [
+            self.files[0],
+            self.files[1],
+            self.files[2],
+        ])
+
+    def test_parallel_results_follow_input_order(self):
+        files = collect_python_files([self.tmp.name])
+
+        sequential = analyze_files(files, jobs=1)
+        parallel = analyze_files(files, jobs=2)
+
+        self.assertEqual(list(parallel), files)
+        self.assertEqual(parallel, sequential)
+    
+    def test_iter_files_streams_the_same_issues(self):
+        files = collect_python_files([self.tmp.name])
+        cache = ResultCache(os.path.join(self.tmp.name, 'cache'))
+        expected = [(file_path, issue) for file_path, issues in analyze_files(files, jobs=1).items()
+                    for issue in issues]
+        
+        self.assertEqual(list(iter_files(files, jobs=2, cache=cache)), expected)
+        cache.hits = 0
+        self.assertEqual(list(iter_files(files, jobs=2, cache=cache)), expected)
+        self.assertEqual(cache.hits, len(files))
+    
+    def test_entries_without_symbols_go_to_the_pool(self):
+        files = collect_python_files([self.tmp.name])
+        cache = ResultCache(os.path.join(self.tmp.name, 'cache'))
+        analyze_files(files, jobs=2, cache=cache)
+        
+        with mock.patch.object(main_module._WorkerPool, 'run', side_effect=AssertionError):
+            results = analyze_files(files, jobs=2, cache=cache, project=True)
+        
+        self.assertEqual(results, analyze_files(files, jobs=1, project=True))
+        cache.hits = 0
+        analyze_files(files, jobs=2, cache=cache, project=True)
+        self.assertEqual(cache.hits, len(files))
+    
+    def test_iter_directory_applies_project_references(self):
+        open(os.path.join(self.tmp.name, 'pacote', '__init__.py'), 'w').close()
+        with open(os.path.join(self.tmp.name, 'usa.py'), 'w', encoding='utf-8') as f:
+            f.write("from pacote.c import nunca\nnunca()\n")
+        files = collect_python_files([self.tmp.name])
+        
+        streamed = list(iter_directory(self.tmp.name, jobs=1))
+        results = analyze_files(files, jobs=1, project=True)
+        
+        expected = [(file_path, issue) for file_path, issues in results.items() for issue in issues]
+        self.assertCountEqual(streamed, expected)
+        self.assertNotIn(self.files[2], [file_path for file_path, issue in streamed
+                                         if issue.type == 'unused_function'])
+    
+    def test_reporter_prints_stream_line_by_line(self):
+        output = StringIO()
+        with redirect_stdout(output):
+            total = Reporter(use_colors=False).print_stream(iter_files(self.files, jobs=1))
+        
+        lines = output.getvalue().splitlines()
+        self.assertEqual(total, 6)
+        self.assertEqual(lines[0], f"{self.files[0]}:3: [unused_function] "
+                                   "Função 'nunca' definida mas nunca chamada")
+        self.assertEqual(lines[-1], "📊 Total: 6 problema(s) encontrado(s)")
+
+    
+    def test_ndjson_has_one_object_per_issue(self):
+        output = StringIO()
+        
+        total = write_ndjson(iter_files(self.files, jobs=1), output)
+        
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(total, len(records))
+        self.assertEqual(records[0], {
+            'file': self.files[0],
+            'line': 3,
+            'type': 'unused_function',
+            'severity': 'warning',
+            'description': "Função 'nunca' definida mas nunca chamada",
+        })
+    
+    def test_cli_ndjson_output_is_only_json(self):
+        src = os.path.join(os.path.dirname(__file__), '..', 'src')
+        env = dict(os.environ, PYTHONPATH=src)
+        
+        completed = subprocess.run(
+            [sys.executable, '-m', 'deadcode_detector', self.tmp.name,
+             '--format', 'ndjson', '--no-cache', '--jobs', '1'],
+            capture_output=True, text=True, encoding='utf-8', env=env,
+        )
+        
+        records = [json.loads(line) for line in completed.stdout.splitlines()]
+        self.assertEqual(completed.returncode, 1)
+        self.assertEqual({record['file'] for record in records}, set(self.files))
+
+    
+    def test_cli_stream_into_closed_pipe_exits_quietly(self):
+        src = os.path.join(os.path.dirname(__file__), '..', 'src')
+        env = dict(os.environ, PYTHONPATH=src)
+        path = os.path.join(self.tmp.name, 'grande.py')
+        with open(path, 'w', encoding='utf-8') as f:
+            # Bem mais que o buffer de um pipe
+            f.writelines(f"import modulo_{index}\n" for index in range(5000))
+        
+        process = subprocess.Popen(
+            [sys.executable, '-m', 'deadcode_detector', path,
+             '--format', 'ndjson', '--no-cache', '--jobs', '1'],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env,
+        )
+        json.loads(process.stdout.readline())
+        process.stdout.close()
+        stderr = process.stderr.read().decode('utf-8')
+        process.stderr.close()
+        
+        self.assertEqual(process.wait(), 141)
+        self.assertEqual(stderr, "")
+    
+    def test_sarif_report_lists_rules_and_results(self):
+        output = StringIO()
+        
+        total = Reporter(use_colors=False).write_sarif(iter_files(self.files, jobs=1), output)
+        
+        report = json.loads(output.getvalue())
+        run = report['runs'][0]
+        rules = [rule['id'] for rule in run['tool']['driver']['rules']]
+        self.assertEqual(report['version'], '2.1.0')
+        self.assertEqual(len(run['results']), total)
+        self.assertIn('unused_function', rules)
+        
+        first = run['results'][0]
+        self.assertEqual(first['ruleId'], 'unused_function')
+        self.assertEqual(rules[first['ruleIndex']], 'unused_function')
+        location = first['locations'][0]['physicalLocation']
+        self.assertEqual(location['region']['startLine'], 3)
+        self.assertTrue(location['artifactLocation']['uri'].startswith('file://'))
+    
+    def test_sarif_without_results_is_valid(self):
+        output = StringIO()
+        
+        total = Reporter(use_colors=False).write_sarif(iter([]), output)
+        
+        self.assertEqual(total, 0)
+        self.assertEqual(json.loads(output.getvalue())['runs'][0]['results'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
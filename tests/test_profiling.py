@@ -0,0 +1,185 @@
+"""
+Testes unitários para o perfil de execução por fase e por arquivo
+"""
+
+import unittest
+import sys
+import os
+import ast
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadcode_detector.analyzer import DeadCodeAnalyzer, estimate_memory
+from deadcode_detector.cache import ResultCache
+from deadcode_detector.engine import TraversalEngine
+from deadcode_detector.main import analyze_files
+from deadcode_detector.profiling import NULL_PROFILER, MemoryProfiler, Profiler
+
+
+SOURCE = """
+import os
+
+def nunca():
+    x = 1
+    return 1
+    print("morto")
+"""
+
+
+class TestProfiler(unittest.TestCase):
+
+    def test_phase_and_merge(self):
+        profiler = Profiler()
+        with profiler.phase('parse'):
+            pass
+        profiler.add('parse', 1.0)
+        profiler.add_file('a.py', 0.5)
+
+        other = Profiler.from_dict(profiler.to_dict())
+        other.merge(profiler)
+
+        self.assertEqual(other.calls['parse'], 4)
+        self.assertGreaterEqual(other.phases['parse'], 2.0)
+        self.assertEqual(other.slowest_files(), [('a.py', 1.0)])
+        self.assertEqual(other.top_phases(1)[0][0], 'parse')
+
+    def test_timed_iter_yields_everything(self):
+        profiler = Profiler()
+
+        items = list(profiler.timed_iter('detect/x', iter([1, 2, 3])))
+
+        self.assertEqual(items, [1, 2, 3])
+        self.assertEqual(profiler.calls['detect/x'], 1)
+
+    def test_null_profiler_passes_through(self):
+        function = len
+        iterable = [1]
+
+        self.assertIs(NULL_PROFILER.timed('x', function), function)
+        self.assertIs(NULL_PROFILER.timed_iter('x', iterable), iterable)
+        with NULL_PROFILER.phase('x'):
+            pass
+
+
+class TestProfiledAnalysis(unittest.TestCase):
+
+    def test_analyzer_records_phases_and_detectors(self):
+        profiler = Profiler()
+
+        issues = DeadCodeAnalyzer(profiler).analyze(SOURCE)
+
+        self.assertEqual(issues, DeadCodeAnalyzer().analyze(SOURCE))
+        for phase in ('parse', 'traversal', 'control_flow',
+                      'detect/unused_function', 'detect/unreachable_code'):
+            self.assertIn(phase, profiler.phases)
+        self.assertTrue(any(name.startswith('traversal/') for name in profiler.phases))
+
+    def test_engine_wraps_handlers_only_when_enabled(self):
+        def handler(node):
+            pass
+
+        plain = TraversalEngine()
+        plain.register(ast.Module, handler)
+        profiler = Profiler()
+        timed = TraversalEngine(profiler)
+        timed.register(ast.Module, handler)
+        timed.run(ast.parse("x = 1"))
+
+        self.assertIs(plain._handlers[ast.Module][0], handler)
+        self.assertEqual(profiler.calls[f"traversal/{handler.__qualname__}"], 1)
+
+    def test_analyze_files_collects_per_file_times(self):
+        with tempfile.TemporaryDirectory() as directory:
+            files = []
+            for name in ('a.py', 'b.py'):
+                path = os.path.join(directory, name)
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(SOURCE)
+                files.append(path)
+
+            for jobs in (1, 2):
+                profiler = Profiler()
+                results = analyze_files(files, jobs=jobs, profiler=profiler)
+
+                self.assertEqual(results, analyze_files(files, jobs=jobs))
+                self.assertCountEqual(profiler.files, files)
+                self.assertEqual(profiler.calls['parse'], 2)
+
+
+class TestMemoryProfiler(unittest.TestCase):
+
+    def tearDown(self):
+        tracemalloc.stop()
+
+    def test_nested_phases_keep_inner_peak(self):
+        profiler = MemoryProfiler()
+
+        with profiler.phase('externa'):
+            with profiler.phase('interna'):
+                buffer = bytearray(2 * 1024 * 1024)
+                del buffer
+
+        self.assertGreaterEqual(profiler.phases['interna'], 2 * 1024 * 1024)
+        self.assertGreaterEqual(profiler.phases['externa'], profiler.phases['interna'])
+        self.assertGreaterEqual(profiler.peak, profiler.phases['externa'])
+
+    def test_merge_keeps_largest_value(self):
+        profiler = MemoryProfiler()
+        profiler.add('parse', 10)
+        profiler.add_file('a.py', 5)
+        other = MemoryProfiler.from_dict({'phases': {'parse': 4}, 'calls': {'parse': 1},
+                                          'files': {'a.py': 7}, 'peak': 99})
+
+        profiler.merge(other)
+
+        self.assertEqual(profiler.phases['parse'], 10)
+        self.assertEqual(profiler.calls['parse'], 2)
+        self.assertEqual(profiler.files['a.py'], 7)
+        self.assertEqual(profiler.peak, 99)
+
+    def test_analyze_files_reports_memory_per_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'a.py')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(SOURCE)
+
+            profiler = MemoryProfiler()
+            analyze_files([path], jobs=1, profiler=profiler)
+
+        self.assertGreater(profiler.files[path], 0)
+        self.assertGreater(profiler.phases['parse'], 0)
+
+
+class TestMemoryBudget(unittest.TestCase):
+
+    def test_file_over_budget_is_reported_not_analyzed(self):
+        budget = estimate_memory(SOURCE) - 1
+        analyzer = DeadCodeAnalyzer(max_memory=budget)
+
+        issues = analyzer.analyze(SOURCE)
+
+        self.assertEqual([issue.type for issue in issues], ["memory_limit"])
+        self.assertEqual(list(analyzer.analyze_iter(SOURCE)), issues)
+        self.assertEqual(analyzer.analyze_incremental(SOURCE), issues)
+        self.assertEqual(DeadCodeAnalyzer(max_memory=budget + 1).analyze(SOURCE),
+                         DeadCodeAnalyzer().analyze(SOURCE))
+
+    def test_budget_results_are_not_cached(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'a.py')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(SOURCE)
+            cache = ResultCache(os.path.join(directory, 'cache'))
+
+            limited = analyze_files([path], jobs=1, cache=cache, max_memory=1)
+            full = analyze_files([path], jobs=1, cache=cache)
+
+        self.assertEqual([issue.type for issue in limited[path]], ["memory_limit"])
+        self.assertNotIn("memory_limit", [issue.type for issue in full[path]])
+        self.assertEqual(cache.hits, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Testes unitários para o índice de símbolos do projeto
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadcode_detector.cache import ResultCache
+from deadcode_detector.main import analyze_files, collect_python_files
+from deadcode_detector.project import ModuleSymbols, SymbolIndex
+
+
+FILES = {
+    os.path.join('pkg', '__init__.py'): "from .util import exportada\n",
+    os.path.join('pkg', 'util.py'): (
+        "def exportada():\n    return 1\n\n"
+        "def auxiliar():\n    return 2\n\n"
+        "def por_atributo():\n    return 3\n\n"
+        "def morta():\n    return 4\n"
+    ),
+    os.path.join('pkg', 'sub', '__init__.py'): "",
+    os.path.join('pkg', 'sub', 'uso.py'): (
+        "from ..util import auxiliar\n"
+        "from pkg import util as u\n"
+        "import pkg.util\n\n"
+        "auxiliar()\nu.por_atributo()\npkg.util.exportada()\n"
+    ),
+}
+
+
+class TestProjectAnalysis(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        for name, content in FILES.items():
+            path = os.path.join(self.tmp.name, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+        self.files = collect_python_files([self.tmp.name])
+        self.util = os.path.join(self.tmp.name, 'pkg', 'util.py')
+
+    def unused_functions(self, results):
+        return [issue.description for issue in results[self.util] if issue.type == 'unused_function']
+
+    def test_functions_used_by_other_files_are_not_reported(self):
+        results = analyze_files(self.files, jobs=1, project=True)
+
+        self.assertEqual(self.unused_functions(results),
+                         ["Função 'morta' definida mas nunca chamada"])
+
+    def test_per_file_mode_keeps_local_view(self):
+        results = analyze_files(self.files, jobs=1)
+
+        self.assertEqual(len(self.unused_functions(results)), 4)
+
+    def test_cached_symbols_give_same_result(self):
+        cache = ResultCache(os.path.join(self.tmp.name, 'cache'))
+
+        first = analyze_files(self.files, jobs=1, cache=cache, project=True)
+        second = analyze_files(self.files, jobs=1, cache=cache, project=True)
+
+        self.assertEqual(first, second)
+        self.assertEqual(cache.hits, len(self.files))
+
+
+class TestSymbolIndex(unittest.TestCase):
+
+    def test_reference_counts_and_star_imports(self):
+        index = SymbolIndex()
+        index.module_name = lambda path: (path, False)
+        index.add('a', ModuleSymbols(functions=[('f', 1), ('g', 4)]))
+        index.add('b', ModuleSymbols(references=[(0, 'a', 'f'), (0, 'a', 'f')]))
+
+        self.assertEqual(index.references('a.f'), 2)
+        self.assertFalse(index.is_referenced('a.g'))
+
+        index.add('c', ModuleSymbols(star_imports=[(0, 'a')]))
+        self.assertTrue(index.is_referenced('a.g'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Testes unitários para os registros compactos e o lote colunar de problemas
+"""
+
+import unittest
+import sys
+import os
+import pickle
+import tempfile
+from dataclasses import asdict, replace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadcode_detector.analyzer import DeadCodeIssue, IssueBatch
+from deadcode_detector.lexer import Token, TokenType
+from deadcode_detector.main import analyze_directory
+from deadcode_detector.parser import FunctionInfo, VariableInfo
+
+
+class TestSlottedRecords(unittest.TestCase):
+
+    def test_records_have_no_instance_dict(self):
+        records = [
+            DeadCodeIssue(type="unused_function", line=1, description="d"),
+            Token(type=TokenType.IDENTIFIER, value="x", line=1, column=0),
+            FunctionInfo(name="f", line=1),
+            VariableInfo(name="x", line=1),
+        ]
+
+        for record in records:
+            self.assertFalse(hasattr(record, '__dict__'), type(record).__name__)
+
+    def test_dataclass_behaviour_is_kept(self):
+        issue = DeadCodeIssue(type="unused_function", line=3, description="d")
+
+        self.assertEqual(issue.severity, "warning")
+        self.assertEqual(replace(issue, line=4).line, 4)
+        self.assertEqual(asdict(issue)['end_line'], 0)
+        self.assertEqual(pickle.loads(pickle.dumps(issue)), issue)
+        self.assertEqual(FunctionInfo(name="f", line=1).calls, [])
+        with self.assertRaises(AttributeError):
+            issue.extra = 1
+
+
+class TestIssueBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.issues = [
+            ("a.py", DeadCodeIssue(type="unused_variable", line=2, description="x")),
+            ("b.py", DeadCodeIssue(type="parse_error", line=0, description="erro", severity="error")),
+            ("a.py", DeadCodeIssue(type="unreachable_code", line=5, description="y", end_line=7)),
+            ("a.py", DeadCodeIssue(type="regra_nova", line=1, description="z", code="Z1")),
+        ]
+        self.batch = IssueBatch()
+        for file_path, issue in self.issues:
+            self.batch.append(file_path, issue)
+
+    def test_round_trip(self):
+        self.assertEqual(len(self.batch), 4)
+        self.assertEqual(list(self.batch), self.issues)
+        self.assertEqual(self.batch.files, ["a.py", "b.py"])
+
+    def test_grouping_and_counts(self):
+        self.batch.add_file("c.py")
+
+        results = self.batch.to_results()
+
+        self.assertEqual([issue.line for issue in results["a.py"]], [2, 5, 1])
+        self.assertEqual(results["c.py"], [])
+        self.assertEqual(self.batch.count_by_type()["unreachable_code"], 1)
+        self.assertEqual(self.batch.count_by_type()["regra_nova"], 1)
+
+    def test_analyze_directory_can_return_a_batch(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ('a.py', 'b.py'):
+                with open(os.path.join(directory, name), 'w', encoding='utf-8') as f:
+                    f.write("import os\n\ndef nunca():\n    x = 1\n    return 1\n")
+
+            batch = analyze_directory(directory, jobs=1, batch=True)
+            results = analyze_directory(directory, jobs=1)
+
+        self.assertIsInstance(batch, IssueBatch)
+        self.assertEqual(batch.to_results().keys(), results.keys())
+        for file_path, issues in results.items():
+            self.assertCountEqual(batch.to_results()[file_path], issues)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Testes unitários para o registro de regras e a seleção de detectores
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadcode_detector.analyzer import DeadCodeAnalyzer, RULES
+from deadcode_detector.cache import ResultCache
+from deadcode_detector.main import analyze_file, analyze_files
+from deadcode_detector.rules import REGISTRY, required_rules, select_rules
+
+
+SOURCE = """
+import os
+from sys import path
+
+def nunca():
+    x = 1
+    if False:
+        print("falso")
+    return 1
+    print("depois")
+
+def chamada():
+    while True:
+        pass
+    print("inalcançável")
+
+chamada()
+"""
+
+
+class TestRuleSelection(unittest.TestCase):
+
+    def test_select_and_ignore(self):
+        self.assertEqual(select_rules(), RULES)
+        self.assertEqual(select_rules(['unused_variable', 'unused_function']),
+                         ('unused_function', 'unused_variable'))
+        self.assertEqual(select_rules(ignore=['unreachable_code']), RULES[:-1])
+        self.assertEqual(select_rules(['unused_import'], ['unused_import']), ())
+
+    def test_unknown_rule_is_rejected(self):
+        with self.assertRaises(ValueError):
+            select_rules(['unused_imports'])
+        with self.assertRaises(ValueError):
+            select_rules(ignore=['nada'])
+
+    def test_required_rules_include_dependencies(self):
+        self.assertEqual(required_rules(['unreachable_code']),
+                         ('always_false_condition', 'code_after_return', 'unreachable_code'))
+        self.assertEqual(required_rules(['unused_import']), ('unused_import',))
+
+    def test_every_rule_has_a_detector(self):
+        analyzer = DeadCodeAnalyzer()
+        for rule in REGISTRY.values():
+            self.assertTrue(callable(getattr(analyzer, rule.detector)), rule.name)
+
+
+class TestSelectedAnalysis(unittest.TestCase):
+
+    def setUp(self):
+        self.full = DeadCodeAnalyzer().analyze(SOURCE)
+
+    def test_each_rule_alone_matches_full_run(self):
+        for name in RULES:
+            issues = DeadCodeAnalyzer(rules=[name]).analyze(SOURCE)
+
+            self.assertTrue(issues, name)
+            self.assertEqual(issues, [issue for issue in self.full if issue.type == name], name)
+
+    def test_disabled_rules_register_no_handlers(self):
+        analyzer = DeadCodeAnalyzer(rules=['unused_import'])
+        analyzer.analyze(SOURCE)
+
+        self.assertEqual(analyzer._handlers,
+                         {'parser._analyze_import', 'parser._analyze_import_from'})
+        self.assertEqual(analyzer.graphs, [])
+        self.assertIsNone(analyzer.parser.scope_builder)
+
+    def test_incremental_and_streaming_respect_selection(self):
+        rules = ['unused_variable', 'code_after_return']
+        expected = [issue for issue in self.full if issue.type in rules]
+        analyzer = DeadCodeAnalyzer(rules=rules)
+
+        self.assertEqual(list(analyzer.analyze_iter(SOURCE)), expected)
+        self.assertEqual(analyzer.analyze_incremental(SOURCE), expected)
+        self.assertEqual(analyzer.analyze_incremental(SOURCE, analyzer.state), expected)
+
+    def test_analyze_files_with_rules_and_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'a.py')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(SOURCE)
+            rules = ['unused_import']
+
+            cache = ResultCache(os.path.join(directory, 'cache'), rules=rules)
+            results = analyze_files([path], jobs=1, cache=cache, rules=rules)
+            single = analyze_file(path, rules=rules)
+            with self.assertRaises(ValueError):
+                analyze_files([path], jobs=1, cache=ResultCache(directory), rules=rules)
+
+        self.assertEqual({issue.type for issue in results[path]}, {'unused_import'})
+        self.assertEqual(single, results[path])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Testes unitários para as tabelas de símbolos por escopo
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadcode_detector.analyzer import DeadCodeAnalyzer
+from deadcode_detector.parser import Parser
+from deadcode_detector.scopes import SymbolTable
+
+
+SOURCE = """
+x = 1
+
+def usa_x():
+    return x
+
+def sombreia():
+    x = 2
+    return 0
+
+class Config:
+    LIMITE = 10
+
+    def verificar(self, valor=LIMITE):
+        return valor
+
+    @staticmethod
+    def fabrica(self):
+        return None
+
+def contador():
+    total = 0
+    def incrementar():
+        nonlocal total
+        total += 1
+        return total
+    return incrementar
+
+def global_tardio():
+    global registro
+    registro = 1
+
+def compreensao(itens):
+    y = [y for y in itens]
+    return len(itens)
+
+def com_lambda():
+    fator = 3
+    return lambda n: n * fator
+
+print(registro)
+"""
+
+
+def unused_variables(issues):
+    return sorted((issue.line, issue.description.split("'")[1])
+                  for issue in issues if issue.type == 'unused_variable')
+
+
+class TestScopes(unittest.TestCase):
+
+    def setUp(self):
+        self.expected = [(8, 'x'), (18, 'self'), (34, 'y')]
+
+    def test_unused_variables_are_resolved_per_scope(self):
+        parser = Parser()
+        parser.parse(SOURCE)
+
+        found = sorted((info.line, info.name) for info in parser.get_unused_variables())
+        self.assertEqual(found, self.expected)
+
+    def test_analyzer_reports_scoped_variables(self):
+        issues = DeadCodeAnalyzer().analyze(SOURCE)
+
+        self.assertEqual(unused_variables(issues), self.expected)
+
+    def test_incremental_matches_full_analysis(self):
+        analyzer = DeadCodeAnalyzer()
+        analyzer.analyze_incremental(SOURCE)
+        edited = SOURCE.replace("    return 0\n", "    return 1\n")
+        issues = analyzer.analyze_incremental(edited)
+
+        self.assertEqual(unused_variables(issues), self.expected)
+        self.assertEqual(issues, DeadCodeAnalyzer().analyze(edited))
+
+    def test_names_are_interned(self):
+        symbols = SymbolTable()
+
+        self.assertEqual(symbols.intern('a'), symbols.intern('a'))
+        self.assertNotEqual(symbols.intern('a'), symbols.intern('b'))
+        self.assertEqual(symbols[symbols.intern('b')], 'b')
+        self.assertEqual(len(symbols), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Testes unitários para o carregamento de código em bytes e o índice de linhas
+"""
+
+import unittest
+import sys
+import os
+import mmap
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadcode_detector.analyzer import DeadCodeAnalyzer
+from deadcode_detector.main import analyze_files
+from deadcode_detector.source import LineIndex, detect_encoding, load_source
+
+
+LATIN1_SOURCE = "# -*- coding: latin-1 -*-\nimport os\n\ndef ação():\n    texto = 'é'\n    return 1\n    print(texto)\n"
+
+
+class TestLineIndex(unittest.TestCase):
+
+    def test_matches_split(self):
+        for text in ("", "a", "a\n", "a\nbb\n\nccc", "\n\n"):
+            for data in (text, text.encode()):
+                newline = '\n' if isinstance(data, str) else b'\n'
+                lines = data.split(newline)
+                index = LineIndex(data)
+
+                self.assertEqual(len(index), len(lines))
+                for first in range(len(lines) + 1):
+                    for last in range(first, len(lines) + 2):
+                        self.assertEqual(index.segment(first, last),
+                                         newline.join(lines[first:last]), (data, first, last))
+                for number, line in enumerate(lines, 1):
+                    self.assertEqual(index.line(number), line)
+
+    def test_memory_mapped_source(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'a.py')
+            with open(path, 'wb') as f:
+                f.write("import os  # comentário\n    x = 1\n".encode())
+            with load_source(path, mmap_threshold=1) as source:
+                index = LineIndex(source.data)
+                self.assertEqual(index.line(1), b"import os  # coment\xc3\xa1rio")
+
+
+class TestLoadSource(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, data: bytes) -> str:
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_detect_encoding(self):
+        self.assertEqual(detect_encoding(b"x = 1\n"), 'utf-8')
+        self.assertEqual(detect_encoding(b"\xef\xbb\xbfx = 1\n"), 'utf-8-sig')
+        self.assertEqual(detect_encoding(b"#!/usr/bin/env python\n# coding: latin-1\n"), 'iso-8859-1')
+        with self.assertRaises(SyntaxError):
+            detect_encoding(b"# coding: nao-existe\n")
+
+    def test_large_files_are_memory_mapped(self):
+        path = self.write('grande.py', b"import os\nx = 1\n")
+
+        with load_source(path, mmap_threshold=1) as source:
+            self.assertIsInstance(source.data, mmap.mmap)
+            self.assertEqual(source.lines.line(2), b"x = 1")
+            issues = DeadCodeAnalyzer().analyze(source.data)
+        with load_source(path) as source:
+            self.assertIsInstance(source.data, bytes)
+            self.assertEqual(source.text(), "import os\nx = 1\n")
+
+        self.assertEqual(issues, DeadCodeAnalyzer().analyze("import os\nx = 1\n"))
+
+    def test_latin1_file_with_coding_cookie(self):
+        path = self.write('antigo.py', LATIN1_SOURCE.encode('latin-1'))
+
+        results = analyze_files([path], jobs=1)
+
+        self.assertEqual(results[path], DeadCodeAnalyzer().analyze(LATIN1_SOURCE))
+        self.assertIn("ação", results[path][0].description)
+
+    def test_invalid_cookie_is_a_parse_error(self):
+        path = self.write('ruim.py', b"# coding: nao-existe\nx = 1\n")
+
+        results = analyze_files([path], jobs=1)
+
+        self.assertEqual([issue.type for issue in results[path]], ["parse_error"])
+
+    def test_incremental_analysis_of_bytes(self):
+        data = LATIN1_SOURCE.encode('latin-1')
+        analyzer = DeadCodeAnalyzer()
+
+        first = analyzer.analyze_incremental(data)
+        again = analyzer.analyze_incremental(data, analyzer.state)
+
+        self.assertEqual(first, DeadCodeAnalyzer().analyze(LATIN1_SOURCE))
+        self.assertEqual(again, first)
+        self.assertEqual(analyzer.state.reanalyzed, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Testes de tempo de inicialização: imports preguiçosos do pacote e da CLI
+"""
+
+import unittest
+import sys
+import os
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+SRC = os.path.join(os.path.dirname(__file__), '..', 'src')
+
+PACKAGE_BUDGET_US = 50_000
+CLI_BUDGET_US = 100_000
+
+HEAVY_MODULES = ('colorama', 'ast', 'hashlib', 'deadcode_detector.analyzer',
+                 'deadcode_detector.reporter', 'deadcode_detector.cache')
+
+
+def run_python(*args):
+    env = dict(os.environ, PYTHONPATH=SRC)
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, env=env)
+
+
+def import_time(stderr: str) -> int:
+    """Soma o tempo acumulado (µs) dos imports de nível mais alto do pacote"""
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line.split('|')
+        if name.startswith(' deadcode_detector'):
+            total += int(cumulative)
+    return total
+
+
+class TestStartup(unittest.TestCase):
+
+    def loaded(self, code: str):
+        completed = run_python('-c', code + "\nimport sys\n"
+                               f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+        return completed.stdout.splitlines()[-1].split()
+
+    def test_package_import_loads_nothing_heavy(self):
+        self.assertEqual(self.loaded("import deadcode_detector"), [])
+
+    def test_public_names_are_still_available(self):
+        completed = run_python('-c', "import deadcode_detector as d; "
+                                     "print(d.DeadCodeAnalyzer.__name__, d.Reporter.__name__)")
+
+        self.assertEqual(completed.stdout.split(), ['DeadCodeAnalyzer', 'Reporter'])
+
+    def test_version_does_not_load_the_analyzer(self):
+        code = ("import sys\nsys.argv = ['deadcode-detector', '--version']\n"
+                "from deadcode_detector.cli import main\n"
+                "try:\n    main()\nexcept SystemExit:\n    pass")
+
+        self.assertEqual(self.loaded(code), [])
+
+    def test_import_time_budget(self):
+        package = run_python('-X', 'importtime', '-c', 'import deadcode_detector')
+        cli = run_python('-X', 'importtime', '-m', 'deadcode_detector', '--version')
+
+        self.assertEqual(cli.returncode, 0)
+        self.assertLess(import_time(package.stderr), PACKAGE_BUDGET_US)
+        self.assertLess(import_time(cli.stderr), CLI_BUDGET_US)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Testes unitários para o modo observação
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadcode_detector.analyzer import DeadCodeIssue
+from deadcode_detector.cache import ResultCache
+from deadcode_detector.watch import InotifyBackend, Watcher, diff_issues
+
+
+class TestDiffIssues(unittest.TestCase):
+
+    def test_line_shift_is_not_a_change(self):
+        before = [DeadCodeIssue(type="unused_function", line=3, description="f")]
+        after = [DeadCodeIssue(type="unused_function", line=5, description="f"),
+                 DeadCodeIssue(type="unused_import", line=0, description="os")]
+
+        added, resolved = diff_issues(before, after)
+
+        self.assertEqual([i.description for i in added], ["os"])
+        self.assertEqual(resolved, [])
+
+
+class TestWatcher(unittest.TestCase):
+
+    use_inotify = False
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'modulo.py')
+        self.write(self.path, "def f():\n    return 1\n")
+
+        self.watcher = Watcher([self.tmp.name], reporter=None, use_inotify=self.use_inotify)
+        self.watcher.start()
+        self.addCleanup(self.watcher.backend.close)
+
+    def write(self, path, content, mtime=None):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        if mtime is not None:
+            os.utime(path, ns=(mtime, mtime))
+
+    def test_reports_added_and_resolved_issues(self):
+        self.write(self.path, "def f():\n    return 1\n    x = 2\n\nf()\n", mtime=10 ** 18)
+
+        changes = self.watcher.step(timeout=0.2)
+
+        added, resolved = changes[os.path.normpath(self.path)]
+        self.assertIn('code_after_return', [i.type for i in added])
+        self.assertEqual([i.type for i in resolved], ['unused_function'])
+
+    def test_new_file_in_watched_directory(self):
+        novo = os.path.join(self.tmp.name, 'novo.py')
+        self.write(novo, "import os\n")
+        os.utime(self.tmp.name, ns=(10 ** 18, 10 ** 18))
+
+        changes = self.watcher.step(timeout=0.2)
+
+        self.assertIn(os.path.normpath(novo), changes)
+
+    def test_untouched_files_are_not_reported(self):
+        self.assertEqual(self.watcher.step(timeout=0), {})
+
+    def test_selected_rules_are_respected(self):
+        watcher = Watcher([self.tmp.name], reporter=None, use_inotify=self.use_inotify,
+                          rules=['unused_import'])
+        self.assertEqual(watcher.start(), {os.path.normpath(self.path): []})
+        self.addCleanup(watcher.backend.close)
+        self.write(self.path, "import os\ndef f():\n    return 1\n    x = 2\n", mtime=10 ** 18)
+
+        changes = watcher.step(timeout=0.2)
+
+        added, resolved = changes[os.path.normpath(self.path)]
+        self.assertEqual([i.type for i in added], ['unused_import'])
+        self.assertEqual(resolved, [])
+
+    def test_project_references_follow_other_files(self):
+        watcher = Watcher([self.tmp.name], reporter=None, use_inotify=self.use_inotify,
+                          project=True, rules=['unused_function'])
+        watcher.start()
+        self.addCleanup(watcher.backend.close)
+        usuario = os.path.join(self.tmp.name, 'usuario.py')
+        self.write(usuario, "from modulo import f\nf()\n")
+        os.utime(self.tmp.name, ns=(10 ** 18, 10 ** 18))
+
+        changes = watcher.step(timeout=0.2)
+
+        added, resolved = changes[os.path.normpath(self.path)]
+        self.assertEqual((added, [i.type for i in resolved]), ([], ['unused_function']))
+
+    def test_cache_is_pruned_after_each_analysis(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        cache = ResultCache(cache_dir.name, max_bytes=0)
+        watcher = Watcher([self.tmp.name], reporter=None, use_inotify=self.use_inotify, cache=cache)
+        watcher.start()
+        self.addCleanup(watcher.backend.close)
+        self.write(self.path, "import os\n", mtime=10 ** 18)
+
+        changes = watcher.step(timeout=0.2)
+
+        self.assertIn(os.path.normpath(self.path), changes)
+        self.assertEqual([files for _, _, files in os.walk(cache_dir.name) if files], [])
+
+
+@unittest.skipUnless(InotifyBackend.available(), "inotify indisponível")
+class TestInotifyWatcher(TestWatcher):
+
+    use_inotify = True
+
+
+if __name__ == '__main__':
+    unittest.main()